@@ -0,0 +1,105 @@
+# logic/adaptive_sampling.py
+"""
+Muestreo adaptativo de curvas para las gráficas.
+Parte de una malla uniforme gruesa y agrega puntos solo en los tramos
+donde la curva se aleja de una recta (curvatura), cambia de signo o
+entra/sale del dominio, hasta agotar un presupuesto de puntos.
+"""
+
+import numpy as np
+
+from .grid_evaluation import evaluate_masked, evaluate_on_grid
+
+
+def adaptive_sample(
+    f,
+    x_min: float,
+    x_max: float,
+    initial_points: int = 513,
+    max_points: int = 6000,
+    tolerance: float = 1e-3,
+    max_rounds: int = 24,
+):
+    """
+    Muestrea f en [x_min, x_max] concentrando los puntos donde hacen falta.
+
+    Args:
+        f: Función de numpy que acepta arreglos
+        x_min: Inicio del rango
+        x_max: Fin del rango
+        initial_points: Puntos de la malla uniforme inicial
+        max_points: Presupuesto total de evaluaciones
+        tolerance: Desviación máxima respecto a la cuerda, relativa a la
+            escala vertical de la curva
+        max_rounds: Número máximo de rondas de refinamiento
+
+    Returns:
+        tuple: (x, y) ordenados por x, con NaN donde f no es real
+    """
+    x = np.linspace(x_min, x_max, max(3, min(initial_points, max_points)))
+    y = _evaluate(f, x)
+
+    # Tramos más finos que esto ya no se distinguen en pantalla
+    min_width = (x_max - x_min) * 1e-7
+
+    for _ in range(max_rounds):
+        budget = max_points - len(x)
+        if budget <= 0:
+            break
+
+        error = _interval_error(x, y)
+        candidates = np.flatnonzero((error > tolerance) & (np.diff(x) > min_width))
+        if candidates.size == 0:
+            break
+
+        # Con poco presupuesto se refinan primero los tramos con más error
+        if candidates.size > budget:
+            order = np.argpartition(error[candidates], -budget)[-budget:]
+            candidates = np.sort(candidates[order])
+
+        x_new = 0.5 * (x[candidates] + x[candidates + 1])
+        y_new = _evaluate(f, x_new)
+        x = np.insert(x, candidates + 1, x_new)
+        y = np.insert(y, candidates + 1, y_new)
+
+    return x, y
+
+
+def _evaluate(f, x):
+    try:
+        return evaluate_on_grid(f, x)
+    except Exception:
+        return evaluate_masked(f, x)
+
+
+def _interval_error(x, y):
+    """
+    Estima el error de cada tramo [x[i], x[i+1]] al dibujarlo como recta.
+    Es infinito en los tramos que cruzan el borde del dominio o cambian de
+    signo, para que se refinen hasta una fracción pequeña del rango.
+    """
+    finite = np.isfinite(y)
+    error = np.zeros(len(x) - 1)
+
+    if np.count_nonzero(finite) >= 2:
+        low, high = np.percentile(y[finite], [2, 98])
+        scale = max(high - low, 1e-12)
+
+        # Distancia de cada punto interior a la cuerda entre sus vecinos
+        x0, x1, x2 = x[:-2], x[1:-1], x[2:]
+        y0, y1, y2 = y[:-2], y[1:-1], y[2:]
+        with np.errstate(all="ignore"):
+            chord = y0 + (y2 - y0) * (x1 - x0) / (x2 - x0)
+            deviation = np.abs(y1 - chord) / scale
+        deviation = np.where(np.isfinite(deviation), deviation, 0.0)
+
+        # Cada tramo hereda la desviación de los puntos en sus extremos
+        error[:-1] = deviation
+        error[1:] = np.maximum(error[1:], deviation)
+
+    with np.errstate(invalid="ignore"):
+        sign_change = np.sign(y[:-1]) * np.sign(y[1:]) < 0
+    domain_edge = finite[:-1] != finite[1:]
+    wide = np.diff(x) > (x[-1] - x[0]) * 1e-5
+    error[(sign_change | domain_edge) & wide] = np.inf
+    return error
@@ -0,0 +1,213 @@
+# logic/batch_ocr.py
+"""
+OCR por lotes para carpetas o listas de imágenes.
+pix2tex procesa las imágenes por lotes con el modelo compartido; las que
+no reconoce (o todas, si pix2tex no está instalado) pasan a Tesseract en
+un pool de procesos. Opcionalmente resuelve cada ecuación reconocida.
+
+Uso:
+    python -m logic.batch_ocr carpeta/ otra_imagen.png --solve
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .cli import solve_equation, to_json_line
+from .image_preprocessing import image_hash, ocr_result_cache
+from .math_methods import MathMethods
+from .ocr_processor import OCRProcessor, model_holder
+
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp")
+
+
+def collect_images(inputs: Iterable[str]) -> List[str]:
+    """Expande las carpetas a sus imágenes (ordenadas por nombre) y conserva los archivos"""
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for name in sorted(os.listdir(item)):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(os.path.join(item, name))
+        else:
+            paths.append(item)
+    return paths
+
+
+def run_batch_ocr(
+    inputs: Iterable[str],
+    solve: bool = False,
+    settings: Optional[Dict] = None,
+    batch_size: int = 8,
+    jobs: Optional[int] = None,
+) -> Iterator[Dict]:
+    """
+    Reconoce todas las imágenes y entrega un registro por imagen en cuanto
+    está listo.
+
+    Args:
+        inputs: Carpetas y/o rutas de imágenes
+        solve: Si es True, resuelve cada ecuación reconocida
+        settings: Configuración del solver (claves de DEFAULT_SETTINGS)
+        batch_size: Imágenes por lote de pix2tex
+        jobs: Procesos para Tesseract; None usa todos los núcleos
+
+    Yields:
+        Dict: {"index", "path", "latex", "method", "success", "error",
+        "seconds"} y, si solve es True, "equation" y "solution"
+    """
+    paths = collect_images(inputs)
+    methods = model_holder.available_methods()
+    math_methods = MathMethods() if solve else None
+    processor = OCRProcessor()
+
+    def finish(record):
+        if solve and record["success"]:
+            record["equation"] = latex_to_equation(record["latex"])
+            record["solution"] = solve_equation(record["equation"], settings, math_methods=math_methods)
+        return record
+
+    def remember(digest, record):
+        if digest is not None and record["success"]:
+            ocr_result_cache.put(processor._cache_key(digest), {
+                "latex": record["latex"],
+                "method": record["method"],
+                "success": True,
+                "error": "",
+            })
+        return finish(record)
+
+    # Las imágenes ya reconocidas salen de la caché sin preprocesar ni inferir
+    pending = []
+    digests = {}
+    for index, path in enumerate(paths):
+        try:
+            digests[index] = image_hash(path)
+        except OSError:
+            digests[index] = None
+        cached = digests[index] and ocr_result_cache.get(processor._cache_key(digests[index]))
+        if cached:
+            yield finish(_record(index, path, cached["latex"], cached["method"], None, 0.0))
+        else:
+            pending.append((index, path))
+
+    fallback = pending
+
+    if "pix2tex" in methods:
+        fallback = []
+        for batch in _chunked(pending, max(1, batch_size)):
+            for (index, path), (latex, error, seconds) in zip(batch, _pix2tex_batch(processor, batch, digests)):
+                if error is None:
+                    yield remember(digests[index], _record(index, path, latex, "pix2tex", None, seconds))
+                else:
+                    print(f"pix2tex falló con {path}: {error}")
+                    fallback.append((index, path))
+
+    if not fallback:
+        return
+
+    if "tesseract" not in methods:
+        for index, path in fallback:
+            yield _record(index, path, "", "", "No hay métodos OCR disponibles para esta imagen", 0.0)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(_tesseract_image, path): (index, path) for index, path in fallback}
+        for future in as_completed(futures):
+            index, path = futures[future]
+            latex, error, seconds = future.result()
+            yield remember(digests[index], _record(index, path, latex, "Tesseract OCR", error, seconds))
+
+
+def latex_to_equation(latex: str) -> str:
+    """Convierte el LaTeX reconocido al formato de ecuación que acepta el solver"""
+    equation = latex.replace("$", "").strip()
+    return re.sub(r"\^\{(.*?)\}", r"^\1", equation)
+
+
+def _pix2tex_batch(processor, batch, digests):
+    """
+    Abre y preprocesa las imágenes de un lote y las pasa juntas al modelo
+    compartido. Retorna, por imagen, una tupla (latex, error, segundos).
+    """
+    images = []
+    errors = {}
+    for position, (index, path) in enumerate(batch):
+        try:
+            images.append(processor.load_image(path, digests[index]))
+        except (OSError, ValueError) as e:
+            errors[position] = f"No se pudo abrir la imagen: {e}"
+
+    try:
+        predictions = iter(model_holder.predict_many(images))
+    except Exception as e:
+        return [("", str(e), 0.0) for _ in batch]
+
+    return [
+        ("", errors[position], 0.0) if position in errors else next(predictions)
+        for position in range(len(batch))
+    ]
+
+
+def _tesseract_image(path: str):
+    """Reconoce una imagen con Tesseract dentro de un proceso del pool"""
+    start = time.perf_counter()
+    try:
+        latex = OCRProcessor()._process_with_tesseract(path)
+        return latex, None, time.perf_counter() - start
+    except Exception as e:
+        return "", f"Tesseract falló: {e}", time.perf_counter() - start
+
+
+def _record(index, path, latex, method, error, seconds) -> Dict:
+    return {
+        "index": index,
+        "path": path,
+        "latex": latex,
+        "method": method,
+        "success": error is None,
+        "error": error or "",
+        "seconds": seconds,
+    }
+
+
+def _chunked(items, size: int):
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos; escribe un objeto JSON por imagen"""
+    parser = argparse.ArgumentParser(
+        prog="python -m logic.batch_ocr",
+        description="Reconoce ecuaciones en carpetas o listas de imágenes.",
+    )
+    parser.add_argument("inputs", nargs="+", help="Carpetas o imágenes")
+    parser.add_argument("--solve", action="store_true", help="Resolver cada ecuación reconocida")
+    parser.add_argument("--batch-size", type=int, default=8, help="Imágenes por lote de pix2tex")
+    parser.add_argument("-j", "--jobs", type=int, help="Procesos para Tesseract")
+    args = parser.parse_args(argv)
+
+    output = sys.stdout
+    exit_code = 0
+    with redirect_stdout(sys.stderr):
+        for record in run_batch_ocr(args.inputs, args.solve, batch_size=args.batch_size, jobs=args.jobs):
+            if not record["success"]:
+                exit_code = 1
+            print(to_json_line(record), file=output, flush=True)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
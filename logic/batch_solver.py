@@ -0,0 +1,180 @@
+# logic/batch_solver.py
+"""
+Resolución por lotes en varios procesos.
+Reparte las ecuaciones en bloques entre un pool de procesos; cada proceso
+tiene su propia caché de expresiones compiladas y su propia instancia de
+MathMethods. Los resultados se entregan en el orden de entrada o en el
+orden en que terminan.
+"""
+
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .cli import solve_equation
+from .math_methods import MathMethods
+
+
+# Bloques pendientes por proceso; limita la memoria cuando la entrada es muy grande
+CHUNKS_IN_FLIGHT_PER_JOB = 4
+
+
+class EquationTimeout(BaseException):
+    """
+    Se lanza cuando una ecuación agota su tiempo límite. Hereda de
+    BaseException para que los `except Exception` de MathMethods no la oculten.
+    """
+
+
+# Estado de cada proceso del pool, creado por _init_worker
+_worker = {}
+
+
+def solve_batch(
+    equations: Iterable[str],
+    settings: Optional[Dict] = None,
+    jobs: Optional[int] = None,
+    chunk_size: int = 64,
+    ordered: bool = True,
+    timeout: Optional[float] = None,
+    include_iterations: bool = False,
+) -> Iterator[Dict]:
+    """
+    Resuelve muchas ecuaciones repartiéndolas entre varios procesos.
+
+    Args:
+        equations: Ecuaciones a resolver (puede ser un generador)
+        settings: Configuración con las claves de DEFAULT_SETTINGS
+        jobs: Número de procesos; None o 0 usa todos los núcleos y 1 resuelve
+            en el proceso actual
+        chunk_size: Ecuaciones que se envían juntas a un proceso
+        ordered: Si es True los resultados salen en el orden de entrada; si
+            es False salen en cuanto terminan
+        timeout: Segundos máximos por ecuación (requiere SIGALRM, disponible
+            en Linux y macOS). La señal se atiende entre instrucciones de
+            Python, así que una llamada larga en C de sympy o numpy no se
+            interrumpe hasta que termina
+        include_iterations: Si es True, cada resultado incluye su iterations_data
+
+    Yields:
+        Dict: El registro de solve_equation con la clave adicional "index"
+    """
+    jobs = jobs or os.cpu_count() or 1
+    chunks = _chunked(enumerate(equations), max(1, chunk_size))
+
+    if jobs == 1:
+        _init_worker(settings, include_iterations, timeout)
+        for chunk in chunks:
+            yield from _solve_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_pool_worker,
+        initargs=(settings, include_iterations, timeout),
+    ) as executor:
+        if ordered:
+            yield from _ordered_results(executor, chunks, jobs)
+        else:
+            yield from _unordered_results(executor, chunks, jobs)
+
+
+def _ordered_results(executor, chunks, jobs: int) -> Iterator[Dict]:
+    """Entrega los bloques en el orden de entrada, manteniendo el pool ocupado"""
+    pending = []
+    for chunk in chunks:
+        pending.append(executor.submit(_solve_chunk, chunk))
+        if len(pending) >= jobs * CHUNKS_IN_FLIGHT_PER_JOB:
+            yield from pending.pop(0).result()
+
+    for future in pending:
+        yield from future.result()
+
+
+def _unordered_results(executor, chunks, jobs: int) -> Iterator[Dict]:
+    """Entrega cada bloque en cuanto termina"""
+    pending = set()
+    for chunk in chunks:
+        pending.add(executor.submit(_solve_chunk, chunk))
+        if len(pending) >= jobs * CHUNKS_IN_FLIGHT_PER_JOB:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield from future.result()
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _init_worker(settings: Optional[Dict], include_iterations: bool, timeout: Optional[float]):
+    """Prepara el estado de un proceso del pool (o del proceso actual si jobs=1)"""
+    _worker["math_methods"] = MathMethods()
+    _worker["settings"] = settings
+    _worker["include_iterations"] = include_iterations
+    _worker["timeout"] = timeout
+
+
+def _init_pool_worker(settings: Optional[Dict], include_iterations: bool, timeout: Optional[float]):
+    """
+    Inicializador de los procesos del pool. Con spawn o forkserver el proceso
+    no hereda la redirección de stdout del padre, así que los mensajes de
+    diagnóstico se envían a stderr aquí: los resultados viajan por el pool y
+    stdout queda libre para quien consume los registros.
+    """
+    sys.stdout = sys.stderr
+    _init_worker(settings, include_iterations, timeout)
+
+
+def _solve_chunk(chunk: List[Tuple[int, str]]) -> List[Dict]:
+    """Resuelve un bloque de (índice, ecuación) dentro de un proceso"""
+    records = []
+    for index, equation in chunk:
+        record = _solve_with_timeout(equation)
+        record["index"] = index
+        records.append(record)
+    return records
+
+
+def _solve_with_timeout(equation: str) -> Dict:
+    def solve():
+        return solve_equation(
+            equation, _worker["settings"], _worker["include_iterations"], _worker["math_methods"]
+        )
+
+    timeout = _worker["timeout"]
+    # Las señales solo se pueden instalar desde el hilo principal
+    if (not timeout or not hasattr(signal, "SIGALRM")
+            or threading.current_thread() is not threading.main_thread()):
+        return solve()
+
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return solve()
+    except EquationTimeout:
+        return {
+            "equation": equation,
+            "success": False,
+            "error": f"Se agotó el tiempo límite de {timeout} s",
+        }
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _raise_timeout(signum, frame):
+    raise EquationTimeout()
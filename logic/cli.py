@@ -0,0 +1,209 @@
+# logic/cli.py
+"""
+Línea de comandos de MathRoots: resuelve ecuaciones sin interfaz gráfica
+y escribe un objeto JSON por línea para cada ecuación.
+
+Ejemplos:
+    python mathroots_cli.py "x^3 - 2x - 5" "x**2 - 9"
+    python mathroots_cli.py --file ecuaciones.txt --method brent
+    cat ecuaciones.txt | python mathroots_cli.py --tolerance 1e-10
+    python mathroots_cli.py --file ecuaciones.txt --jobs 0 --timeout 5
+"""
+
+import argparse
+import json
+import math
+import sys
+from contextlib import redirect_stdout
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .math_methods import MathMethods, METHOD_NAMES, DEFAULT_SETTINGS
+
+
+# Campos de cada resultado que se incluyen en la salida
+RESULT_FIELDS = ("success", "root", "iterations", "final_error", "message", "error")
+
+
+def solve_equation(
+    equation: str,
+    settings: Optional[Dict] = None,
+    include_iterations: bool = False,
+    math_methods: Optional[MathMethods] = None,
+) -> Dict:
+    """
+    Resuelve una ecuación con la misma lógica que la interfaz.
+
+    Args:
+        equation: Ecuación en el formato que acepta la interfaz (x^2 - 4, 2x + 1, ...)
+        settings: Configuración con las claves de DEFAULT_SETTINGS; las que
+            falten toman el valor por defecto
+        include_iterations: Si es True, cada resultado incluye su iterations_data
+        math_methods: Instancia a reutilizar entre ecuaciones
+
+    Returns:
+        Dict: Registro listo para serializar como JSON
+    """
+    settings = {**DEFAULT_SETTINGS, **(settings or {})}
+    math_methods = math_methods or MathMethods()
+    math_methods.set_equation(equation)
+
+    validation = math_methods.validate_equation()
+    if not validation["valid"]:
+        return {"equation": equation, "success": False, "error": validation["error"]}
+
+    try:
+        summary = math_methods.auto_solve(settings)
+    except Exception as e:
+        return {"equation": equation, "success": False, "error": f"Error en el cálculo: {str(e)}"}
+
+    results = []
+    for result in summary["results"]:
+        record = {field: result[field] for field in RESULT_FIELDS if field in result}
+        if include_iterations:
+            record["iterations_data"] = result["iterations_data"]
+        results.append(record)
+
+    return {
+        "equation": equation,
+        "success": True,
+        "method": summary["method"],
+        "requested_method": summary["requested_method"],
+        "method_name": summary["method_name"],
+        "roots": summary["roots"],
+        "total_iterations": summary["total_iterations"],
+        "message": summary["message"],
+        "results": results,
+    }
+
+
+def solve_equations(
+    equations: Iterable[str],
+    settings: Optional[Dict] = None,
+    include_iterations: bool = False,
+) -> Iterator[Dict]:
+    """Resuelve cada ecuación en orden, compartiendo la caché de expresiones"""
+    math_methods = MathMethods()
+    for equation in equations:
+        yield solve_equation(equation, settings, include_iterations, math_methods)
+
+
+def read_equations(lines: Iterable[str]) -> Iterator[str]:
+    """Retorna las ecuaciones de un archivo, ignorando líneas vacías y comentarios (#)"""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def to_json_line(record: Dict) -> str:
+    """Serializa un registro como una línea JSON válida (NaN/inf se escriben como null)"""
+    return json.dumps(_json_safe(record), ensure_ascii=False)
+
+
+def _json_safe(value):
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="mathroots_cli",
+        description="Busca las raíces de ecuaciones sin abrir la interfaz gráfica. "
+                    "Escribe un objeto JSON por línea.",
+    )
+    parser.add_argument("equations", nargs="*", help="Ecuaciones a resolver")
+    parser.add_argument("-f", "--file", action="append", default=[],
+                        help="Archivo con una ecuación por línea ('-' para stdin)")
+    parser.add_argument("--settings", help="Archivo JSON con la configuración (mismas claves que la interfaz)")
+    parser.add_argument("-m", "--method", choices=[m for m in METHOD_NAMES if m != "polinomio"])
+    parser.add_argument("-t", "--tolerance", type=float)
+    parser.add_argument("-n", "--max-iterations", type=int, dest="max_iterations")
+    parser.add_argument("--start", type=float, dest="interval_start", help="Inicio del rango de búsqueda")
+    parser.add_argument("--end", type=float, dest="interval_end", help="Fin del rango de búsqueda")
+    parser.add_argument("--step", type=float, dest="interval_step", help="Paso del rango de búsqueda")
+    parser.add_argument("--no-polynomial", action="store_false", dest="polynomial_fast_path",
+                        default=None, help="No usar la matriz compañera para polinomios")
+    parser.add_argument("--iterations", action="store_true",
+                        help="Incluir la tabla de iteraciones de cada raíz")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Procesos a usar (0 = todos los núcleos)")
+    parser.add_argument("--chunk-size", type=int, default=64,
+                        help="Ecuaciones que se envían juntas a cada proceso")
+    parser.add_argument("--timeout", type=float,
+                        help="Segundos máximos por ecuación (usa SIGALRM; no interrumpe una "
+                             "llamada larga en C de sympy o numpy hasta que termina)")
+    parser.add_argument("--unordered", action="store_true",
+                        help="Escribir cada resultado en cuanto termina, sin respetar el orden de entrada")
+    return parser
+
+
+def settings_from_args(args) -> Dict:
+    """Combina la configuración por defecto, el archivo --settings y las opciones"""
+    settings = DEFAULT_SETTINGS.copy()
+    if args.settings:
+        with open(args.settings, "r", encoding="utf-8") as f:
+            settings.update(json.load(f))
+
+    for key in DEFAULT_SETTINGS:
+        value = getattr(args, key, None)
+        if value is not None:
+            settings[key] = value
+    return settings
+
+
+def equations_from_args(args, stdin=None) -> Iterator[str]:
+    """Ecuaciones de los argumentos, los archivos o, si no hay ninguno, stdin"""
+    stdin = stdin or sys.stdin
+    yield from args.equations
+
+    for path in args.file:
+        if path == "-":
+            yield from read_equations(stdin)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                yield from read_equations(f)
+
+    if not args.equations and not args.file:
+        yield from read_equations(stdin)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+    Retorna 0 si todas las ecuaciones se resolvieron sin error y 1 si no.
+    """
+    from .batch_solver import solve_batch
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        settings = settings_from_args(args)
+    except (OSError, ValueError) as e:
+        parser.error(f"No se pudo leer la configuración: {e}")
+
+    # Los mensajes de diagnóstico de MathMethods van a stderr para que
+    # stdout contenga solo líneas JSON
+    output = sys.stdout
+    exit_code = 0
+    with redirect_stdout(sys.stderr):
+        records = solve_batch(
+            equations_from_args(args),
+            settings,
+            jobs=args.jobs,
+            chunk_size=args.chunk_size,
+            ordered=not args.unordered,
+            timeout=args.timeout,
+            include_iterations=args.iterations,
+        )
+        for record in records:
+            if not record["success"]:
+                exit_code = 1
+            print(to_json_line(record), file=output, flush=True)
+
+    return exit_code
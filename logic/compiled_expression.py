@@ -0,0 +1,166 @@
+"""
+Caché de expresiones compiladas para MathMethods
+Guarda la expresión de sympy, la función de numpy y su derivada
+para no repetir sympify/lambdify en cada llamada.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+import numpy as np
+import sympy as sp
+
+
+X = sp.Symbol("x")
+
+# Nombres que acepta la interfaz y que sympy no reconoce por sí solo
+SYMPY_LOCALS = {
+    "e": sp.E,
+    "ln": sp.log,
+    "arcsin": sp.asin,
+    "arccos": sp.acos,
+    "arctan": sp.atan,
+}
+
+# Límites para decidir si vale la pena derivar simbólicamente
+MAX_OPS_TO_DIFFERENTIATE = 400
+MAX_DERIVATIVE_GROWTH = 10
+
+
+class CompiledExpression:
+    """Expresión de sympy junto con sus funciones evaluables con numpy"""
+
+    def __init__(self, key: str, expr):
+        self.key = key
+        self.expr = expr
+        self.coefficients = _polynomial_coefficients(expr)
+
+        if self.coefficients is not None:
+            # Los polinomios se evalúan con Horner, más rápido que x**n en numpy
+            coefficients = self.coefficients
+            self.f = lambda x: np.polyval(coefficients, x)
+        else:
+            self.f = sp.lambdify(X, expr, "numpy")
+        self._expr_prime = None
+        self._f_prime = None
+        self._derivative_is_practical = None
+
+    @property
+    def is_polynomial(self) -> bool:
+        """Indica si la expresión es un polinomio en x con coeficientes reales"""
+        return self.coefficients is not None
+
+    @property
+    def derivative_is_practical(self) -> bool:
+        """
+        Indica si conviene usar la derivada simbólica. Es False cuando la
+        expresión es tan grande que derivarla sería costoso, cuando sympy no
+        puede derivarla limpiamente o cuando la derivada crece demasiado.
+        """
+        if self._derivative_is_practical is None:
+            self._derivative_is_practical = self._check_derivative()
+        return self._derivative_is_practical
+
+    def _check_derivative(self) -> bool:
+        ops = sp.count_ops(self.expr)
+        if ops > MAX_OPS_TO_DIFFERENTIATE:
+            return False
+        try:
+            expr_prime = self.expr_prime
+        except Exception:
+            return False
+        if expr_prime.has(sp.Derivative, sp.Subs):
+            return False
+        return sp.count_ops(expr_prime) <= MAX_DERIVATIVE_GROWTH * max(ops, 10)
+
+    @property
+    def expr_prime(self):
+        """Derivada simbólica, calculada solo la primera vez que se pide"""
+        if self._expr_prime is None:
+            self._expr_prime = sp.diff(self.expr, X)
+        return self._expr_prime
+
+    @property
+    def f_prime(self):
+        """Derivada lista para evaluarse con numpy"""
+        if self._f_prime is None:
+            self._f_prime = sp.lambdify(X, self.expr_prime, "numpy")
+        return self._f_prime
+
+
+def _polynomial_coefficients(expr):
+    """
+    Retorna los coeficientes del polinomio (grado mayor primero) como arreglo
+    de numpy, o None si la expresión no es un polinomio con coeficientes reales.
+    """
+    try:
+        if not expr.is_polynomial(X):
+            return None
+        coefficients = sp.Poly(expr, X).all_coeffs()
+        if not all(c.is_number and c.is_real for c in coefficients):
+            return None
+        return np.array([float(c) for c in coefficients])
+    except (sp.PolynomialError, TypeError, ValueError):
+        return None
+
+
+class CompiledExpressionCache:
+    """
+    Caché LRU de expresiones compiladas, indexada por el texto normalizado
+    de la ecuación. Lleva contadores de aciertos y fallos.
+    """
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str, expr=None) -> CompiledExpression:
+        """
+        Retorna la expresión compilada para el texto normalizado dado.
+        Si no existe la compila (a partir de expr, o con sympify si no se
+        indica) y la guarda, descartando la menos usada.
+
+        Raises:
+            sympy.SympifyError: Si el texto no es una expresión válida
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        if expr is None:
+            expr = sp.sympify(key, locals=SYMPY_LOCALS)
+        entry = CompiledExpression(key, expr)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        """Vacía la caché y reinicia los contadores"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Retorna los contadores de uso de la caché"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+# Caché compartida por todas las instancias de MathMethods
+expression_cache = CompiledExpressionCache()
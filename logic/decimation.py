@@ -0,0 +1,79 @@
+# logic/decimation.py
+"""
+Pirámide de decimación mín/máx para las curvas de la gráfica.
+Cada nivel agrupa el doble de muestras que el anterior y guarda, por grupo,
+el punto mínimo y el máximo en el orden en que aparecen. Así una vista de
+cualquier ancho se dibuja con unos pocos puntos por píxel sin perder picos.
+"""
+
+import numpy as np
+
+
+class DecimationPyramid:
+    """Niveles mín/máx precalculados de una curva (x creciente)"""
+
+    def __init__(self, x, y, min_points: int = 256):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.x = x
+        self.y = y
+
+        # Nivel 0: los datos originales; en cada nivel siguiente los grupos
+        # tienen el doble de muestras
+        self._levels = [(x, y)]
+        y_finite = np.where(np.isfinite(y), y, np.nan)
+        lo_value, lo_index = y_finite, np.arange(len(y))
+        hi_value, hi_index = y_finite, np.arange(len(y))
+
+        while len(lo_value) > min_points:
+            lo_value, lo_index = _reduce_pairs(lo_value, lo_index, np.fmin, np.less_equal)
+            hi_value, hi_index = _reduce_pairs(hi_value, hi_index, np.fmax, np.greater_equal)
+            self._levels.append(_interleave(x, lo_value, lo_index, hi_value, hi_index))
+
+    @property
+    def levels(self) -> int:
+        return len(self._levels)
+
+    def view(self, x_min: float, x_max: float, max_points: int):
+        """
+        Retorna (x, y) del nivel más fino que cubre [x_min, x_max] con a lo
+        sumo max_points puntos. Incluye un punto extra a cada lado para que
+        la línea llegue hasta los bordes de la vista.
+        """
+        for level_x, level_y in self._levels:
+            start = max(np.searchsorted(level_x, x_min, side="left") - 1, 0)
+            end = min(np.searchsorted(level_x, x_max, side="right") + 1, len(level_x))
+            if end - start <= max_points:
+                return level_x[start:end], level_y[start:end]
+        return level_x[start:end], level_y[start:end]
+
+
+def _reduce_pairs(values, indices, combine, prefer_left):
+    """Combina grupos vecinos de dos en dos, conservando el índice elegido"""
+    if len(values) % 2:
+        values = np.append(values, np.nan)
+        indices = np.append(indices, indices[-1])
+
+    left, right = values[0::2], values[1::2]
+    left_index, right_index = indices[0::2], indices[1::2]
+
+    with np.errstate(invalid="ignore"):
+        take_left = prefer_left(left, right) | np.isnan(right)
+    return combine(left, right), np.where(take_left, left_index, right_index)
+
+
+def _interleave(x, lo_value, lo_index, hi_value, hi_index):
+    """Une mínimos y máximos de cada grupo en el orden en que aparecen en x"""
+    lo_first = lo_index <= hi_index
+    first_index = np.where(lo_first, lo_index, hi_index)
+    second_index = np.where(lo_first, hi_index, lo_index)
+    first_value = np.where(lo_first, lo_value, hi_value)
+    second_value = np.where(lo_first, hi_value, lo_value)
+
+    level_x = np.empty(2 * len(lo_value))
+    level_y = np.empty(2 * len(lo_value))
+    level_x[0::2] = x[first_index]
+    level_x[1::2] = x[second_index]
+    level_y[0::2] = first_value
+    level_y[1::2] = second_value
+    return level_x, level_y
@@ -0,0 +1,277 @@
+# logic/equation_parser.py
+"""
+Analizador de ecuaciones escritas como en la interfaz.
+Tokeniza el texto en un solo recorrido y construye la expresión de sympy
+directamente desde los tokens (descenso recursivo por precedencia), sin
+pasar por reemplazos de texto. Acepta multiplicación implícita ("2x",
+"3(x+1)", "x sen(x)"), ^ y ** para potencias, ² y ³, alias en español
+(sen, tg, arcsen, senh, raiz, ln...) y una igualdad, que se resuelve como
+lado izquierdo menos lado derecho.
+
+El resultado se guarda en caché por texto, así que el solver, la gráfica
+y la validación comparten la misma expresión.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, NamedTuple
+
+import sympy as sp
+
+from .compiled_expression import X
+
+
+class EquationSyntaxError(ValueError):
+    """Error de sintaxis en la ecuación, con la posición donde ocurrió"""
+
+
+class Token(NamedTuple):
+    kind: str
+    text: str
+    position: int
+
+
+# Tipos de token
+NUMBER = "number"
+NAME = "name"
+OP = "op"
+END = "end"
+
+
+def _real_cbrt(a):
+    """Raíz cúbica real (también para negativos)"""
+    return sp.sign(a) * sp.Abs(a) ** sp.Rational(1, 3)
+
+
+# Funciones por nombre (en minúsculas), con sus alias en español
+FUNCTIONS = {
+    "sin": sp.sin, "sen": sp.sin,
+    "cos": sp.cos,
+    "tan": sp.tan, "tg": sp.tan,
+    "cot": sp.cot, "cotg": sp.cot, "ctg": sp.cot,
+    "sec": sp.sec,
+    "csc": sp.csc, "cosec": sp.csc,
+    "asin": sp.asin, "arcsin": sp.asin, "arcsen": sp.asin, "asen": sp.asin,
+    "acos": sp.acos, "arccos": sp.acos,
+    "atan": sp.atan, "arctan": sp.atan, "arctg": sp.atan,
+    "sinh": sp.sinh, "senh": sp.sinh,
+    "cosh": sp.cosh,
+    "tanh": sp.tanh, "tgh": sp.tanh,
+    "exp": sp.exp,
+    "ln": sp.log, "log": sp.log,
+    "log10": lambda a: sp.log(a, 10),
+    "log2": lambda a: sp.log(a, 2),
+    "sqrt": sp.sqrt, "raiz": sp.sqrt, "raíz": sp.sqrt, "√": sp.sqrt,
+    "cbrt": _real_cbrt,
+    "abs": sp.Abs,
+    "sign": sp.sign, "signo": sp.sign,
+}
+
+# Variables y constantes; pueden ir pegadas ("2pix" -> 2*pi*x) y el
+# tokenizador las separa en un token por símbolo
+SYMBOLS = {
+    "x": X,
+    "e": sp.E,
+    "pi": sp.pi,
+    "π": sp.pi,
+}
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|(?P<op>\*\*|[-+*/^()=,²³·×÷−])"
+    r"|(?P<name>[^\W\d_][^\W_²³]*|√)"
+    r")"
+)
+
+# Operadores equivalentes que se normalizan al tokenizar
+_OP_ALIASES = {"**": "^", "·": "*", "×": "*", "÷": "/", "−": "-"}
+
+
+def tokenize(text: str) -> List[Token]:
+    """Divide el texto en tokens en un solo recorrido"""
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if match is None or match.end() == position:
+            raise EquationSyntaxError(f"Carácter no válido '{text[position]}' en la posición {position + 1}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "name":
+            tokens.extend(_split_name(value.lower(), match.start(kind)))
+        else:
+            if kind == "op":
+                value = _OP_ALIASES.get(value, value)
+            tokens.append(Token(kind, value, match.start(kind)))
+        position = match.end()
+    tokens.append(Token(END, "", len(text)))
+    return tokens
+
+
+def _split_name(name: str, position: int) -> List[Token]:
+    """
+    Retorna el nombre como un solo token si es una función o un símbolo; si
+    no, lo separa en símbolos pegados ("pix" -> pi, x) para que una potencia
+    que sigue se aplique solo al último: "2pix^2" es 2*pi*x^2.
+    """
+    if name in FUNCTIONS or name in SYMBOLS:
+        return [Token(NAME, name, position)]
+
+    tokens = []
+    start = 0
+    while start < len(name):
+        for end in range(len(name), start, -1):
+            if name[start:end] in SYMBOLS:
+                tokens.append(Token(NAME, name[start:end], position + start))
+                start = end
+                break
+        else:
+            raise EquationSyntaxError(f"Nombre desconocido '{name}' en la posición {position + 1}")
+    return tokens
+
+
+class _Parser:
+    """
+    Gramática (de menor a mayor precedencia):
+        ecuación  := suma ['=' suma]
+        suma      := producto (('+' | '-') producto)*
+        producto  := unario (('*' | '/') unario | unario implícito)*
+        unario    := ('-' | '+') unario | potencia
+        potencia  := primario [('^' | '²' | '³') unario]
+        primario  := número | símbolo | función | '(' suma ')'
+    """
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.pos = 0
+
+    @property
+    def current(self) -> Token:
+        return self.tokens[self.pos]
+
+    def advance(self) -> Token:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def accept(self, op: str) -> bool:
+        if self.current.kind == OP and self.current.text == op:
+            self.pos += 1
+            return True
+        return False
+
+    def expect(self, op: str):
+        if not self.accept(op):
+            self.error(f"Se esperaba '{op}'")
+
+    def error(self, message: str):
+        token = self.current
+        found = f"'{token.text}'" if token.kind != END else "el final"
+        raise EquationSyntaxError(f"{message}, se encontró {found} en la posición {token.position + 1}")
+
+    def starts_primary(self) -> bool:
+        token = self.current
+        return token.kind in (NUMBER, NAME) or (token.kind == OP and token.text == "(")
+
+    def equation(self):
+        if self.current.kind == END:
+            raise EquationSyntaxError("La ecuación está vacía")
+        left = self.sum()
+        if self.accept("="):
+            left = left - self.sum()
+        if self.current.kind != END:
+            self.error("Expresión incompleta")
+        return left
+
+    def sum(self):
+        result = self.product()
+        while True:
+            if self.accept("+"):
+                result = result + self.product()
+            elif self.accept("-"):
+                result = result - self.product()
+            else:
+                return result
+
+    def product(self):
+        result = self.unary()
+        while True:
+            if self.accept("*"):
+                result = result * self.unary()
+            elif self.accept("/"):
+                result = result / self.unary()
+            elif self.starts_primary():
+                result = result * self.power()  # multiplicación implícita
+            else:
+                return result
+
+    def unary(self):
+        if self.accept("-"):
+            return -self.unary()
+        if self.accept("+"):
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        base = self.primary()
+        if self.accept("^"):
+            return base ** self.unary()
+        if self.accept("²"):
+            return base ** 2
+        if self.accept("³"):
+            return base ** 3
+        return base
+
+    def primary(self):
+        token = self.current
+        if token.kind == NUMBER:
+            self.advance()
+            if any(c in token.text for c in ".eE"):
+                return sp.Float(token.text)
+            return sp.Integer(token.text)
+
+        if token.kind == NAME:
+            self.advance()
+            if token.text in FUNCTIONS:
+                return self.function(FUNCTIONS[token.text])
+            return SYMBOLS[token.text]
+
+        if self.accept("("):
+            result = self.sum()
+            self.expect(")")
+            return result
+
+        self.error("Se esperaba un número, una variable o '('")
+
+    def function(self, func):
+        # sen^2(x) -> sen(x)^2
+        exponent = self.unary() if self.accept("^") else None
+
+        if self.accept("("):
+            args = [self.sum()]
+            while self.accept(","):
+                args.append(self.sum())
+            self.expect(")")
+        else:
+            # Sin paréntesis el argumento es la potencia que sigue: "sen x"
+            args = [self.power()]
+
+        try:
+            result = func(*args)
+        except TypeError:
+            self.error("Número de argumentos incorrecto")
+        return result if exponent is None else result ** exponent
+
+
+@lru_cache(maxsize=256)
+def parse_equation(text: str):
+    """
+    Convierte la ecuación en una expresión de sympy en x.
+    Si tiene '=', retorna lado izquierdo menos lado derecho.
+
+    Raises:
+        EquationSyntaxError: Si el texto no es una ecuación válida
+    """
+    return _Parser(tokenize(text)).equation()
@@ -4,12 +4,38 @@ Clase para manejar gráficas con PyQtGraph en MathRoots
 Instalación requerida: pip install pyqtgraph numpy
 """
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QThreadPool, QTimer
 from PySide6.QtWidgets import QVBoxLayout, QWidget, QMessageBox
 from PySide6.QtCore import Qt
-import pyqtgraph as pg
+from collections import OrderedDict
+from functools import partial
 import numpy as np
 
+from .adaptive_sampling import adaptive_sample
+from .decimation import DecimationPyramid
+from .grid_evaluation import sign_change_indices
+from .lazy_imports import lazy_module
+from .math_methods import compile_equation
+from .plot_cache import PlotDataCache, temporary_spill_dir
+from .plot_worker import PlotTileWorker
+
+# pyqtgraph se importa al crear la gráfica o en la precarga de fondo
+pg = lazy_module("pyqtgraph")
+
+# Tramos que se guardan por curva al recorrer la gráfica
+MAX_TILES_POR_CURVA = 64
+
+# Espera tras el último cambio de rango antes de volver a muestrear (ms)
+RETARDO_REMUESTREO_MS = 120
+
+# Muestras por píxel al volver a muestrear la vista
+MUESTRAS_POR_PIXEL = 2
+
+# Memoria máxima para las curvas ya calculadas; las que se descartan pasan a
+# un directorio temporal propio del proceso, también con un límite
+CACHE_GRAFICAS_MAX_BYTES = 64 * 1024 * 1024
+CACHE_GRAFICAS_MAX_DISCO = 256 * 1024 * 1024
+
 
 class Graphic(QObject):
     """Controlador para las gráficas de funciones matemáticas"""
@@ -29,8 +55,29 @@ class Graphic(QObject):
         ]
         self.indice_color = 0
 
-        # Inicializar la gráfica en el contenedor de tu UI
-        self.init_plot()
+        # Curvas ya calculadas, por expresión normalizada y rango. El directorio
+        # temporal para pasarlas a disco se crea solo si llega a hacer falta
+        self.cache_datos = PlotDataCache(
+            CACHE_GRAFICAS_MAX_BYTES, temporary_spill_dir, CACHE_GRAFICAS_MAX_DISCO
+        )
+
+        # Remuestreo de la vista visible al hacer zoom o desplazarse
+        self.pool = QThreadPool.globalInstance()
+        self.vista_actual = None
+        self.timer_rango = QTimer(self)
+        self.timer_rango.setSingleShot(True)
+        self.timer_rango.setInterval(RETARDO_REMUESTREO_MS)
+        self.timer_rango.timeout.connect(self._remuestrear_vista)
+
+    def asegurar_grafica(self):
+        """
+        Crea el PlotWidget si todavía no existe y lo retorna. La gráfica no se
+        crea en __init__ sino la primera vez que se necesita (o al terminar la
+        precarga), para no retrasar la aparición de la ventana.
+        """
+        if self.plot_widget is None:
+            self.init_plot()
+        return self.plot_widget
 
     def init_plot(self):
         """
@@ -73,6 +120,9 @@ class Graphic(QObject):
         # Agregar el plot widget
         layout.addWidget(self.plot_widget)
 
+        # Volver a muestrear solo lo visible cuando cambia el rango en x
+        self.plot_widget.getViewBox().sigXRangeChanged.connect(self._on_rango_cambiado)
+
         print("Gráfica PyQtGraph inicializada correctamente")
 
     def configurar_grafica(self):
@@ -112,51 +162,36 @@ class Graphic(QObject):
     def parsear_funcion(self, expresion):
         """
         Convierte una expresión matemática en texto a una función evaluable.
+        Usa la misma expresión compilada (sympy + lambdify) que MathMethods,
+        así que graficar una ecuación ya resuelta no la vuelve a compilar.
 
         Args:
             expresion (str): Expresión matemática como texto (ej: "x**2 - 3*x + 2")
 
         Returns:
-            function: Función lambda evaluable
+            function: Función de numpy que acepta arreglos
 
         Raises:
             ValueError: Si la expresión no es válida
         """
-        # Reemplazar ^ por ** para potencias
-        expresion = expresion.replace("^", "**")
-
-        # Funciones matemáticas permitidas (seguras)
-        funciones_permitidas = {
-            "sin": np.sin,
-            "cos": np.cos,
-            "tan": np.tan,
-            "exp": np.exp,
-            "log": np.log,
-            "ln": np.log,
-            "sqrt": np.sqrt,
-            "abs": np.abs,
-            "arcsin": np.arcsin,
-            "arccos": np.arccos,
-            "arctan": np.arctan,
-            "sinh": np.sinh,
-            "cosh": np.cosh,
-            "tanh": np.tanh,
-            "pi": np.pi,
-            "e": np.e,
-        }
-
         try:
-            # Crear función lambda segura
-            func = lambda x: eval(
-                expresion, {"__builtins__": {}}, {**funciones_permitidas, "x": x}
-            )
-            return func
+            compilada = compile_equation(expresion)
         except Exception as e:
             raise ValueError(f"Error al parsear la función: {str(e)}")
 
+        from .compiled_expression import X
+        variables = compilada.expr.free_symbols - {X}
+        if variables:
+            nombres = ", ".join(sorted(str(v) for v in variables))
+            raise ValueError(f"Error al parsear la función: variables desconocidas ({nombres})")
+
+        return compilada.f
+
     def encontrar_raices(self, func, x, y):
         """
         Encuentra las raíces (intersecciones con el eje x, donde y=0).
+        Detecta los cambios de signo con operaciones de arreglos y descarta
+        los que provienen de polos (como las asíntotas de tan(x)).
         
         Args:
             func: Función a evaluar
@@ -166,23 +201,22 @@ class Graphic(QObject):
         Returns:
             list: Lista de valores x donde ocurren las raíces (y=0)
         """
-        raices = []
+        indices = sign_change_indices(func, x, y)
+        if indices.size == 0:
+            return []
         
-        # Buscar cambios de signo (solo cambios de signo reales)
-        for i in range(len(y) - 1):
-            if np.isnan(y[i]) or np.isnan(y[i + 1]) or np.isinf(y[i]) or np.isinf(y[i + 1]):
-                continue
-            
-            # Solo detectar cambios de signo reales (positivo a negativo o viceversa)
-            if y[i] * y[i + 1] < 0:  # Cambio de signo
-                # Interpolación lineal para encontrar la raíz más precisa
-                x_raiz = x[i] - y[i] * (x[i + 1] - x[i]) / (y[i + 1] - y[i])
-                
-                # Evitar raíces duplicadas muy cercanas (dentro de 0.05 unidades)
-                if len(raices) == 0 or abs(x_raiz - raices[-1]) > 0.05:
-                    raices.append(x_raiz)
+        # Interpolación lineal para encontrar la raíz más precisa
+        x0, x1 = x[indices], x[indices + 1]
+        y0, y1 = y[indices], y[indices + 1]
+        raices = x0 - y0 * (x1 - x0) / (y1 - y0)
         
-        return raices
+        # Evitar raíces duplicadas muy cercanas (dentro de 0.05 unidades de
+        # la última raíz que se conservó)
+        unicas = []
+        for raiz in raices.tolist():
+            if not unicas or raiz - unicas[-1] > 0.05:
+                unicas.append(raiz)
+        return unicas
 
     def graficar_funcion(self, expresion, x_min=-10, x_max=10, limpiar=False):
         """
@@ -197,7 +231,7 @@ class Graphic(QObject):
         Returns:
             bool: True si se graficó correctamente, False en caso contrario
         """
-        if self.plot_widget is None:
+        if self.asegurar_grafica() is None:
             QMessageBox.warning(
                 None, 
                 "Error", 
@@ -212,17 +246,17 @@ class Graphic(QObject):
             
             # Parsear la función
             func = self.parsear_funcion(expresion)
+            clave = PlotDataCache.make_key(compile_equation(expresion).key, x_min, x_max)
             
-            # Generar datos
-            # Aumentamos el número de puntos a 10000 para una mejor resolución
-            x = np.linspace(x_min, x_max, 10000)
-            
-            # Manejar posibles errores en la evaluación
-            try:
-                y = func(x)
-            except:
-                # Si falla con array, intentar elemento por elemento
-                y = np.array([func(xi) if not np.isnan(func(xi)) else np.nan for xi in x])
+            datos = self.cache_datos.get(clave)
+            if datos is not None:
+                x, y, raices = datos
+                raices = raices.tolist()
+            else:
+                # Generar datos: muestreo adaptativo, con más puntos donde la
+                # curva se dobla, cambia de signo o sale del dominio
+                x, y = adaptive_sample(func, x_min, x_max)
+                raices = None
             
             # Verificar valores válidos
             if np.all(np.isnan(y)) or np.all(np.isinf(y)):
@@ -237,24 +271,17 @@ class Graphic(QObject):
             color = self.colores[self.indice_color % len(self.colores)]
             pen = pg.mkPen(color=color, width=3)
             
-            # Graficar
+            # Graficar; pyqtgraph recorta a la vista y reduce por picos lo
+            # que aún exceda el ancho en píxeles
             curva = self.plot_widget.plot(x, y, pen=pen, name=expresion)
+            curva.setClipToView(True)
+            curva.setDownsampling(auto=True, method='peak')
             
             # Encontrar y marcar las raíces (donde y=0)
-            raices = self.encontrar_raices(func, x, y)
-            lineas_raices = []
-            
-            for raiz in raices:
-                # Crear línea vertical punteada en cada raíz
-                linea = pg.InfiniteLine(
-                    pos=raiz,
-                    angle=90,
-                    pen=pg.mkPen(color=color, width=1.5, style=Qt.PenStyle.DotLine),
-                    label=f'x={raiz:.3f}',
-                    labelOpts={'position': 0.95, 'color': color}
-                )
-                self.plot_widget.addItem(linea)
-                lineas_raices.append(linea)
+            if raices is None:
+                raices = self.encontrar_raices(func, x, y)
+                self.cache_datos.put(clave, x, y, raices)
+            lineas_raices = [self._agregar_linea_raiz(raiz, color) for raiz in raices]
             
             # Guardar referencia
             self.funciones_graficadas.append({
@@ -262,8 +289,13 @@ class Graphic(QObject):
                 'curva': curva,
                 'color': color,
                 'raices': raices,
-                'lineas_raices': lineas_raices
+                'lineas_raices': lineas_raices,
+                'func': func,
+                'tiles': OrderedDict(),
+                'tiles_pendientes': {},
+                'piramide': DecimationPyramid(x, y),
             })
+            self.timer_rango.start()
             
             # Incrementar índice de color
             self.indice_color += 1
@@ -282,6 +314,141 @@ class Graphic(QObject):
             return False
     
 
+    def _agregar_linea_raiz(self, raiz, color):
+        """Crea la línea vertical punteada que marca una raíz"""
+        linea = pg.InfiniteLine(
+            pos=raiz,
+            angle=90,
+            pen=pg.mkPen(color=color, width=1.5, style=Qt.PenStyle.DotLine),
+            label=f'x={raiz:.3f}',
+            labelOpts={'position': 0.95, 'color': color}
+        )
+        self.plot_widget.addItem(linea)
+        return linea
+
+    def _on_rango_cambiado(self, *args):
+        """
+        Ajusta el nivel de detalle de inmediato y reinicia la espera; el
+        remuestreo ocurre cuando el rango deja de cambiar.
+        """
+        for funcion in self.funciones_graficadas:
+            self._aplicar_nivel_de_detalle(funcion)
+        self.timer_rango.start()
+
+    def _aplicar_nivel_de_detalle(self, funcion):
+        """
+        Dibuja la curva con el nivel de la pirámide mín/máx que da unas pocas
+        muestras por píxel en la vista actual, así el costo de redibujar
+        depende del ancho en píxeles y no de cuántas muestras hay.
+        """
+        view_box = self.plot_widget.getViewBox()
+        # Con el rango automático, cambiar los datos volvería a mover la vista
+        if view_box.autoRangeEnabled()[0]:
+            return
+
+        (x_min, x_max), _ = view_box.viewRange()
+        pixeles = max(int(view_box.width()), 100)
+        x, y = funcion['piramide'].view(x_min, x_max, MUESTRAS_POR_PIXEL * pixeles)
+        funcion['curva'].setData(x, y)
+
+    def _remuestrear_vista(self):
+        """
+        Divide la vista en tramos de ancho potencia de 2 y manda a muestrear,
+        en el pool de hilos, los tramos que aún no están en la caché de cada curva.
+        """
+        if self.plot_widget is None or not self.funciones_graficadas:
+            return
+
+        view_box = self.plot_widget.getViewBox()
+        # El temporizador solo se dispara cuando el rango dejó de cambiar. Si el
+        # rango automático sigue activo, se fija el rango en x que ya calculó:
+        # de lo contrario, los nuevos datos lo volverían a mover
+        if view_box.autoRangeEnabled()[0]:
+            view_box.enableAutoRange(x=False)
+
+        (x_min, x_max), _ = view_box.viewRange()
+        ancho = x_max - x_min
+        pixeles = max(int(view_box.width()), 100)
+        if not np.isfinite(ancho) or ancho <= 0:
+            return
+
+        # Entre 4 y 8 tramos cubren la vista; al hacer zoom cambia el nivel
+        nivel = int(np.floor(np.log2(ancho / 4)))
+        ancho_tile = 2.0 ** nivel
+        primero = int(np.floor(x_min / ancho_tile))
+        ultimo = int(np.floor(x_max / ancho_tile))
+        puntos = max(64, int(MUESTRAS_POR_PIXEL * pixeles * ancho_tile / ancho))
+
+        self.vista_actual = [(nivel, i) for i in range(primero, ultimo + 1)]
+
+        for funcion in self.funciones_graficadas:
+            for clave in self.vista_actual:
+                if clave in funcion['tiles'] or clave in funcion['tiles_pendientes']:
+                    continue
+                worker = PlotTileWorker(
+                    funcion['func'], clave[1] * ancho_tile, (clave[1] + 1) * ancho_tile, puntos
+                )
+                worker.signals.finished.connect(partial(self._on_tile_listo, funcion, clave))
+                worker.signals.error.connect(partial(self._on_tile_error, funcion, clave))
+                # Se guarda el worker para que sus señales sigan vivas hasta entregarse
+                funcion['tiles_pendientes'][clave] = worker
+                self.pool.start(worker)
+
+            self._actualizar_curva(funcion)
+
+    def _on_tile_listo(self, funcion, clave, x, y):
+        funcion['tiles_pendientes'].pop(clave, None)
+        if not any(funcion is f for f in self.funciones_graficadas):
+            return
+
+        funcion['tiles'][clave] = (x, y)
+        while len(funcion['tiles']) > MAX_TILES_POR_CURVA:
+            funcion['tiles'].popitem(last=False)
+        self._actualizar_curva(funcion)
+
+    def _on_tile_error(self, funcion, clave, mensaje):
+        funcion['tiles_pendientes'].pop(clave, None)
+        print(mensaje)
+
+    def _actualizar_curva(self, funcion):
+        """Reemplaza los datos de la curva cuando todos los tramos visibles están listos"""
+        if not self.vista_actual:
+            return
+
+        tiles = funcion['tiles']
+        if not all(clave in tiles for clave in self.vista_actual):
+            return
+
+        for clave in self.vista_actual:
+            tiles.move_to_end(clave)
+
+        # Cada tramo repite el extremo del anterior; se omite su primer punto
+        x = np.concatenate([tiles[self.vista_actual[0]][0]] + [tiles[c][0][1:] for c in self.vista_actual[1:]])
+        y = np.concatenate([tiles[self.vista_actual[0]][1]] + [tiles[c][1][1:] for c in self.vista_actual[1:]])
+        funcion['piramide'] = DecimationPyramid(x, y)
+        self._aplicar_nivel_de_detalle(funcion)
+        self._actualizar_raices(funcion, x, y)
+
+    def _actualizar_raices(self, funcion, x, y):
+        """
+        Recalcula las raíces dentro de los tramos remuestreados, que tienen más
+        detalle que el muestreo inicial, y conserva las que quedan fuera.
+        """
+        fuera = [raiz for raiz in funcion['raices'] if raiz < x[0] or raiz > x[-1]]
+        raices = []
+        for raiz in sorted(fuera + self.encontrar_raices(funcion['func'], x, y)):
+            if not raices or raiz - raices[-1] > 0.05:
+                raices.append(raiz)
+        if raices == funcion['raices']:
+            return
+
+        for linea in funcion['lineas_raices']:
+            self.plot_widget.removeItem(linea)
+        funcion['raices'] = raices
+        funcion['lineas_raices'] = [
+            self._agregar_linea_raiz(raiz, funcion['color']) for raiz in raices
+        ]
+
     def limpiar_grafica(self):
         """Limpia todas las gráficas y reinicia la configuración"""
         if self.plot_widget is None:
@@ -289,6 +456,7 @@ class Graphic(QObject):
 
         self.plot_widget.clear()
         self.funciones_graficadas = []
+        self.vista_actual = None
         self.indice_color = 0
         self.configurar_grafica()
         print("Gráfica limpiada")
@@ -330,7 +498,7 @@ class Graphic(QObject):
         Returns:
             bool: True si se exportó correctamente
         """
-        if self.plot_widget is None:
+        if self.asegurar_grafica() is None:
             return False
 
         try:
@@ -367,7 +535,7 @@ class Graphic(QObject):
             y_min (float, optional): Valor mínimo de y
             y_max (float, optional): Valor máximo de y
         """
-        if self.plot_widget is None:
+        if self.asegurar_grafica() is None:
             return
 
         self.plot_widget.setXRange(x_min, x_max, padding=0)
@@ -377,7 +545,7 @@ class Graphic(QObject):
 
     def auto_rango(self):
         """Ajusta automáticamente el rango de la gráfica"""
-        if self.plot_widget is None:
+        if self.asegurar_grafica() is None:
             return
 
         self.plot_widget.autoRange()
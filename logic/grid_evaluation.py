@@ -0,0 +1,94 @@
+# logic/grid_evaluation.py
+"""
+Evaluación vectorizada de funciones sobre mallas de numpy y detección de
+cambios de signo. Solo depende de numpy, así que el solver y la gráfica la
+pueden importar sin cargar sympy.
+"""
+
+import numpy as np
+
+
+def evaluate_on_grid(f, x: np.ndarray) -> np.ndarray:
+    """
+    Evalúa f sobre todo el arreglo x en una sola llamada de numpy.
+    Retorna un arreglo float del mismo tamaño que x, con NaN donde la
+    función no es real (por ejemplo, raíces de negativos).
+    """
+    with np.errstate(all="ignore"):
+        y = np.asarray(f(x))
+        if np.iscomplexobj(y):
+            y = np.where(np.abs(y.imag) < 1e-12, y.real, np.nan)
+    if y.shape == np.shape(x) and y.dtype == np.float64:
+        return y
+    # Las expresiones constantes retornan un escalar
+    return np.broadcast_to(y, np.shape(x)).astype(float)
+
+
+def evaluate_masked(f, x: np.ndarray, chunk_size: int = 1024, min_chunk: int = 16) -> np.ndarray:
+    """
+    Igual que evaluate_on_grid, pero tolera funciones que fallan en parte del
+    dominio: evalúa por bloques y parte en dos los que lanzan excepción hasta
+    min_chunk puntos. Los bloques que siguen fallando quedan en NaN.
+    """
+    y = np.full(np.shape(x), np.nan)
+    pending = [(start, min(start + chunk_size, len(x))) for start in range(0, len(x), chunk_size)]
+
+    while pending:
+        start, end = pending.pop()
+        try:
+            y[start:end] = evaluate_on_grid(f, x[start:end])
+        except Exception:
+            if end - start > min_chunk:
+                middle = (start + end) // 2
+                pending.append((start, middle))
+                pending.append((middle, end))
+    return y
+
+
+def sign_change_indices(f, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Retorna los índices i donde [x[i], x[i+1]] encierra una raíz.
+    Descarta los tramos con valores NaN/inf y los cambios de signo
+    producidos por polos (como las asíntotas de tan(x)).
+    """
+    ya = y[:-1]
+    yb = y[1:]
+    sa = np.sign(ya)
+    sb = np.sign(yb)
+
+    finite = np.isfinite(ya) & np.isfinite(yb)
+    # Un cero exacto cuenta como raíz una sola vez: en el tramo que lo tiene
+    # como extremo derecho o, para el primer punto de la malla, en el primero
+    change = finite & ((sa * sb < 0) | ((sb == 0) & (sa != 0)))
+    change[:1] |= finite[:1] & (sa[:1] == 0)
+    idx = np.flatnonzero(change)
+    if idx.size == 0:
+        return idx
+
+    return idx[~_pole_mask(f, x[idx], x[idx + 1], ya[idx], yb[idx])]
+
+
+def _pole_mask(f, a, b, fa, fb, steps: int = 8) -> np.ndarray:
+    """
+    Marca los cambios de signo que corresponden a polos. Cada tramo se
+    reduce unas cuantas veces por bisección: cerca de una raíz |f| disminuye,
+    cerca de un polo crece. Se compara contra el menor de los valores en los
+    extremos originales, porque si un punto de la malla cae muy cerca del
+    polo el mayor ya es enorme.
+    """
+    bound = np.minimum(np.abs(fa), np.abs(fb))
+    valid = np.ones(a.shape, dtype=bool)
+
+    for _ in range(steps):
+        m = 0.5 * (a + b)
+        fm = evaluate_on_grid(f, m)
+        valid &= np.isfinite(fm)
+        left = np.sign(fa) * np.sign(fm) <= 0
+        b = np.where(left, m, b)
+        fb = np.where(left, fm, fb)
+        a = np.where(left, a, m)
+        fa = np.where(left, fa, fm)
+
+    with np.errstate(invalid="ignore"):
+        growing = np.minimum(np.abs(fa), np.abs(fb)) > bound
+    return ~valid | growing
@@ -0,0 +1,209 @@
+# logic/image_preprocessing.py
+"""
+Preprocesamiento de imágenes antes del OCR.
+Reduce las fotos grandes a una resolución razonable, corrige la
+inclinación, binariza con Otsu y recorta al contenido. Los resultados se
+guardan por hash del contenido del archivo, junto con el texto reconocido,
+para que volver a enviar la misma imagen no repita ningún paso.
+"""
+
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+
+import numpy as np
+from PIL import Image
+
+
+# Resolución objetivo; las imágenes sin DPI se limitan por su lado mayor
+TARGET_DPI = 300
+MAX_SIDE = 1600
+
+# Ángulos (grados) que se prueban para corregir la inclinación
+MAX_SKEW_ANGLE = 10
+
+# Margen en píxeles alrededor del contenido recortado
+CROP_MARGIN = 12
+
+
+def image_hash(path: str) -> str:
+    """Hash SHA-256 del contenido del archivo"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def preprocess_image(image: Image.Image) -> Image.Image:
+    """
+    Prepara una imagen para el OCR: escala de grises, reducción de tamaño,
+    corrección de inclinación, binarización y recorte al contenido.
+    Retorna una imagen 'L' con texto negro sobre fondo blanco.
+    """
+    image = _downscale(_flatten_alpha(image))
+    gray = np.asarray(image.convert("L"), dtype=np.uint8)
+
+    binary = gray > otsu_threshold(gray)
+    # El texto debe ser la minoría de píxeles; si no, la imagen está invertida
+    if np.count_nonzero(binary) < binary.size / 2:
+        binary = ~binary
+
+    angle = estimate_skew(~binary)
+    result = Image.fromarray(np.where(binary, 255, 0).astype(np.uint8), mode="L")
+    if angle:
+        result = result.rotate(angle, resample=Image.NEAREST, expand=True, fillcolor=255)
+
+    return _crop_to_content(result)
+
+
+def _flatten_alpha(image: Image.Image) -> Image.Image:
+    """
+    Compone las imágenes con transparencia sobre fondo blanco. Los renders de
+    LaTeX suelen ser trazos negros sobre fondo transparente; convertirlos a 'L'
+    directamente descarta el alfa y el fondo queda del mismo color que los
+    trazos, sin tinta que reconocer.
+    """
+    if image.mode == "P" and "transparency" in image.info:
+        image = image.convert("RGBA")
+    if image.mode not in ("RGBA", "LA", "PA"):
+        return image
+
+    image = image.convert("RGBA")
+    background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+    return Image.alpha_composite(background, image).convert("RGB")
+
+
+def otsu_threshold(gray: np.ndarray) -> int:
+    """Umbral de Otsu: maximiza la varianza entre las clases fondo y texto"""
+    histogram = np.bincount(gray.ravel(), minlength=256).astype(float)
+    total = histogram.sum()
+    if total == 0:
+        return 127
+
+    levels = np.arange(256)
+    weight_low = np.cumsum(histogram)
+    weight_high = total - weight_low
+    sum_low = np.cumsum(histogram * levels)
+    mean_low = sum_low / np.maximum(weight_low, 1)
+    mean_high = (sum_low[-1] - sum_low) / np.maximum(weight_high, 1)
+
+    between = weight_low * weight_high * (mean_low - mean_high) ** 2
+    return int(np.argmax(between))
+
+
+def estimate_skew(ink: np.ndarray) -> float:
+    """
+    Estima la inclinación del texto (en grados) por perfiles de proyección:
+    al girar al ángulo correcto, las sumas por fila son más contrastadas.
+    Trabaja sobre una copia reducida para que sea rápido.
+    """
+    if not ink.any():
+        return 0.0
+
+    step = max(1, max(ink.shape) // 400)
+    small = ink[::step, ::step]
+    rows, cols = np.nonzero(small)
+    rows = rows - rows.mean()
+    cols = cols - cols.mean()
+
+    def score(angles):
+        radians = np.deg2rad(angles)[:, None]
+        # Fila de cada píxel de tinta al girar la imagen por cada ángulo
+        rotated = np.round(rows[None, :] * np.cos(radians) - cols[None, :] * np.sin(radians))
+        rotated = (rotated - rotated.min(axis=1, keepdims=True)).astype(np.int64)
+        return np.array([np.var(np.bincount(r)) for r in rotated])
+
+    coarse = np.arange(-MAX_SKEW_ANGLE, MAX_SKEW_ANGLE + 1, 1.0)
+    best = coarse[np.argmax(score(coarse))]
+    fine = np.arange(best - 1, best + 1.01, 0.2)
+    best = fine[np.argmax(score(fine))]
+    return float(-best) if abs(best) > 0.3 else 0.0
+
+
+def _downscale(image: Image.Image) -> Image.Image:
+    dpi = image.info.get("dpi")
+    scale = 1.0
+    if dpi and dpi[0] and dpi[0] > TARGET_DPI:
+        scale = TARGET_DPI / float(dpi[0])
+    scale = min(scale, MAX_SIDE / float(max(image.size)))
+
+    if scale >= 1.0:
+        return image
+    size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+    return image.resize(size, Image.LANCZOS)
+
+
+def _crop_to_content(image: Image.Image) -> Image.Image:
+    ink = np.asarray(image) < 128
+    rows = np.flatnonzero(ink.any(axis=1))
+    cols = np.flatnonzero(ink.any(axis=0))
+    if rows.size == 0:
+        return image
+
+    box = (
+        max(cols[0] - CROP_MARGIN, 0),
+        max(rows[0] - CROP_MARGIN, 0),
+        min(cols[-1] + CROP_MARGIN + 1, image.width),
+        min(rows[-1] + CROP_MARGIN + 1, image.height),
+    )
+    return image.crop(box)
+
+
+class ImageCache:
+    """Caché LRU indexada por el hash del contenido de la imagen"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+# Imágenes ya preprocesadas y resultados de OCR, por hash del archivo
+preprocessed_cache = ImageCache(max_size=32)
+ocr_result_cache = ImageCache(max_size=256)
+
+
+def load_preprocessed(path: str, digest: str = None) -> Image.Image:
+    """Abre y preprocesa una imagen, reutilizando el resultado si ya se procesó"""
+    digest = digest or image_hash(path)
+    image = preprocessed_cache.get(digest)
+    if image is None:
+        with Image.open(path) as original:
+            image = preprocess_image(original)
+        preprocessed_cache.put(digest, image)
+    return image
@@ -0,0 +1,136 @@
+# logic/iterations_model.py
+"""
+Modelo de Qt para la tabla de iteraciones.
+Guarda las iteraciones en un arreglo de numpy por columnas y solo
+formatea el texto de las celdas que la vista pide mostrar.
+"""
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QColor
+
+
+# Campos de iterations_data que se muestran en cada tipo de método
+BRACKETED_FIELDS = ("iteration", "a", "b", "c", "f_a", "f_b", "f_c", "error")
+OPEN_FIELDS = ("iteration", "x", "f_x", "f_prime_x", "x_next", "error")
+
+
+class IterationsTableModel(QAbstractTableModel):
+    """
+    Modelo de solo lectura para tabla_iteraciones. Las filas se agregan por
+    bloques (una raíz a la vez) y se guardan como float64; las filas
+    separadoras se marcan aparte y se muestran vacías.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = []
+        self._fields = ()
+        self._values = np.empty((0, 0))
+        self._separator = np.empty(0, dtype=bool)
+        self._row_count = 0
+
+    def set_columns(self, headers, fields):
+        """
+        Cambia las columnas mostradas. Si los campos son los mismos solo se
+        actualizan los encabezados; si cambian, la tabla se vacía.
+        """
+        if tuple(fields) == self._fields:
+            self._headers = list(headers)
+            if self._fields:
+                self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._fields) - 1)
+            return
+
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._fields = tuple(fields)
+        self._values = np.empty((0, len(self._fields)))
+        self._separator = np.empty(0, dtype=bool)
+        self._row_count = 0
+        self.endResetModel()
+
+    def clear(self):
+        """Elimina todas las filas conservando las columnas"""
+        self.beginResetModel()
+        self._values = np.empty((0, len(self._fields)))
+        self._separator = np.empty(0, dtype=bool)
+        self._row_count = 0
+        self.endResetModel()
+
+    def append_iterations(self, iterations_data):
+        """Agrega al final las filas de una lista de iteraciones"""
+        if not iterations_data or not self._fields:
+            return
+
+        block = np.array(
+            [[data[field] for field in self._fields] for data in iterations_data],
+            dtype=float,
+        )
+        self._append_block(block, separator=False)
+
+    def append_separator(self, rows: int = 2):
+        """Agrega filas vacías para separar los resultados de cada raíz"""
+        if rows > 0 and self._fields:
+            self._append_block(np.full((rows, len(self._fields)), np.nan), separator=True)
+
+    def _append_block(self, block, separator: bool):
+        start = self._row_count
+        end = start + len(block)
+        self._reserve(end)
+
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        self._values[start:end] = block
+        self._separator[start:end] = separator
+        self._row_count = end
+        self.endInsertRows()
+
+    def _reserve(self, rows: int):
+        """Crece el arreglo al doble para que agregar filas sea amortizado O(1)"""
+        capacity = len(self._values)
+        if rows <= capacity:
+            return
+
+        capacity = max(rows, 2 * capacity, 64)
+        values = np.empty((capacity, len(self._fields)))
+        values[:self._row_count] = self._values[:self._row_count]
+        separator = np.zeros(capacity, dtype=bool)
+        separator[:self._row_count] = self._separator[:self._row_count]
+        self._values = values
+        self._separator = separator
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._fields)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+
+        if role == Qt.BackgroundRole:
+            return QColor("#FFFFFF") if self._separator[row] else None
+
+        if role != Qt.DisplayRole:
+            return None
+
+        if self._separator[row]:
+            return ""
+
+        value = self._values[row, index.column()]
+        if self._fields[index.column()] == "iteration":
+            return str(int(value))
+        return f"{value:.6f}"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            if 0 <= section < len(self._headers):
+                return self._headers[section]
+            return None
+        return str(section + 1)
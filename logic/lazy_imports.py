@@ -0,0 +1,131 @@
+# logic/lazy_imports.py
+"""
+Carga diferida de las librerías pesadas (sympy, pyqtgraph, fpdf,
+speech_recognition) para que la ventana principal aparezca cuanto antes.
+Cada librería se importa la primera vez que se usa o en un hilo de
+precarga que arranca cuando la ventana ya está visible.
+
+startup_profile registra las fases del arranque y cuánto tardó cada
+importación diferida; con MATHROOTS_STARTUP_REPORT=1 se imprime el reporte.
+Para el detalle módulo por módulo: python -X importtime mathroots.py
+"""
+
+import importlib
+import os
+import sys
+import threading
+import time
+
+
+class StartupProfile:
+    """Tiempos de las fases del arranque y de las importaciones diferidas"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []
+        self.imports = []
+        self._lock = threading.Lock()
+
+    def mark(self, phase: str):
+        """Registra que terminó una fase del arranque"""
+        with self._lock:
+            self.phases.append((phase, time.perf_counter() - self.start))
+
+    def record_import(self, name: str, seconds: float):
+        with self._lock:
+            self.imports.append((name, seconds, threading.current_thread().name))
+
+    def report(self) -> str:
+        """Reporte legible de dónde se fue el tiempo de arranque"""
+        with self._lock:
+            phases = list(self.phases)
+            imports = list(self.imports)
+
+        lines = ["Arranque de MathRoots:"]
+        previous = 0.0
+        for phase, elapsed in phases:
+            lines.append(f"  {phase:<32} {1000 * (elapsed - previous):8.1f} ms  (total {1000 * elapsed:8.1f} ms)")
+            previous = elapsed
+
+        if imports:
+            lines.append("Importaciones diferidas:")
+            for name, seconds, thread in sorted(imports, key=lambda item: -item[1]):
+                lines.append(f"  {name:<32} {1000 * seconds:8.1f} ms  [{thread}]")
+        return "\n".join(lines)
+
+    def enabled(self) -> bool:
+        return os.environ.get("MATHROOTS_STARTUP_REPORT", "") not in ("", "0")
+
+
+# Perfil del arranque del proceso actual
+startup_profile = StartupProfile()
+
+
+def import_module(name: str):
+    """Importa un módulo registrando el tiempo si aún no estaba cargado"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    startup_profile.record_import(name, time.perf_counter() - start)
+    return module
+
+
+class LazyModule:
+    """
+    Sustituto de un módulo que lo importa al acceder al primer atributo.
+    Usa el sistema de importación normal, así que es seguro aunque el hilo
+    de precarga esté importando el mismo módulo a la vez.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attribute):
+        module = self._module
+        if module is None:
+            module = self._module = import_module(self._name)
+        return getattr(module, attribute)
+
+    def __repr__(self):
+        state = "cargado" if self._module is not None else "sin cargar"
+        return f"<LazyModule {self._name} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Retorna un módulo que se importa al primer uso"""
+    return LazyModule(name)
+
+
+# Módulos que se precargan en segundo plano al iniciar la interfaz
+WARM_UP_MODULES = (
+    "sympy",
+    "logic.compiled_expression",
+    "logic.equation_parser",
+    "pyqtgraph",
+    "fpdf",
+    "logic.custom_pdf",
+    "speech_recognition",
+)
+
+
+def warm_up(modules=WARM_UP_MODULES, on_finished=None) -> threading.Thread:
+    """
+    Importa los módulos en un hilo de fondo. on_finished se llama desde ese
+    hilo al terminar (para la interfaz, conectarlo a una señal de Qt).
+    """
+    def run():
+        for name in modules:
+            try:
+                import_module(name)
+            except Exception as e:
+                print(f"No se pudo precargar {name}: {e}")
+        startup_profile.mark("precarga en segundo plano")
+        if on_finished is not None:
+            on_finished()
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
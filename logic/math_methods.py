@@ -1,13 +1,56 @@
 """
 Clase MathMethods con implementación del método de bisección
+No depende de Qt: se puede usar desde la interfaz, la línea de comandos o
+como librería.
 """
 
-import sympy as sp
+import bisect
 import numpy as np
-from typing import List, Dict, Tuple, Optional
-from PySide6.QtWidgets import QTableWidgetItem
-from PySide6.QtCore import Qt
-import re
+from typing import List, Dict, Tuple, Optional, TYPE_CHECKING
+
+from .grid_evaluation import evaluate_on_grid, sign_change_indices
+
+if TYPE_CHECKING:
+    from .compiled_expression import CompiledExpression
+
+
+# Nombres para mostrar de cada valor de la clave 'method' de la configuración
+METHOD_NAMES = {
+    "biseccion": "Bisección",
+    "brent": "Brent",
+    "illinois": "Regula Falsi (Illinois)",
+    "ridders": "Ridders",
+    "newton": "Newton-Raphson",
+    "secante": "Secante",
+    "steffensen": "Steffensen",
+    "polinomio": "Polinomio (matriz compañera)",
+}
+
+# Métodos que trabajan sobre un intervalo [a, b] con cambio de signo
+BRACKETED_METHODS = ("biseccion", "brent", "illinois", "ridders")
+
+# Métodos que parten de un valor inicial
+OPEN_METHODS = ("newton", "secante", "steffensen")
+
+# Configuración por defecto, con las mismas claves que emite SettingsWidget
+DEFAULT_SETTINGS = {
+    "method": "biseccion",
+    "tolerance": 1e-6,
+    "max_iterations": 100,
+    "auto_interval": True,
+    "interval_start": -100,
+    "interval_end": 100,
+    "interval_step": 0.1,
+    "polynomial_fast_path": True,
+}
+
+# Distancia relativa a la que dos valores propios de la matriz compañera pueden
+# ser la misma raíz múltiple (una raíz de multiplicidad m se dispersa del orden
+# de eps^(1/m) veces su magnitud)
+MULTIPLICITY_RTOL = 1e-2
+
+# Puntos de la malla que se evalúan entre cada revisión de cancelación
+GRID_CHUNK = 65536
 
 
 class MathMethods:
@@ -26,25 +69,22 @@ class MathMethods:
 
     def get_equation_for_plot(self) -> str:
         """
-        Retorna la ecuación en formato compatible con PyQtGraph.
-        Convierte notación matemática a Python.
+        Retorna la ecuación para graficarla. Graphic la compila con
+        compile_equation, así que usa la misma expresión que el solver.
         """
-        ecuacion = self.equation_text
-
-        if not ecuacion:
-            return ""
-
-        # Reemplazar ^ por **
-        ecuacion = ecuacion.replace("^", "**")
+        return self.equation_text.strip()
 
-        # Agregar * entre número y x (ej: 2x -> 2*x)
-        ecuacion = re.sub(r"(\d)([a-zA-Z])", r"\1*\2", ecuacion)
-
-        # Agregar * entre ) y letra o entre letra y (
-        ecuacion = re.sub(r"\)([a-zA-Z])", r")*\1", ecuacion)
-        ecuacion = re.sub(r"([a-zA-Z])\(", r"\1*(", ecuacion)
+    def _compile(self) -> "CompiledExpression":
+        """
+        Retorna la ecuación actual compilada, usando la caché compartida
+        indexada por el texto normalizado.
+        """
+        return compile_equation(self.equation_text)
 
-        return ecuacion
+    def get_cache_stats(self) -> Dict:
+        """Retorna los contadores de aciertos y fallos de la caché de expresiones"""
+        from .compiled_expression import expression_cache
+        return expression_cache.stats()
 
     @property
     def equation(self):
@@ -72,182 +112,477 @@ class MathMethods:
         Returns:
             Dict: Diccionario con los resultados del método y los datos de las iteraciones.
         """
-        iterations_data = []
+        return self.bisection_batch([(a, b)], tolerance, max_iterations)[0]
+
+    def bisection_batch(
+        self,
+        intervals: List[Tuple[float, float]],
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+    ) -> List[Dict]:
+        """
+        Aplica bisección a todos los intervalos a la vez usando arreglos de numpy.
+        Cada iteración evalúa f una sola vez para todos los intervalos activos y
+        reutiliza los valores ya conocidos de f(a) y f(b).
+
+        Args:
+            intervals: Lista de tuplas (a, b), como las de find_all_suitable_intervals
+            tolerance (float): Tolerancia para la convergencia
+            max_iterations (int): Número máximo de iteraciones
+
+        Returns:
+            List[Dict]: Un diccionario de resultados por intervalo, con el mismo
+            formato que bisection_method.
+        """
+        if not intervals:
+            return []
+
         try:
-            # Parsear la ecuación usando sympy
-            x = sp.Symbol("x")
-            equation_processed = self._process_equation_for_sympy(self.equation_text)
-            expr = sp.sympify(equation_processed)
-            f = sp.lambdify(x, expr, "numpy")
+            f = self._compile().f
+
+            a = np.array([interval[0] for interval in intervals], dtype=float)
+            b = np.array([interval[1] for interval in intervals], dtype=float)
+            fa = evaluate_on_grid(f, a)
+            fb = evaluate_on_grid(f, b)
+
+            count = len(intervals)
+            results = [None] * count
 
             # Verificar que f(a) y f(b) tienen signos opuestos
-            fa = f(a)
-            fb = f(b)
+            same_sign = fa * fb > 0
+            for i in np.flatnonzero(same_sign):
+                results[i] = self._error_result(
+                    f"f({a[i]}) = {fa[i]:.6f} y f({b[i]}) = {fb[i]:.6f} tienen el mismo signo. "
+                    "No se puede aplicar bisección."
+                )
 
-            if fa * fb > 0:
-                return {
-                    "success": False,
-                    "error": f"f({a}) = {fa:.6f} y f({b}) = {fb:.6f} tienen el mismo signo. No se puede aplicar bisección.",
-                    "iterations": 0,
-                    "root": None,
-                    "final_error": 0.0,
-                    "iterations_data": iterations_data,
-                }
+            # Algoritmo de bisección sobre todos los intervalos activos
+            active = ~same_sign
+            converged = np.zeros(count, dtype=bool)
+            c = a.copy()
+            fc = np.zeros(count)
+            error = np.abs(b - a)
 
-            # Algoritmo de bisección
-            iteration = 0
-            c = a
-            error = abs(b-a)
+            # Un extremo que ya es raíz exacta no necesita iteraciones
+            exact = active & ((fa == 0) | (fb == 0))
+            c[exact] = np.where(fa[exact] == 0, a[exact], b[exact])
+            error[exact] = 0.0
+            converged[exact] = True
+            active[exact] = False
+            iterations = np.zeros(count, dtype=int)
+            history = []
 
-            while iteration < max_iterations:
-                iteration += 1
-                
-                c_prev = c
-                c = (a + b) / 2
-                fc = f(c)
+            for iteration in range(1, max_iterations + 1):
+                idx = np.flatnonzero(active)
+                if idx.size == 0:
+                    break
+
+                a_i, b_i, fa_i, fb_i = a[idx], b[idx], fa[idx], fb[idx]
+                c_i = (a_i + b_i) / 2
+                fc_i = evaluate_on_grid(f, c_i)
 
                 if iteration > 1:
-                    error = abs(c - c_prev)
+                    error_i = np.abs(c_i - c[idx])
                 else:
-                    error = abs(b - a)
+                    error_i = np.abs(b_i - a_i)
+
+                history.append((idx, a_i, b_i, c_i, fa_i, fb_i, fc_i, error_i))
+
+                c[idx] = c_i
+                fc[idx] = fc_i
+                error[idx] = error_i
+                iterations[idx] = iteration
+
+                done = (np.abs(fc_i) < tolerance) | (error_i < tolerance)
+                converged[idx[done]] = True
+                active[idx[done]] = False
+
+                go_left = fa_i * fc_i < 0
+                b[idx] = np.where(go_left, c_i, b_i)
+                fb[idx] = np.where(go_left, fc_i, fb_i)
+                a[idx] = np.where(go_left, a_i, c_i)
+                fa[idx] = np.where(go_left, fa_i, fc_i)
+
+            iterations_data = self._unpack_bisection_history(history, count)
+
+            for i in range(count):
+                if results[i] is not None:
+                    continue
+
+                if converged[i]:
+                    root = float(c[i])
+                    results[i] = {
+                        "success": True,
+                        "root": root,
+                        "iterations": int(iterations[i]),
+                        "final_error": float(error[i]),
+                        "function_value": float(fc[i]),
+                        "message": f"Raíz encontrada en x = {root:.8f} después de {iterations[i]} iteraciones",
+                        "iterations_data": iterations_data[i],
+                    }
+                else:
+                    results[i] = {
+                        "success": False,
+                        "error": f"No se alcanzó la convergencia después de {max_iterations} iteraciones",
+                        "iterations": max_iterations,
+                        "root": float(c[i]),
+                        "final_error": float(error[i]),
+                        "iterations_data": iterations_data[i],
+                    }
+
+            return results
+
+        except Exception as e:
+            return [self._error_result(f"Error en el cálculo: {str(e)}") for _ in intervals]
+
+    def solve_brackets(
+        self,
+        method: str,
+        intervals: List[Tuple[float, float]],
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+    ) -> List[Dict]:
+        """
+        Resuelve cada intervalo con el método cerrado indicado por la clave
+        'method' de la configuración. Bisección se ejecuta en lote.
+        """
+        if method == "biseccion":
+            return self.bisection_batch(intervals, tolerance, max_iterations)
+
+        solvers = {
+            "brent": self.brent_method,
+            "illinois": self.illinois_method,
+            "ridders": self.ridders_method,
+        }
+        solver = solvers[method]
+        return [solver(a, b, tolerance, max_iterations) for a, b in intervals]
+
+    def brent_method(
+        self, a: float, b: float, tolerance: float = 1e-6, max_iterations: int = 100
+    ) -> Dict:
+        """
+        Implementa el método de Brent: combina interpolación cuadrática inversa,
+        secante y bisección, manteniendo siempre un intervalo con cambio de signo.
+
+        Args:
+            a (float): Límite inferior del intervalo
+            b (float): Límite superior del intervalo
+            tolerance (float): Tolerancia para la convergencia
+            max_iterations (int): Número máximo de iteraciones
+
+        Returns:
+            Dict: Diccionario con los resultados del método y los datos de las iteraciones.
+        """
+        iterations_data = []
+        try:
+            f = self._compile().f
+            fa, fb = f(a), f(b)
+
+            error = self._check_bracket(a, b, fa, fb, "Brent")
+            if error:
+                return self._error_result(error)
+
+            # b es la mejor aproximación y c el contrapunto con signo opuesto
+            c, fc = a, fa
+            d = e = b - a
+            error = abs(b - a)
+
+            for iteration in range(1, max_iterations + 1):
+                if fb * fc > 0:
+                    c, fc = a, fa
+                    d = e = b - a
+                if abs(fc) < abs(fb):
+                    a, b, c = b, c, b
+                    fa, fb, fc = fb, fc, fb
+
+                tol1 = 2 * np.finfo(float).eps * abs(b) + 0.5 * tolerance
+                xm = 0.5 * (c - b)
+
+                # El intervalo ya es más pequeño que la tolerancia
+                if abs(xm) <= tol1 or fb == 0:
+                    return self._bracketed_success(b, fb, error, iteration - 1, iterations_data)
+
+                if abs(e) >= tol1 and abs(fa) > abs(fb):
+                    s = fb / fa
+                    if a == c:
+                        # Secante
+                        p = 2 * xm * s
+                        q = 1 - s
+                    else:
+                        # Interpolación cuadrática inversa
+                        q = fa / fc
+                        r = fb / fc
+                        p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                        q = (q - 1) * (r - 1) * (s - 1)
+                    if p > 0:
+                        q = -q
+                    p = abs(p)
+                    if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                        e, d = d, p / q
+                    else:
+                        d = e = xm
+                else:
+                    d = e = xm
+
+                low, high = (b, c) if b < c else (c, b)
+                f_low, f_high = (fb, fc) if b < c else (fc, fb)
+
+                a, fa = b, fb
+                b = b + d if abs(d) > tol1 else b + np.copysign(tol1, xm)
+                fb = f(b)
+                error = abs(b - a) if iteration > 1 else abs(high - low)
+
+                iterations_data.append({
+                    "iteration": iteration,
+                    "a": low,
+                    "b": high,
+                    "c": b,
+                    "f_a": f_low,
+                    "f_b": f_high,
+                    "f_c": fb,
+                    "error": error,
+                })
+
+                if abs(fb) < tolerance or error < tolerance:
+                    return self._bracketed_success(b, fb, error, iteration, iterations_data)
+
+            return self._bracketed_failure(b, error, max_iterations, iterations_data)
+
+        except Exception as e:
+            return self._error_result(f"Error en el cálculo: {str(e)}", iterations_data)
+
+    def illinois_method(
+        self, a: float, b: float, tolerance: float = 1e-6, max_iterations: int = 100
+    ) -> Dict:
+        """
+        Implementa regula falsi con la modificación de Illinois: cuando el mismo
+        extremo se conserva dos veces seguidas, su valor de f se reduce a la mitad
+        para evitar el estancamiento de la falsa posición clásica.
+
+        Args:
+            a (float): Límite inferior del intervalo
+            b (float): Límite superior del intervalo
+            tolerance (float): Tolerancia para la convergencia
+            max_iterations (int): Número máximo de iteraciones
+
+        Returns:
+            Dict: Diccionario con los resultados del método y los datos de las iteraciones.
+        """
+        iterations_data = []
+        try:
+            f = self._compile().f
+            fa, fb = f(a), f(b)
+
+            error = self._check_bracket(a, b, fa, fb, "regula falsi")
+            if error:
+                return self._error_result(error)
+
+            # Valores de f usados en la interpolación (se reducen a la mitad)
+            wa, wb = fa, fb
+            kept_side = 0
+            c = a
+            error = abs(b - a)
 
-                iteration_data = {
+            for iteration in range(1, max_iterations + 1):
+                c_prev = c
+                c = (a * wb - b * wa) / (wb - wa)
+                fc = f(c)
+                error = abs(c - c_prev) if iteration > 1 else abs(b - a)
+
+                iterations_data.append({
                     "iteration": iteration,
                     "a": a,
                     "b": b,
                     "c": c,
-                    "f_a": f(a),
-                    "f_b": f(b),
+                    "f_a": fa,
+                    "f_b": fb,
                     "f_c": fc,
                     "error": error,
-                }
-                iterations_data.append(iteration_data)
+                })
 
                 if abs(fc) < tolerance or error < tolerance:
-                    return {
-                        "success": True,
-                        "root": c,
-                        "iterations": iteration,
-                        "final_error": error,
-                        "function_value": fc,
-                        "message": f"Raíz encontrada en x = {c:.8f} después de {iteration} iteraciones",
-                        "iterations_data": iterations_data,
-                    }
+                    return self._bracketed_success(c, fc, error, iteration, iterations_data)
 
-                if f(a) * fc < 0:
-                    b = c
+                if fa * fc < 0:
+                    b, fb, wb = c, fc, fc
+                    if kept_side == -1:
+                        wa /= 2
+                    kept_side = -1
                 else:
-                    a = c
+                    a, fa, wa = c, fc, fc
+                    if kept_side == 1:
+                        wb /= 2
+                    kept_side = 1
 
-            return {
-                "success": False,
-                "error": f"No se alcanzó la convergencia después de {max_iterations} iteraciones",
-                "iterations": max_iterations,
-                "root": c,
-                "final_error": error,
-                "iterations_data": iterations_data,
-            }
+            return self._bracketed_failure(c, error, max_iterations, iterations_data)
 
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Error en el cálculo: {str(e)}",
-                "iterations": 0,
-                "root": None,
-                "final_error": 0.0,
-                "iterations_data": iterations_data,
-            }
+            return self._error_result(f"Error en el cálculo: {str(e)}", iterations_data)
 
-    def _process_equation_for_sympy(self, equation: str) -> str:
+    def ridders_method(
+        self, a: float, b: float, tolerance: float = 1e-6, max_iterations: int = 100
+    ) -> Dict:
         """
-        Procesa la ecuación para que sea compatible con sympy.
-        Convierte notaciones comunes a formato sympy.
+        Implementa el método de Ridders: evalúa el punto medio y ajusta una
+        exponencial para obtener una nueva aproximación dentro del intervalo.
+
+        Args:
+            a (float): Límite inferior del intervalo
+            b (float): Límite superior del intervalo
+            tolerance (float): Tolerancia para la convergencia
+            max_iterations (int): Número máximo de iteraciones
+
+        Returns:
+            Dict: Diccionario con los resultados del método y los datos de las iteraciones.
         """
-        processed = equation.strip()
+        iterations_data = []
+        try:
+            f = self._compile().f
+            fa, fb = f(a), f(b)
 
-        if "=" in processed:
-            processed = processed.split("=")[0].strip()
+            error = self._check_bracket(a, b, fa, fb, "Ridders")
+            if error:
+                return self._error_result(error)
 
-        replacements = {
-            "^": "**",
-            "sen": "sin",
-            "cos": "cos",
-            "tan": "tan",
-            "ln": "log",
-            "log": "log",
-            "sqrt": "sqrt",
-            "e^": "exp",
-        }
+            c = a
+            error = abs(b - a)
 
-        processed = re.sub(r"(\d)([a-zA-Z])", r"\1*\2", processed)
-        processed = re.sub(r"([a-zA-Z])\(", r"\1*(", processed)
+            for iteration in range(1, max_iterations + 1):
+                m = (a + b) / 2
+                fm = f(m)
+                s = np.sqrt(fm * fm - fa * fb)
 
-        for old, new in replacements.items():
-            processed = processed.replace(old, new)
+                c_prev = c
+                if s == 0:
+                    c, fc = m, fm
+                else:
+                    c = m + (m - a) * np.sign(fa - fb) * fm / s
+                    fc = f(c)
+                error = abs(c - c_prev) if iteration > 1 else abs(b - a)
 
-        return processed
+                iterations_data.append({
+                    "iteration": iteration,
+                    "a": a,
+                    "b": b,
+                    "c": c,
+                    "f_a": fa,
+                    "f_b": fb,
+                    "f_c": fc,
+                    "error": error,
+                })
 
-    def populate_table_rows(self, table_widget, iterations_data):
-        """
-        Agrega filas a la tabla de la interfaz con los datos de las iteraciones.
-        No limpia la tabla, simplemente añade las nuevas filas al final.
-        """
-        if not iterations_data:
-            return
+                if abs(fc) < tolerance or error < tolerance:
+                    return self._bracketed_success(c, fc, error, iteration, iterations_data)
 
-        current_row_count = table_widget.rowCount()
-        table_widget.setRowCount(current_row_count + len(iterations_data))
+                # Conservar el subintervalo más pequeño que mantiene el cambio de signo
+                if fm * fc < 0:
+                    a, fa, b, fb = (m, fm, c, fc) if m < c else (c, fc, m, fm)
+                elif fa * fc < 0:
+                    b, fb = c, fc
+                else:
+                    a, fa = c, fc
 
-        for i, data in enumerate(iterations_data):
-            row_index = current_row_count + i
-            table_widget.setItem(row_index, 0, self._create_table_item(str(data["iteration"])))
-            table_widget.setItem(row_index, 1, self._create_table_item(f"{data['a']:.6f}"))
-            table_widget.setItem(row_index, 2, self._create_table_item(f"{data['b']:.6f}"))
-            table_widget.setItem(row_index, 3, self._create_table_item(f"{data['c']:.6f}"))
-            table_widget.setItem(row_index, 4, self._create_table_item(f"{data['f_a']:.6f}"))
-            table_widget.setItem(row_index, 5, self._create_table_item(f"{data['f_b']:.6f}"))
-            table_widget.setItem(row_index, 6, self._create_table_item(f"{data['f_c']:.6f}"))
-            table_widget.setItem(row_index, 7, self._create_table_item(f"{data['error']:.6f}"))
+            return self._bracketed_failure(c, error, max_iterations, iterations_data)
 
-        table_widget.resizeColumnsToContents()
+        except Exception as e:
+            return self._error_result(f"Error en el cálculo: {str(e)}", iterations_data)
 
-    def _create_table_item(self, text: str):
+    def _check_bracket(self, a: float, b: float, fa: float, fb: float, method_name: str) -> str:
+        """Retorna un mensaje de error si f(a) y f(b) no tienen signos opuestos"""
+        if fa * fb > 0:
+            return (f"f({a}) = {fa:.6f} y f({b}) = {fb:.6f} tienen el mismo signo. "
+                    f"No se puede aplicar {method_name}.")
+        return ""
+
+    def _bracketed_success(self, root, function_value, error, iteration, iterations_data) -> Dict:
+        """Diccionario de resultado cuando un método cerrado converge"""
+        return {
+            "success": True,
+            "root": float(root),
+            "iterations": iteration,
+            "final_error": float(error),
+            "function_value": float(function_value),
+            "message": f"Raíz encontrada en x = {root:.8f} después de {iteration} iteraciones",
+            "iterations_data": iterations_data,
+        }
+
+    def _bracketed_failure(self, root, error, max_iterations, iterations_data) -> Dict:
+        """Diccionario de resultado cuando un método cerrado agota las iteraciones"""
+        return {
+            "success": False,
+            "error": f"No se alcanzó la convergencia después de {max_iterations} iteraciones",
+            "iterations": max_iterations,
+            "root": float(root),
+            "final_error": float(error),
+            "iterations_data": iterations_data,
+        }
+
+    def _unpack_bisection_history(self, history, count: int) -> List[List[Dict]]:
         """
-        Crea un item de tabla de Qt con el texto dado.
+        Convierte el historial por columnas de bisection_batch en la lista
+        de iteraciones de cada intervalo, en el formato que usa la tabla.
         """
-        item = QTableWidgetItem(text)
-        item.setTextAlignment(Qt.AlignCenter)
-        return item
+        iterations_data = [[] for _ in range(count)]
+
+        for iteration, (idx, a, b, c, fa, fb, fc, error) in enumerate(history, start=1):
+            columns = zip(idx.tolist(), a.tolist(), b.tolist(), c.tolist(),
+                          fa.tolist(), fb.tolist(), fc.tolist(), error.tolist())
+            for i, a_i, b_i, c_i, fa_i, fb_i, fc_i, error_i in columns:
+                iterations_data[i].append({
+                    "iteration": iteration,
+                    "a": a_i,
+                    "b": b_i,
+                    "c": c_i,
+                    "f_a": fa_i,
+                    "f_b": fb_i,
+                    "f_c": fc_i,
+                    "error": error_i,
+                })
+
+        return iterations_data
+
+    def _error_result(self, error: str, iterations_data: Optional[List[Dict]] = None) -> Dict:
+        """Diccionario de resultado para un método que no pudo ejecutarse"""
+        return {
+            "success": False,
+            "error": error,
+            "iterations": 0,
+            "root": None,
+            "final_error": 0.0,
+            "iterations_data": iterations_data if iterations_data is not None else [],
+        }
 
     def find_all_suitable_intervals(
-        self, start: float = -10, end: float = 10, step: float = 0.5
+        self, start: float = -10, end: float = 10, step: float = 0.5, is_cancelled=None
     ) -> List[Tuple[float, float]]:
         """
         Busca automáticamente todos los intervalos adecuados para aplicar bisección.
+        Evalúa toda la malla [start, end] en una sola llamada de numpy y detecta
+        los cambios de signo con operaciones de arreglos, descartando NaN/inf y polos.
         Retorna una lista de tuplas (a, b).
+
+        Si se indica is_cancelled, la malla se evalúa en bloques de GRID_CHUNK
+        puntos y se retorna una lista vacía en cuanto la función retorna True.
         """
         try:
-            x = sp.Symbol("x")
-            equation_processed = self._process_equation_for_sympy(self.equation_text)
-            expr = sp.sympify(equation_processed)
-            f = sp.lambdify(x, expr, "numpy")
-
-            intervals = []
-            current = start
-            while current < end - step:
-                try:
-                    fa = f(current)
-                    fb = f(current + step)
+            f = self._compile().f
 
-                    if np.sign(fa) != np.sign(fb):
-                        intervals.append((current, current + step))
+            if step <= 0 or end <= start:
+                return []
 
-                except (ZeroDivisionError, ValueError, OverflowError):
-                    pass
-                
-                current += step
+            num_steps = int(np.floor((end - start) / step + 1e-9))
+            x = start + step * np.arange(num_steps + 1)
+            if is_cancelled is None:
+                y = evaluate_on_grid(f, x)
+            else:
+                y = np.empty_like(x)
+                for first in range(0, x.size, GRID_CHUNK):
+                    if is_cancelled():
+                        return []
+                    y[first:first + GRID_CHUNK] = evaluate_on_grid(f, x[first:first + GRID_CHUNK])
 
-            return intervals
+            indices = sign_change_indices(f, x, y)
+            return [(float(x[i]), float(x[i + 1])) for i in indices]
 
         except Exception as e:
             print(f"Error buscando intervalos: {e}")
@@ -262,10 +597,7 @@ class MathMethods:
         Evalúa la función en un punto específico.
         """
         try:
-            x = sp.Symbol("x")
-            equation_processed = self._process_equation_for_sympy(self.equation_text)
-            expr = sp.sympify(equation_processed)
-            f = sp.lambdify(x, expr, "numpy")
+            f = self._compile().f
             return f(x_value)
         except Exception as e:
             print(f"Error evaluando función en x={x_value}: {e}")
@@ -279,17 +611,13 @@ class MathMethods:
             if not self.equation_text.strip():
                 return {"valid": False, "error": "La ecuación está vacía"}
 
-            x = sp.Symbol("x")
-            equation_processed = self._process_equation_for_sympy(self.equation_text)
-            expr = sp.sympify(equation_processed)
-
-            f = sp.lambdify(x, expr, "numpy")
-            test_value = f(1.0)
+            compiled = self._compile()
+            test_value = compiled.f(1.0)
 
             return {
                 "valid": True,
-                "processed_equation": equation_processed,
-                "sympy_expression": str(expr),
+                "processed_equation": compiled.key,
+                "sympy_expression": str(compiled.expr),
             }
 
         except Exception as e:
@@ -302,6 +630,36 @@ class MathMethods:
         """
         return {}
     
+    def resolve_open_method(self, method: str) -> str:
+        """
+        Retorna el método abierto que realmente se usará. Si se pide Newton-Raphson
+        pero la derivada es costosa de construir o crece demasiado, se cambia a
+        la secante, que no necesita derivar.
+        """
+        if method == "newton" and not self._compile().derivative_is_practical:
+            return "secante"
+        return method
+
+    def solve_open(
+        self,
+        method: str,
+        seeds: List[float],
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+        record_iterations: bool = True,
+        is_cancelled=None,
+    ) -> List[Dict]:
+        """
+        Resuelve desde cada valor inicial con el método abierto indicado por la
+        clave 'method' de la configuración.
+        """
+        solvers = {
+            "newton": self.newton_batch,
+            "secante": self.secant_batch,
+            "steffensen": self.steffensen_batch,
+        }
+        return solvers[method](seeds, tolerance, max_iterations, record_iterations, is_cancelled)
+
     def newton_raphson_method(
         self, x0: float, tolerance: float = 1e-6, max_iterations: int = 100
     ) -> Dict:
@@ -316,112 +674,498 @@ class MathMethods:
         Returns:
             Dict: Diccionario con los resultados del método y los datos de las iteraciones.
         """
-        iterations_data = []
+        return self.newton_batch([x0], tolerance, max_iterations)[0]
+
+    def newton_batch(
+        self,
+        seeds: List[float],
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+        record_iterations: bool = True,
+        is_cancelled=None,
+    ) -> List[Dict]:
+        """
+        Aplica Newton-Raphson a todos los valores iniciales a la vez usando
+        arreglos de numpy. Cada valor inicial se detiene por separado cuando
+        converge, cuando su derivada se anula o cuando la iteración diverge.
+
+        Args:
+            seeds: Lista de valores iniciales
+            tolerance (float): Tolerancia para la convergencia
+            max_iterations (int): Número máximo de iteraciones
+            record_iterations (bool): Si es False no se generan los datos de
+                iteraciones, útil con mallas densas de valores iniciales
+            is_cancelled: Función opcional que se revisa en cada iteración;
+                si retorna True se dejan de iterar los valores activos
+
+        Returns:
+            List[Dict]: Un diccionario de resultados por valor inicial, con el
+            mismo formato que newton_raphson_method.
+        """
+        if len(seeds) == 0:
+            return []
+
         try:
-            # Parsear la ecuación usando sympy
-            x = sp.Symbol("x")
-            equation_processed = self._process_equation_for_sympy(self.equation_text)
-            expr = sp.sympify(equation_processed)
-            
-            # Calcular la derivada
-            expr_prime = sp.diff(expr, x)
-            
-            # Crear funciones lambda
-            f = sp.lambdify(x, expr, "numpy")
-            f_prime = sp.lambdify(x, expr_prime, "numpy")
-            
-            # Algoritmo de Newton-Raphson
-            iteration = 0
-            x_current = x0
-            error = float('inf')
-            
-            while iteration < max_iterations:
-                iteration += 1
-                
-                fx = f(x_current)
-                fpx = f_prime(x_current)
-                
-                # Verificar si la derivada es cero
-                if abs(fpx) < 1e-12:
-                    return {
-                        "success": False,
-                        "error": f"La derivada es cero en x = {x_current:.6f}. No se puede continuar.",
-                        "iterations": iteration,
-                        "root": None,
-                        "final_error": error,
-                        "iterations_data": iterations_data,
-                    }
-                
-                # Calcular siguiente valor
-                x_next = x_current - fx / fpx
-                error = abs(x_next - x_current)
-                
-                iteration_data = {
-                    "iteration": iteration,
-                    "x": x_current,
-                    "f_x": fx,
-                    "f_prime_x": fpx,
-                    "x_next": x_next,
-                    "error": error,
-                }
-                iterations_data.append(iteration_data)
-                
-                # Verificar convergencia
-                if abs(fx) < tolerance or error < tolerance:
-                    return {
-                        "success": True,
-                        "root": x_next,
-                        "iterations": iteration,
-                        "final_error": error,
-                        "function_value": f(x_next),
-                        "message": f"Raíz encontrada en x = {x_next:.8f} después de {iteration} iteraciones",
-                        "iterations_data": iterations_data,
-                    }
-                
-                x_current = x_next
-            
-            return {
-                "success": False,
-                "error": f"No se alcanzó la convergencia después de {max_iterations} iteraciones",
-                "iterations": max_iterations,
-                "root": x_current,
-                "final_error": error,
-                "iterations_data": iterations_data,
-            }
-        
+            # Obtener la ecuación y su derivada desde la caché
+            compiled = self._compile()
+            f_prime = compiled.f_prime
+
+            def slope(idx, x, fx):
+                return evaluate_on_grid(f_prime, x)
+
+            return self._open_method_batch(
+                compiled.f, seeds, slope, "La derivada es cero",
+                tolerance, max_iterations, record_iterations, is_cancelled
+            )
+
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Error en el cálculo: {str(e)}",
-                "iterations": 0,
-                "root": None,
-                "final_error": 0.0,
-                "iterations_data": iterations_data,
-            }
+            return [self._error_result(f"Error en el cálculo: {str(e)}") for _ in seeds]
 
+    def secant_method(
+        self, x0: float, tolerance: float = 1e-6, max_iterations: int = 100
+    ) -> Dict:
+        """
+        Implementa el método de la secante, que aproxima la derivada con la
+        pendiente entre las dos últimas aproximaciones. No requiere derivar.
 
-    def populate_table_newton(self, table_widget, iterations_data):
+        Args:
+            x0 (float): Valor inicial
+            tolerance (float): Tolerancia para la convergencia
+            max_iterations (int): Número máximo de iteraciones
+
+        Returns:
+            Dict: Diccionario con los resultados del método y los datos de las
+            iteraciones, en el mismo formato que newton_raphson_method.
+        """
+        return self.secant_batch([x0], tolerance, max_iterations)[0]
+
+    def secant_batch(
+        self,
+        seeds: List[float],
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+        record_iterations: bool = True,
+        is_cancelled=None,
+    ) -> List[Dict]:
         """
-        Agrega filas a la tabla de la interfaz con los datos de Newton-Raphson.
-        No limpia la tabla, simplemente añade las nuevas filas al final.
+        Aplica el método de la secante a todos los valores iniciales a la vez.
+        El segundo punto de cada secante se toma a un paso pequeño de x0.
         """
-        if not iterations_data:
-            return
-        
-        current_row_count = table_widget.rowCount()
-        table_widget.setRowCount(current_row_count + len(iterations_data))
-        
-        for i, data in enumerate(iterations_data):
-            row_index = current_row_count + i
-            table_widget.setItem(row_index, 0, self._create_table_item(str(data["iteration"])))
-            table_widget.setItem(row_index, 1, self._create_table_item(f"{data['x']:.6f}"))
-            table_widget.setItem(row_index, 2, self._create_table_item(f"{data['f_x']:.6f}"))
-            table_widget.setItem(row_index, 3, self._create_table_item(f"{data['f_prime_x']:.6f}"))
-            table_widget.setItem(row_index, 4, self._create_table_item(f"{data['x_next']:.6f}"))
-            table_widget.setItem(row_index, 5, self._create_table_item(f"{data['error']:.6f}"))
-        
-        table_widget.resizeColumnsToContents()
+        if len(seeds) == 0:
+            return []
+
+        try:
+            f = self._compile().f
+
+            x0 = np.array(seeds, dtype=float)
+            x_prev = x0 + 1e-4 * np.maximum(1.0, np.abs(x0))
+            f_prev = evaluate_on_grid(f, x_prev)
+
+            def slope(idx, x, fx):
+                with np.errstate(all="ignore"):
+                    slopes = (fx - f_prev[idx]) / (x - x_prev[idx])
+                x_prev[idx] = x
+                f_prev[idx] = fx
+                return slopes
+
+            return self._open_method_batch(
+                f, seeds, slope, "La pendiente de la secante es cero",
+                tolerance, max_iterations, record_iterations, is_cancelled
+            )
+
+        except Exception as e:
+            return [self._error_result(f"Error en el cálculo: {str(e)}") for _ in seeds]
+
+    def steffensen_method(
+        self, x0: float, tolerance: float = 1e-6, max_iterations: int = 100
+    ) -> Dict:
+        """
+        Implementa el método de Steffensen, que aproxima la derivada con
+        (f(x + f(x)) - f(x)) / f(x). Converge cuadráticamente sin derivar.
+
+        Args:
+            x0 (float): Valor inicial
+            tolerance (float): Tolerancia para la convergencia
+            max_iterations (int): Número máximo de iteraciones
+
+        Returns:
+            Dict: Diccionario con los resultados del método y los datos de las
+            iteraciones, en el mismo formato que newton_raphson_method.
+        """
+        return self.steffensen_batch([x0], tolerance, max_iterations)[0]
+
+    def steffensen_batch(
+        self,
+        seeds: List[float],
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+        record_iterations: bool = True,
+        is_cancelled=None,
+    ) -> List[Dict]:
+        """Aplica el método de Steffensen a todos los valores iniciales a la vez"""
+        if len(seeds) == 0:
+            return []
+
+        try:
+            f = self._compile().f
+
+            def slope(idx, x, fx):
+                # Lejos de la raíz f(x) es grande; se limita el paso para que
+                # la pendiente siga siendo local
+                h_max = 1e-2 * np.maximum(1.0, np.abs(x))
+                h = np.clip(fx, -h_max, h_max)
+                with np.errstate(all="ignore"):
+                    return (evaluate_on_grid(f, x + h) - fx) / h
+
+            return self._open_method_batch(
+                f, seeds, slope, "La pendiente de Steffensen es cero",
+                tolerance, max_iterations, record_iterations, is_cancelled
+            )
+
+        except Exception as e:
+            return [self._error_result(f"Error en el cálculo: {str(e)}") for _ in seeds]
+
+    def _open_method_batch(
+        self,
+        f,
+        seeds: List[float],
+        slope,
+        zero_slope_message: str,
+        tolerance: float,
+        max_iterations: int,
+        record_iterations: bool,
+        is_cancelled=None,
+    ) -> List[Dict]:
+        """
+        Motor común de los métodos abiertos: x_next = x - f(x) / pendiente.
+        La función slope(idx, x, fx) retorna la pendiente de cada valor activo
+        (la derivada en Newton, o su aproximación en secante y Steffensen).
+        Si is_cancelled retorna True, los valores que siguen activos se
+        reportan como no convergidos.
+        """
+        x = np.array(seeds, dtype=float)
+        count = x.size
+        results = [None] * count
+        active = np.ones(count, dtype=bool)
+        converged = np.zeros(count, dtype=bool)
+        error = np.full(count, np.inf)
+        iterations = np.zeros(count, dtype=int)
+        history = []
+
+        for iteration in range(1, max_iterations + 1):
+            idx = np.flatnonzero(active)
+            if idx.size == 0 or (is_cancelled is not None and is_cancelled()):
+                break
+
+            x_i = x[idx]
+            fx = evaluate_on_grid(f, x_i)
+            fpx = slope(idx, x_i, fx)
+
+            # Verificar si la pendiente es cero (f(x) = 0 exacto ya es una raíz)
+            zero_slope = (np.abs(fpx) < 1e-12) & (fx != 0)
+            for i, x_zero in zip(idx[zero_slope], x_i[zero_slope]):
+                results[i] = {
+                    "success": False,
+                    "error": f"{zero_slope_message} en x = {x_zero:.6f}. No se puede continuar.",
+                    "iterations": iteration,
+                    "root": None,
+                    "final_error": float(error[i]),
+                }
+            active[idx[zero_slope]] = False
+
+            keep = ~zero_slope
+            idx, x_i, fx, fpx = idx[keep], x_i[keep], fx[keep], fpx[keep]
+
+            # Calcular siguiente valor
+            with np.errstate(all="ignore"):
+                x_next = np.where(fx == 0, x_i, x_i - fx / fpx)
+            error_i = np.abs(x_next - x_i)
+
+            if record_iterations:
+                history.append((idx, x_i, fx, fpx, x_next, error_i))
+            error[idx] = error_i
+            iterations[idx] = iteration
+            x[idx] = x_next
+
+            # Verificar convergencia
+            done = (np.abs(fx) < tolerance) | (error_i < tolerance)
+            converged[idx[done]] = True
+            active[idx[done]] = False
+
+            diverged = ~done & ~np.isfinite(x_next)
+            for i, x_bad in zip(idx[diverged], x_i[diverged]):
+                results[i] = {
+                    "success": False,
+                    "error": f"La iteración diverge a partir de x = {x_bad:.6f}.",
+                    "iterations": iteration,
+                    "root": None,
+                    "final_error": float(error[i]),
+                }
+            active[idx[diverged]] = False
+
+        iterations_data = self._unpack_open_history(history, count)
+        function_values = evaluate_on_grid(f, x)
+
+        for i in range(count):
+            if results[i] is not None:
+                results[i]["iterations_data"] = iterations_data[i]
+            elif converged[i]:
+                root = float(x[i])
+                results[i] = {
+                    "success": True,
+                    "root": root,
+                    "iterations": int(iterations[i]),
+                    "final_error": float(error[i]),
+                    "function_value": float(function_values[i]),
+                    "message": f"Raíz encontrada en x = {root:.8f} después de {iterations[i]} iteraciones",
+                    "iterations_data": iterations_data[i],
+                }
+            else:
+                results[i] = {
+                    "success": False,
+                    "error": f"No se alcanzó la convergencia después de {max_iterations} iteraciones",
+                    "iterations": max_iterations,
+                    "root": float(x[i]),
+                    "final_error": float(error[i]),
+                    "iterations_data": iterations_data[i],
+                }
+
+        return results
+
+    def _unpack_open_history(self, history, count: int) -> List[List[Dict]]:
+        """
+        Convierte el historial por columnas de newton_batch en la lista
+        de iteraciones de cada valor inicial, en el formato que usa la tabla.
+        """
+        iterations_data = [[] for _ in range(count)]
+
+        for iteration, (idx, x, fx, fpx, x_next, error) in enumerate(history, start=1):
+            columns = zip(idx.tolist(), x.tolist(), fx.tolist(), fpx.tolist(),
+                          x_next.tolist(), error.tolist())
+            for i, x_i, fx_i, fpx_i, x_next_i, error_i in columns:
+                iterations_data[i].append({
+                    "iteration": iteration,
+                    "x": x_i,
+                    "f_x": fx_i,
+                    "f_prime_x": fpx_i,
+                    "x_next": x_next_i,
+                    "error": error_i,
+                })
+
+        return iterations_data
+
+    def solve_polynomial(
+        self,
+        start: float = -100,
+        end: float = 100,
+        tolerance: float = 1e-6,
+        max_iterations: int = 100,
+        polish: bool = True,
+        is_cancelled=None,
+    ) -> Optional[List[Dict]]:
+        """
+        Ruta rápida para polinomios: obtiene todas las raíces como valores propios
+        de la matriz compañera (np.roots) y las pule con Newton-Raphson. Encuentra
+        también las raíces múltiples, donde f no cambia de signo.
+
+        Args:
+            start: Inicio del rango en el que se reportan raíces
+            end: Fin del rango en el que se reportan raíces
+            tolerance (float): Tolerancia para la convergencia del pulido
+            max_iterations (int): Número máximo de iteraciones del pulido
+            polish (bool): Si es False se reportan los valores propios sin pulir
+            is_cancelled: Función opcional que se revisa durante el pulido; si
+                retorna True se retorna una lista vacía. El cálculo de los
+                valores propios no se puede interrumpir
+
+        Returns:
+            Optional[List[Dict]]: None si la ecuación no es un polinomio; si lo es,
+            un diccionario por raíz real, ordenadas de menor a mayor, con el mismo
+            formato que newton_raphson_method. Si el pulido de un valor propio
+            real falla, su diccionario tiene success en False.
+        """
+        try:
+            compiled = self._compile()
+        except Exception:
+            return None
+
+        if not compiled.is_polynomial:
+            return None
+
+        coefficients = np.trim_zeros(compiled.coefficients, "f")
+        if coefficients.size < 2:
+            return []
+
+        # Valores propios de la matriz compañera. Una raíz de multiplicidad m
+        # aparece como m valores propios muy cercanos, a veces con una parte
+        # imaginaria pequeña comparada con la raíz
+        eigenvalues = np.roots(coefficients)
+        eigenvalues = eigenvalues[
+            np.abs(eigenvalues.imag) <= MULTIPLICITY_RTOL * np.abs(eigenvalues)
+        ]
+        eigenvalues = eigenvalues[np.argsort(eigenvalues.real)]
+        rtol = MULTIPLICITY_RTOL
+        groups = self._group_eigenvalues(eigenvalues.real, np.arange(eigenvalues.size), rtol)
+
+        if not polish:
+            estimates = []
+            for group in groups:
+                root = float(eigenvalues.real[group].mean())
+                estimates.append({
+                    "success": True,
+                    "root": root,
+                    "iterations": 0,
+                    "final_error": 0.0,
+                    "function_value": float(np.polyval(coefficients, root)),
+                    "message": f"Raíz encontrada en x = {root:.8f} como valor propio de la matriz compañera",
+                    "iterations_data": [],
+                })
+            return [
+                estimate for estimate in estimates if start <= estimate["root"] <= end
+            ]
+
+        # Cada grupo se pule como una raíz de su multiplicidad. Si el resultado no
+        # anula el polinomio, el grupo mezclaba raíces distintas muy cercanas y se
+        # vuelve a agrupar con una distancia diez veces menor, hasta que cada
+        # valor propio se pule por su cuenta
+        roots, failures = [], []
+        while groups:
+            retry = []
+            for multiplicity in sorted({group.size for group in groups}):
+                if is_cancelled is not None and is_cancelled():
+                    return []
+                same = [group for group in groups if group.size == multiplicity]
+                centers = [eigenvalues.real[group].mean() for group in same]
+                polished = self._polish_polynomial_roots(
+                    coefficients, centers, multiplicity, tolerance, max_iterations, is_cancelled
+                )
+                for group, result in zip(same, polished):
+                    if result["success"]:
+                        roots.append(result)
+                    elif multiplicity > 1:
+                        retry.extend(group.tolist())
+                    else:
+                        failures.append((group[0], result))
+
+            rtol /= 10
+            if rtol < np.finfo(float).eps:
+                rtol = 0.0
+            groups = self._group_eigenvalues(eigenvalues.real, np.array(retry, dtype=int), rtol)
+
+        # Dos valores propios pulidos por separado pueden llegar a la misma raíz
+        roots.sort(key=lambda result: result["root"])
+        unique = []
+        for result in roots:
+            if unique and abs(result["root"] - unique[-1]["root"]) <= tolerance * abs(result["root"]):
+                continue
+            unique.append(result)
+
+        # Un valor propio con parte imaginaria que no se pudo pulir es, casi
+        # siempre, un par complejo cercano al eje real y no una raíz
+        for index, result in failures:
+            if eigenvalues[index].imag == 0:
+                result["root"] = float(eigenvalues.real[index])
+                unique.append(result)
+
+        unique.sort(key=lambda result: result["root"])
+        return [result for result in unique if start <= result["root"] <= end]
+
+    def _group_eigenvalues(self, values: np.ndarray, indices: np.ndarray, rtol: float) -> List[np.ndarray]:
+        """
+        Agrupa los índices (de valores ordenados) cuyos valores propios pueden
+        ser una misma raíz múltiple. La distancia se mide contra el primero de
+        cada grupo y es relativa a la magnitud de la raíz, no una separación
+        fija. Con rtol = 0 cada valor propio queda en su propio grupo.
+        """
+        groups = []
+        first = 0
+        for i in range(1, indices.size + 1):
+            if i == indices.size or rtol == 0 or abs(values[indices[i]] - values[indices[first]]) > rtol * max(
+                abs(values[indices[i]]), abs(values[indices[first]])
+            ):
+                groups.append(indices[first:i])
+                first = i
+        return groups
+
+    def _polish_polynomial_roots(
+        self,
+        coefficients: np.ndarray,
+        starts,
+        multiplicity: int,
+        tolerance: float,
+        max_iterations: int,
+        is_cancelled=None,
+    ) -> List[Dict]:
+        """
+        Pule raíces de la misma multiplicidad m con Newton-Raphson sobre la
+        derivada m-1 del polinomio, donde la raíz es simple y la convergencia
+        vuelve a ser cuadrática. Con m > 1 solo se acepta el resultado si
+        también anula el polinomio y sus derivadas menores (hasta el error de
+        redondeo).
+        """
+        target = coefficients
+        for _ in range(multiplicity - 1):
+            target = np.polyder(target)
+        derivative = np.polyder(target)
+
+        def f(x):
+            return np.polyval(target, x)
 
+        def slope(idx, x, fx):
+            return np.polyval(derivative, x)
+
+        results = self._open_method_batch(
+            f, list(starts), slope, "La derivada es cero",
+            tolerance, max_iterations, True, is_cancelled
+        )
+
+        # El polinomio y sus derivadas hasta la m-2 también deben anularse
+        lower = [coefficients]
+        for _ in range(multiplicity - 2):
+            lower.append(np.polyder(lower[-1]))
+
+        for result in results:
+            if not result["success"]:
+                continue
+            root = result["root"]
+            result["function_value"] = float(np.polyval(coefficients, root))
+            if multiplicity == 1:
+                continue
+            # Comparar contra la cota del error de redondeo de cada evaluación
+            vanishes = all(
+                abs(np.polyval(c, root)) <= 1e-12 * np.polyval(np.abs(c), abs(root))
+                for c in lower
+            )
+            if not vanishes:
+                result["success"] = False
+                result["error"] = f"Los valores propios cercanos a x = {root:.8f} no forman una raíz múltiple"
+            else:
+                result["multiplicity"] = multiplicity
+                result["message"] = (
+                    f"Raíz de multiplicidad {multiplicity} encontrada en x = {root:.8f} "
+                    f"después de {result['iterations']} iteraciones"
+                )
+        return results
+
+    def cluster_roots(self, roots: List[float], tolerance: float = 0.01) -> List[int]:
+        """
+        Descarta raíces duplicadas: recorre las raíces en el orden de sus
+        valores iniciales y acepta cada una solo si está a 'tolerance' o más de
+        todas las raíces ya aceptadas. Las aceptadas se guardan ordenadas, así
+        que basta comparar contra sus dos vecinas en lugar de contra todas.
+
+        Returns:
+            List[int]: Índices (en el orden original) de las raíces aceptadas.
+        """
+        accepted = []
+        indices = []
+        for index, root in enumerate(roots):
+            position = bisect.bisect_left(accepted, root)
+            neighbours = accepted[max(position - 1, 0):position + 1]
+            if all(abs(root - value) >= tolerance for value in neighbours):
+                accepted.insert(position, root)
+                indices.append(index)
+        return indices
 
     def find_suitable_initial_values(
         self, start: float = -10, end: float = 10, step: float = 1.0, num_values: int = 5
@@ -440,37 +1184,179 @@ class MathMethods:
             Lista de valores iniciales prometedores
         """
         try:
-            x = sp.Symbol("x")
-            equation_processed = self._process_equation_for_sympy(self.equation_text)
-            expr = sp.sympify(equation_processed)
-            f = sp.lambdify(x, expr, "numpy")
-            
-            candidates = []
-            current = start
-            
-            while current < end:
-                try:
-                    fx = f(current)
-                    # Buscar puntos donde f(x) está cerca de cero
-                    if abs(fx) < 10:  # Umbral ajustable
-                        candidates.append((current, abs(fx)))
-                    
-                    # Buscar cambios de signo
-                    if current + step < end:
-                        fx_next = f(current + step)
-                        if np.sign(fx) != np.sign(fx_next):
-                            mid = (current + current + step) / 2
-                            candidates.append((mid, abs(f(mid))))
-                            
-                except (ZeroDivisionError, ValueError, OverflowError):
-                    pass
-                
-                current += step
-            
+            f = self._compile().f
+
+            if step <= 0 or end <= start:
+                return [0.0]
+
+            num_steps = int(np.ceil((end - start) / step - 1e-9))
+            x = start + step * np.arange(num_steps)
+            y = evaluate_on_grid(f, x)
+
+            # Buscar puntos donde f(x) está cerca de cero
+            near_zero = np.abs(y) < 10  # Umbral ajustable
+
+            # Buscar cambios de signo
+            sign_change = np.flatnonzero(np.sign(y[:-1]) != np.sign(y[1:]))
+            mid = (x[sign_change] + x[sign_change + 1]) / 2
+
+            values = np.concatenate((x[near_zero], mid))
+            distances = np.concatenate((np.abs(y[near_zero]), np.abs(evaluate_on_grid(f, mid))))
+            finite = np.isfinite(distances)
+
             # Ordenar por cercanía a cero y retornar los mejores
-            candidates.sort(key=lambda x: x[1])
-            return [x[0] for x in candidates[:num_values]]
-            
+            order = np.argsort(distances[finite], kind="stable")[:num_values]
+            return values[finite][order].tolist()
+
         except Exception as e:
             print(f"Error buscando valores iniciales: {e}")
-            return [0.0]  # Valor por defecto
\ No newline at end of file
+            return [0.0]  # Valor por defecto
+
+    def auto_solve(
+        self,
+        settings: Dict,
+        on_method=None,
+        on_result=None,
+        on_progress=None,
+        is_cancelled=None,
+        chunk_size: int = 256,
+    ) -> Dict:
+        """
+        Busca y resuelve todas las raíces de la ecuación actual según la
+        configuración (las mismas claves que emite SettingsWidget). No toca
+        la interfaz: informa el avance a través de funciones opcionales.
+
+        Args:
+            settings: Configuración con 'method', 'tolerance', 'max_iterations',
+                'interval_start', 'interval_end', 'interval_step' y
+                'polynomial_fast_path'
+            on_method: Recibe la clave del método que realmente se usará, que
+                puede no ser la pedida (por ejemplo, secante en lugar de Newton)
+            on_result: Recibe cada diccionario de resultado en cuanto está listo
+            on_progress: Recibe mensajes de estado
+            is_cancelled: Retorna True cuando se debe abandonar la búsqueda. Se
+                revisa por bloques de la malla, en cada iteración de los
+                métodos abiertos y del pulido de polinomios, y entre cada
+                bloque de intervalos
+            chunk_size: Cantidad de intervalos que se resuelven entre cada
+                revisión de cancelación
+
+        Returns:
+            Dict: {"method", "requested_method", "method_name", "results",
+            "roots", "total_iterations", "cancelled", "message"}
+        """
+        on_method = on_method or (lambda method: None)
+        on_result = on_result or (lambda result: None)
+        on_progress = on_progress or (lambda message: None)
+        is_cancelled = is_cancelled or (lambda: False)
+
+        method = requested_method = settings['method']
+        tolerance = settings['tolerance']
+        max_iterations = settings['max_iterations']
+        start = settings['interval_start']
+        end = settings['interval_end']
+        step = settings['interval_step']
+
+        results = []
+        message = ""
+
+        # Ruta rápida: los polinomios se resuelven con la matriz compañera
+        polynomial_results = None
+        if settings.get('polynomial_fast_path', True):
+            polynomial_results = self.solve_polynomial(
+                start, end, tolerance, max_iterations, is_cancelled=is_cancelled
+            )
+
+        if polynomial_results is not None:
+            method = "polinomio"
+            on_method(method)
+            on_progress(f"Ecuación polinomial: se resuelve con {METHOD_NAMES[method]}")
+            for result in polynomial_results:
+                results.append(result)
+                on_result(result)
+            if not results:
+                message = "No se encontraron raíces en el rango especificado."
+
+        elif method in BRACKETED_METHODS:
+            on_method(method)
+            on_progress(f"Buscando intervalos automáticamente para {METHOD_NAMES[method]}...")
+            intervals = self.find_all_suitable_intervals(
+                start=start, end=end, step=step, is_cancelled=is_cancelled
+            )
+
+            if intervals:
+                on_progress(f"Se encontraron {len(intervals)} intervalos adecuados.")
+            else:
+                message = "No se encontraron raíces en el rango especificado."
+
+            for first in range(0, len(intervals), chunk_size):
+                if is_cancelled():
+                    break
+                chunk = intervals[first:first + chunk_size]
+                for result in self.solve_brackets(method, chunk, tolerance, max_iterations):
+                    results.append(result)
+                    on_result(result)
+
+        else:
+            method = self.resolve_open_method(method)
+            on_method(method)
+            if method != requested_method:
+                on_progress(
+                    f"La derivada es demasiado costosa; se usará {METHOD_NAMES[method]} "
+                    f"en lugar de {METHOD_NAMES[requested_method]}"
+                )
+            on_progress(f"Buscando valores iniciales para {METHOD_NAMES[method]}...")
+            seeds = self.find_suitable_initial_values(
+                start=start, end=end, step=step * 10, num_values=5
+            )
+
+            if not seeds:
+                message = "No se pudieron encontrar valores iniciales adecuados."
+            elif not is_cancelled():
+                on_progress(f"Se encontraron {len(seeds)} valores iniciales.")
+
+                # Todos los valores iniciales iteran juntos en una sola pasada;
+                # de las raíces repetidas se conserva la primera
+                attempts = self.solve_open(
+                    method, seeds, tolerance, max_iterations, is_cancelled=is_cancelled
+                )
+                successful = [result for result in attempts if result['success']]
+                unique_indices = self.cluster_roots(
+                    [result['root'] for result in successful], 0.01
+                )
+                if len(successful) > len(unique_indices):
+                    on_progress(f"{len(successful) - len(unique_indices)} raíces duplicadas, saltando...")
+
+                for index in unique_indices:
+                    results.append(successful[index])
+                    on_result(successful[index])
+
+                if not results:
+                    message = "No se encontraron raíces en el rango especificado."
+
+        return {
+            "method": method,
+            "requested_method": requested_method,
+            "method_name": METHOD_NAMES[method],
+            "results": results,
+            "roots": [result['root'] for result in results if result['success']],
+            "total_iterations": sum(result['iterations'] for result in results),
+            "cancelled": is_cancelled(),
+            "message": message,
+        }
+
+
+def compile_equation(equation: str) -> "CompiledExpression":
+    """
+    Retorna la expresión compilada de una ecuación escrita como en la interfaz.
+    La usan MathMethods y Graphic, así que ambos comparten la misma caché.
+
+    Raises:
+        EquationSyntaxError: Si el texto no es una ecuación válida
+    """
+    # sympy se importa aquí, la primera vez que se compila una ecuación
+    from .compiled_expression import expression_cache
+    from .equation_parser import parse_equation
+
+    expr = parse_equation(equation.strip())
+    return expression_cache.get(str(expr), expr)
\ No newline at end of file
@@ -1,21 +1,18 @@
-from PySide6.QtCore import QObject, Qt, QRect
-from PySide6.QtWidgets import (QFileDialog, QAbstractItemView, QTableWidgetItem,
+from PySide6.QtCore import QObject, Qt, QRect, QThreadPool
+from PySide6.QtWidgets import (QFileDialog, QAbstractItemView, QTableView,
                                QMessageBox, QDialog, QVBoxLayout, QLabel)
-from PySide6.QtGui import QPixmap, QColor, QPainter, QPen
+from PySide6.QtGui import QPixmap, QPainter, QPen
 import os
 import re
+from functools import partial
 
-from fpdf import FPDF, FPDFException
-from fpdf.errors import FPDFUnicodeEncodingException
-from .math_methods import MathMethods
+from .math_methods import MathMethods, METHOD_NAMES, BRACKETED_METHODS, DEFAULT_SETTINGS
 from .ocr_worker import OCRWorker
 from .voice_worker import VoiceWorker
+from .spoken_math import SpokenMathError, spoken_to_equation
+from .solver_worker import SolverWorker
+from .iterations_model import IterationsTableModel, BRACKETED_FIELDS, OPEN_FIELDS
 from ui.voice_indicator import VoiceIndicatorDialogAdvanced
-from ui.ui_about_v2 import Ui_Dialog
-
-from fpdf import FPDF
-# Asumiendo que custom_pdf.py existe y tiene estas clases
-from .custom_pdf import CustomPDF, create_report_cover
 
 class MathRootsController(QObject):
     """Controlador de la ventana principal MathRoots"""
@@ -27,21 +24,16 @@ class MathRootsController(QObject):
         self.main_window = main_window
         self.voice_worker = None
         self.voice_indicator = None
+        self.solver_worker = None
+        self.solver_method = None
+        self.solver_root_count = 0
         self.math_methods = MathMethods()
         self.graphics = None
         self.settings_widget = None
         self.history_widget = None
         self.ui.logo_header.setVisible(False)
 
-        self.settings = {
-            'method': 'biseccion',
-            'tolerance': 1e-6,
-            'max_iterations': 100,
-            'auto_interval': True,
-            'interval_start': -100,
-            'interval_end': 100,
-            'interval_step': 0.1,
-        }
+        self.settings = DEFAULT_SETTINGS.copy()
 
         self.setup_connections()
         self.setup_iterations_table()
@@ -118,16 +110,13 @@ class MathRootsController(QObject):
             print(f"Error al graficar: {e}")
 
     def setup_iterations_table(self):
+        self.iterations_model = IterationsTableModel(self)
+        
         if hasattr(self.ui, 'tabla_iteraciones'):
+            self._replace_iterations_widget()
             self.ui.tabla_iteraciones.horizontalHeader().setDefaultAlignment(Qt.AlignCenter)
             
-            if self.settings['method'] == 'biseccion':
-                headers = ['Iteración', '      xₗ', '     xᵣ', '     xₘ', '    f(xₗ)', '     f(xᵣ)', '     f(xₘ)', '  Error']
-            else:
-                headers = ['Iteración', '      xₗ', '     f(xₙ)', "     f'(xₙ)", '   xₙ₊₁', '  Error']
-            
-            self.ui.tabla_iteraciones.setColumnCount(len(headers))
-            self.ui.tabla_iteraciones.setHorizontalHeaderLabels(headers)
+            self.update_table_headers_for_method()
             
             self.ui.tabla_iteraciones.setAlternatingRowColors(True)
             self.ui.tabla_iteraciones.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -135,22 +124,48 @@ class MathRootsController(QObject):
             
             print(f"Tabla de iteraciones configurada para método: {self.settings['method']}")
 
-    def update_table_headers_for_method(self):
+    def _replace_iterations_widget(self):
+        """
+        Cambia el QTableWidget generado por Qt Designer por un QTableView
+        con la misma geometría, conectado al modelo de iteraciones.
+        """
+        old_table = self.ui.tabla_iteraciones
+        parent = old_table.parentWidget()
+        
+        table = QTableView(parent)
+        table.setObjectName(old_table.objectName())
+        table.setGeometry(old_table.geometry())
+        table.setPalette(old_table.palette())
+        table.setSizeAdjustPolicy(old_table.sizeAdjustPolicy())
+        table.setShowGrid(old_table.showGrid())
+        table.setModel(self.iterations_model)
+        
+        if parent is not None and parent.layout() is not None:
+            parent.layout().replaceWidget(old_table, table)
+        
+        old_table.hide()
+        old_table.deleteLater()
+        table.show()
+        self.ui.tabla_iteraciones = table
+
+    def update_table_headers_for_method(self, method=None):
         if not hasattr(self.ui, 'tabla_iteraciones'):
             return
         
-        if self.settings['method'] == 'biseccion':
+        method = method or self.settings['method']
+        if method in BRACKETED_METHODS:
             headers = ['Iteración', '      xₗ', '      xᵣ', '      xₘ', '      f(xₗ)', '      f(xᵣ)', '      f(xₘ)', '   Error']
+            fields = BRACKETED_FIELDS
         else:
             headers = ['Iteración', '      xₙ', '      f(xₙ)', "      f'(xₙ)", '     xₙ₊₁', '  Error']
+            fields = OPEN_FIELDS
         
-        self.ui.tabla_iteraciones.setColumnCount(len(headers))
-        self.ui.tabla_iteraciones.setHorizontalHeaderLabels(headers)
-        print(f"Encabezados de tabla actualizados para método: {self.settings['method']}")
+        self.iterations_model.set_columns(headers, fields)
+        print(f"Encabezados de tabla actualizados para método: {method}")
 
     def clear_iterations_table(self):
         if hasattr(self.ui, 'tabla_iteraciones'):
-            self.ui.tabla_iteraciones.setRowCount(0)
+            self.iterations_model.clear()
             self.math_methods.clear_iterations()
             print("Tabla de iteraciones limpiada")
 
@@ -618,6 +633,9 @@ class MathRootsController(QObject):
             self.voice_worker = None
 
     def cleanup(self):
+        self._cancel_solver_worker()
+        QThreadPool.globalInstance().waitForDone(2000)
+        
         if self.ocr_worker and self.ocr_worker.isRunning():
             self.ocr_worker.quit()
             self.ocr_worker.wait()
@@ -636,17 +654,12 @@ class MathRootsController(QObject):
         return re.sub(r'\^\{(.*?)\}', r'^\1', latex_string)
 
     def _process_voice_text(self, text: str) -> str:
-        processed_text = text.lower()
-        processed_text = processed_text.replace("más", "+")
-        processed_text = processed_text.replace("menos", "-")
-        processed_text = processed_text.replace("por", "*")
-        processed_text = processed_text.replace("entre", "/")
-        processed_text = processed_text.replace("igual a", "=")
-        processed_text = processed_text.replace("raíz cuadrada", "\\sqrt")
-        processed_text = re.sub(r'(\w+)\s+cuadrada', r'\1^2', processed_text)
-        processed_text = re.sub(r'(\w+)\s+cúbica', r'\1^3', processed_text)
-        processed_text = re.sub(r'(\w)\s*cuadrada', r'\1^2', processed_text)
-        return processed_text
+        try:
+            return spoken_to_equation(text)
+        except SpokenMathError as e:
+            # Se deja el texto dictado en la entrada para que el usuario lo corrija
+            print(f"No se pudo interpretar la frase: {e}")
+            return text
 
     def auto_find_and_solve(self):
         try:
@@ -654,6 +667,9 @@ class MathRootsController(QObject):
                 print("No hay ecuación para resolver")
                 return
             
+            # Una nueva ecuación cancela la búsqueda que esté en curso
+            self._cancel_solver_worker()
+            
             self.clear_iterations_table()
             
             if hasattr(self.ui, 'result_roots'):
@@ -666,186 +682,113 @@ class MathRootsController(QObject):
             print(f"Método seleccionado: {method.upper()}")
             print(f"Tolerancia: {tolerance}, Max Iteraciones: {max_iterations}")
             
-            if method == 'biseccion':
-                self._solve_with_bisection(tolerance, max_iterations)
-            else:
-                self._solve_with_newton(tolerance, max_iterations)
+            worker = SolverWorker(self.math_methods.equation, self.settings)
+            worker.signals.method.connect(partial(self._on_solver_method, worker))
+            worker.signals.result.connect(partial(self._on_solver_result, worker))
+            worker.signals.finished.connect(partial(self._on_solver_finished, worker))
+            worker.signals.error.connect(partial(self._on_solver_error, worker))
+            worker.signals.progress.connect(self._on_solver_progress)
+            
+            self.solver_worker = worker
+            self.solver_method = method
+            self.solver_root_count = 0
+            QThreadPool.globalInstance().start(worker)
                 
         except Exception as e:
             print(f"Error en búsqueda automática: {e}")
             if hasattr(self.ui, 'result_roots'):
                 self.ui.result_roots.append(f"Error: {str(e)}")
 
-    def _solve_with_bisection(self, tolerance, max_iterations):
-        """Método de bisección modificado para guardar en historial"""
-        print("Buscando intervalos automáticamente para Bisección...")
+    def _on_solver_progress(self, message):
+        print(message)
+
+    def _on_solver_method(self, worker, method):
+        if worker is not self.solver_worker:
+            return
         
-        if self.settings['auto_interval']:
-            start = self.settings['interval_start']
-            end = self.settings['interval_end']
-            step = self.settings['interval_step']
-        else:
-            start = self.settings['interval_start']
-            end = self.settings['interval_end']
-            step = self.settings['interval_step']
+        if method != self.solver_method and method != "polinomio":
+            # Se pidió Newton-Raphson, pero la derivada no es práctica
+            if hasattr(self.ui, 'result_roots'):
+                self.ui.result_roots.append(
+                    f"Se usa {METHOD_NAMES[method]} en lugar de {METHOD_NAMES[self.solver_method]}"
+                )
         
-        all_intervals = self.math_methods.find_all_suitable_intervals(
-            start=start, end=end, step=step
-        )
+        self.solver_method = method
+        self.update_table_headers_for_method(method)
+
+    def _on_solver_result(self, worker, result):
+        """Muestra cada raíz en cuanto el worker la termina"""
+        if worker is not self.solver_worker:
+            return
         
-        found_roots = []  # NUEVO: Lista para almacenar raíces
-        total_iterations = 0  # NUEVO: Contador de iteraciones
+        self.solver_root_count += 1
+        if result['root'] is not None:
+            self._append_root_result(self.solver_root_count, result)
         
-        if all_intervals:
-            print(f"Se encontraron {len(all_intervals)} intervalos adecuados.")
-            
-            for i, interval in enumerate(all_intervals):
-                a, b = interval
-                print(f"Resolviendo raíz #{i+1} en [{a:.2f}, {b:.2f}]")
-                
-                result = self.math_methods.bisection_method(a, b, tolerance, max_iterations)
-                
-                if result['success']:
-                    found_roots.append(result['root'])  # NUEVO: Guardar raíz
-                
-                total_iterations += result['iterations']  # NUEVO: Sumar iteraciones
-                
-                if hasattr(self.ui, 'result_roots'):
-                    self.ui.result_roots.append(f"<b style='color: #828282;'>Raíz {i+1}</b>")
-                    self.ui.result_roots.append(f"  ●  <b>Raíz</b>: {result['root']:.8f}")
-                    self.ui.result_roots.append(f"  ●  <b>Iteraciones</b>: {result['iterations']}")
-                    self.ui.result_roots.append(f"  ●  <b>Error</b>: {result['final_error']:.20f}")
-                    self.ui.result_roots.append("<br>")
-                    self.ui.result_roots.verticalScrollBar().setValue(0)
-                
-                if result['success'] or (not result['success'] and result['iterations'] > 0):
-                    self.math_methods.populate_table_rows(
-                        self.ui.tabla_iteraciones, result['iterations_data']
-                    )
-                    
-                    if i < len(all_intervals) - 1:
-                        self._add_table_separator()
-                
-                if result['success']:
-                    print(f"  > {result['message']}")
-                else:
-                    print(f"  > {result['error']}")
-            
-            # NUEVO: Guardar en historial si se encontraron raíces
-            if found_roots and self.history_widget is not None:
-                self.history_widget.add_history_entry(
-                    equation=self.math_methods.equation,
-                    method='Bisección',
-                    roots=found_roots,
-                    iterations=total_iterations,
-                    settings=self.settings.copy()
-                )
-                print(f"Entrada guardada en historial: {len(found_roots)} raíces encontradas")
+        if result['iterations_data']:
+            if self.iterations_model.rowCount() > 0:
+                self.iterations_model.append_separator()
             
-            self.ui.resultados.setCurrentIndex(1)
+            self.iterations_model.append_iterations(result['iterations_data'])
+        
+        if result['success']:
+            print(f"  > {result['message']}")
         else:
-            print("No se encontraron intervalos adecuados.")
-            if hasattr(self.ui, 'result_roots'):
-                self.ui.result_roots.append("No se encontraron raíces en el rango especificado.")
-
+            print(f"  > {result['error']}")
 
-    def _solve_with_newton(self, tolerance, max_iterations):
-        """Método de Newton-Raphson modificado para guardar en historial"""
-        print("Buscando valores iniciales para Newton-Raphson...")
+    def _on_solver_finished(self, worker, summary):
+        """Guarda en el historial el resultado de la búsqueda"""
+        if worker is not self.solver_worker:
+            return
         
-        if self.settings['auto_interval']:
-            start = self.settings['interval_start']
-            end = self.settings['interval_end']
-            step = self.settings['interval_step'] * 10
-        else:
-            start = self.settings['interval_start']
-            end = self.settings['interval_end']
-            step = self.settings['interval_step'] * 10
+        self.solver_worker = None
+        found_roots = summary['roots']
         
-        initial_values = self.math_methods.find_suitable_initial_values(
-            start=start, end=end, step=step, num_values=5
-        )
+        if summary['message']:
+            print(summary['message'])
+            if hasattr(self.ui, 'result_roots'):
+                self.ui.result_roots.append(summary['message'])
+        
+        if found_roots and self.history_widget is not None:
+            self.history_widget.add_history_entry(
+                equation=self.math_methods.equation,
+                method=summary['method_name'],
+                roots=found_roots,
+                iterations=summary['total_iterations'],
+                settings=self.settings.copy()
+            )
+            print(f"Entrada guardada en historial: {len(found_roots)} raíces encontradas")
         
-        found_roots = []
-        root_tolerance = 0.01
-        total_iterations = 0  # NUEVO: Contador de iteraciones
+        print(f"Total de raíces encontradas: {len(found_roots)}")
+
+    def _on_solver_error(self, worker, error_message):
+        if worker is not self.solver_worker:
+            return
         
-        if initial_values:
-            print(f"Se encontraron {len(initial_values)} valores iniciales.")
-            
-            for i, x0 in enumerate(initial_values):
-                print(f"Probando con x₀ = {x0:.2f}")
-                
-                result = self.math_methods.newton_raphson_method(x0, tolerance, max_iterations)
-                
-                total_iterations += result['iterations']  # NUEVO: Sumar iteraciones
-                
-                if result['success']:
-                    is_duplicate = False
-                    for existing_root in found_roots:
-                        if abs(result['root'] - existing_root) < root_tolerance:
-                            is_duplicate = True
-                            print(f"  > Raíz duplicada, saltando...")
-                            break
-                    
-                    if not is_duplicate:
-                        found_roots.append(result['root'])
-                        root_num = len(found_roots)
-                        
-                        if hasattr(self.ui, 'result_roots'):
-                            self.ui.result_roots.append(f"<b style='color: #828282;'>Raíz {i+1}</b>")
-                            self.ui.result_roots.append(f"  ●  <b>Raíz</b>: {result['root']:.8f}")
-                            self.ui.result_roots.append(f"  ●  <b>Iteraciones</b>: {result['iterations']}")
-                            self.ui.result_roots.append(f"  ●  <b>Error</b>: {result['final_error']:.20f}")
-                            self.ui.result_roots.append("<br>")
-                            self.ui.result_roots.verticalScrollBar().setValue(0)
-                        
-                        self.math_methods.populate_table_newton(
-                            self.ui.tabla_iteraciones, result['iterations_data']
-                        )
-                        
-                        if root_num < len(initial_values):
-                            self._add_table_separator()
-                        
-                        print(f"  > {result['message']}")
-                else:
-                    print(f"  > {result['error']}")
-            
-            # NUEVO: Guardar en historial si se encontraron raíces
-            if found_roots:
-                if self.history_widget is not None:
-                    self.history_widget.add_history_entry(
-                        equation=self.math_methods.equation,
-                        method='Newton-Raphson',
-                        roots=found_roots,
-                        iterations=total_iterations,
-                        settings=self.settings.copy()
-                    )
-                    print(f"Entrada guardada en historial: {len(found_roots)} raíces encontradas")
-                
-                self.ui.resultados.setCurrentIndex(1)
-                print(f"Total de raíces únicas encontradas: {len(found_roots)}")
-            else:
-                print("No se encontraron raíces con Newton-Raphson.")
-                if hasattr(self.ui, 'result_roots'):
-                    self.ui.result_roots.append("No se encontraron raíces en el rango especificado.")
-        else:
-            print("No se encontraron valores iniciales adecuados.")
-            if hasattr(self.ui, 'result_roots'):
-                self.ui.result_roots.append("No se pudieron encontrar valores iniciales adecuados.")
-                
+        self.solver_worker = None
+        print(error_message)
+        if hasattr(self.ui, 'result_roots'):
+            self.ui.result_roots.append(f"Error: {error_message}")
+
+    def _cancel_solver_worker(self):
+        if self.solver_worker:
+            self.solver_worker.cancel()
+            self.solver_worker = None
+
+    def _append_root_result(self, root_num, result):
+        """Agrega el resumen de una raíz al panel de resultados"""
+        if not hasattr(self.ui, 'result_roots'):
+            return
+        
+        self.ui.result_roots.append(f"<b style='color: #828282;'>Raíz {root_num}</b>")
+        self.ui.result_roots.append(f"  ●  <b>Raíz</b>: {result['root']:.8f}")
+        self.ui.result_roots.append(f"  ●  <b>Iteraciones</b>: {result['iterations']}")
+        self.ui.result_roots.append(f"  ●  <b>Error</b>: {result['final_error']:.20f}")
+        self.ui.result_roots.append("<br>")
+        self.ui.result_roots.verticalScrollBar().setValue(0)
 
-    def _add_table_separator(self):
-        for _ in range(2):
-            row_count = self.ui.tabla_iteraciones.rowCount()
-            self.ui.tabla_iteraciones.insertRow(row_count)
-            for col in range(self.ui.tabla_iteraciones.columnCount()):
-                item = QTableWidgetItem("")
-                item.setBackground(QColor('#FFFFFF'))
-                self.ui.tabla_iteraciones.setItem(row_count, col, item)
-    
     def display_current_method_info(self):
-        method_name = "Bisección" if self.settings['method'] == 'biseccion' else "Newton-Raphson"
+        method_name = METHOD_NAMES.get(self.settings['method'], self.settings['method'])
         interval_type = "Automático" if self.settings['auto_interval'] else "Personalizado"
         
         info_text = f"""
@@ -983,6 +926,9 @@ class MathRootsController(QObject):
         if not file_path:
             return
 
+        # fpdf tarda en importarse; se carga solo al exportar (o en la precarga)
+        from .custom_pdf import CustomPDF, create_report_cover
+
         try:
             # 2. Configurar el PDF
             pdf = CustomPDF(title=f"Informe de Ecuación: {self.math_methods.equation}", filename=file_path)
@@ -1004,7 +950,7 @@ class MathRootsController(QObject):
             pdf.multi_cell(pdf.w - 2 * pdf.l_margin, 7, f"Ecuación: {self.math_methods.equation}")
             
             pdf.set_x(pdf.l_margin)
-            pdf.multi_cell(pdf.w - 2 * pdf.l_margin, 7, f"Método: {'Bisección' if self.settings['method'] == 'biseccion' else 'Newton-Raphson'}")
+            pdf.multi_cell(pdf.w - 2 * pdf.l_margin, 7, f"Método: {METHOD_NAMES.get(self.settings['method'], self.settings['method'])}")
             
             pdf.set_x(pdf.l_margin)
             pdf.multi_cell(pdf.w - 2 * pdf.l_margin, 7, f"Tolerancia: {self.settings['tolerance']:.2e}")
@@ -1015,7 +961,7 @@ class MathRootsController(QObject):
             pdf.ln(10)
 
             # 5. Añadir la tabla de iteraciones
-            if hasattr(self.ui, 'widget_5') and self.ui.tabla_iteraciones.rowCount() > 0:
+            if hasattr(self.ui, 'widget_5') and self.iterations_model.rowCount() > 0:
                 pdf.set_font("Arial", "B", 16)
                 pdf.cell(0, 10, "Procedimiento (Tabla de Iteraciones)", ln=1, align='L')
                 pdf.ln(5)
@@ -1146,6 +1092,7 @@ class MathRootsController(QObject):
         about_dialog = QDialog(self.main_window)
         
         # Crea una instancia de la UI generada
+        from ui.ui_about_v2 import Ui_Dialog
         ui_about = Ui_Dialog()
         
         # Configura la UI en el diálogo
@@ -4,35 +4,127 @@ Módulo para procesamiento OCR de imágenes matemáticas
 Soporta múltiples engines: pix2tex, Tesseract
 """
 
+import importlib.util
 import os
+import threading
+import time
 from PIL import Image
 
+from .image_preprocessing import image_hash, load_preprocessed, ocr_result_cache
+
+
+class OCRModelHolder:
+    """
+    Modelo de pix2tex compartido por todo el proceso.
+    Se carga una sola vez (la primera vez que se pide o en segundo plano con
+    preload) y todos los OCRProcessor/OCRWorker lo reutilizan.
+    """
+    
+    def __init__(self):
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._inference_lock = threading.Lock()
+        self._available_methods = None
+        self._preload_thread = None
+    
+    def available_methods(self):
+        """
+        Métodos OCR instalados. Se revisa una sola vez y sin importar los
+        paquetes, porque importar pix2tex tarda varios segundos.
+        """
+        if self._available_methods is None:
+            methods = []
+            if importlib.util.find_spec("pix2tex") is not None:
+                methods.append("pix2tex")
+            if importlib.util.find_spec("pytesseract") is not None:
+                methods.append("tesseract")
+            self._available_methods = methods
+        return list(self._available_methods)
+    
+    def get_model(self):
+        """
+        Retorna el modelo LatexOCR, cargándolo si aún no existe.
+        Si varios hilos lo piden a la vez, solo uno lo carga. Un fallo no se
+        recuerda: la siguiente petición vuelve a intentar la carga (por
+        ejemplo, si la descarga de los pesos falló por falta de red).
+        
+        Raises:
+            Exception: El error de la carga, si falló
+        """
+        if self._model is not None:
+            return self._model
+        
+        with self._load_lock:
+            if self._model is None:
+                from pix2tex.cli import LatexOCR
+                self._model = LatexOCR()
+                print("Modelo pix2tex cargado")
+        return self._model
+    
+    def predict(self, image):
+        """Reconoce una imagen PIL con el modelo compartido (una inferencia a la vez)"""
+        model = self.get_model()
+        with self._inference_lock:
+            return model(image)
+    
+    def predict_many(self, images):
+        """
+        Reconoce varias imágenes seguidas tomando el modelo una sola vez.
+        LatexOCR solo acepta una imagen por llamada, así que el lote se
+        procesa imagen por imagen sin soltar el modelo entre ellas.
+        
+        Returns:
+            list: Por imagen, una tupla (latex, error, segundos); error es None
+            si la imagen se reconoció
+        """
+        model = self.get_model()
+        results = []
+        with self._inference_lock:
+            for image in images:
+                start = time.perf_counter()
+                try:
+                    results.append((model(image), None, time.perf_counter() - start))
+                except Exception as e:
+                    results.append(("", str(e), time.perf_counter() - start))
+        return results
+    
+    def is_loaded(self):
+        return self._model is not None
+    
+    def preload(self):
+        """Carga el modelo en un hilo de fondo si pix2tex está instalado"""
+        if self._model is not None or "pix2tex" not in self.available_methods():
+            return
+        if self._preload_thread is not None:
+            return
+        
+        self._preload_thread = threading.Thread(
+            target=self._preload, name="pix2tex-preload", daemon=True
+        )
+        self._preload_thread.start()
+    
+    def _preload(self):
+        try:
+            self.get_model()
+        except Exception as e:
+            print(f"No se pudo precargar pix2tex: {e}")
+
+
+# Modelo compartido por todas las instancias de OCRProcessor
+model_holder = OCRModelHolder()
+
 
 class OCRProcessor:
     """Procesador principal de OCR para imágenes matemáticas"""
     
-    def __init__(self):
+    def __init__(self, preprocess=True):
         self.available_methods = self._check_available_methods()
+        # Binarizar, enderezar y recortar la imagen antes de reconocerla
+        self.preprocess = preprocess
     
     def _check_available_methods(self):
         """Verificar qué métodos OCR están disponibles"""
-        methods = []
-        
-        # Verificar pix2tex
-        try:
-            import pix2tex
-            methods.append("pix2tex")
-        except ImportError:
-            pass
-        
-        # Verificar pytesseract
-        try:
-            import pytesseract
-            methods.append("tesseract")
-        except ImportError:
-            pass
-        
-        return methods
+        return model_holder.available_methods()
     
     def process_image(self, image_path):
         """
@@ -49,29 +141,35 @@ class OCRProcessor:
                 "error": "Archivo de imagen no encontrado"
             }
         
+        # Una imagen ya reconocida no se vuelve a procesar
+        digest = image_hash(image_path)
+        cached = ocr_result_cache.get(self._cache_key(digest))
+        if cached is not None:
+            return dict(cached)
+        
         # Intentar pix2tex primero (más preciso)
         if "pix2tex" in self.available_methods:
             try:
-                result = self._process_with_pix2tex(image_path)
-                return {
+                result = self._process_with_pix2tex(image_path, digest)
+                return self._remember(digest, {
                     "latex": result,
                     "method": "pix2tex",
                     "success": True,
                     "error": ""
-                }
+                })
             except Exception as e:
                 print(f"pix2tex falló: {e}")
         
         # Fallback a Tesseract
         if "tesseract" in self.available_methods:
             try:
-                result = self._process_with_tesseract(image_path)
-                return {
+                result = self._process_with_tesseract(image_path, digest)
+                return self._remember(digest, {
                     "latex": result,
                     "method": "Tesseract OCR",
                     "success": True,
                     "error": ""
-                }
+                })
             except Exception as e:
                 print(f"Tesseract falló: {e}")
         
@@ -83,16 +181,27 @@ class OCRProcessor:
             "error": self._get_installation_message()
         }
     
-    def _process_with_pix2tex(self, image_path):
-        """Procesamiento usando pix2tex"""
-        from pix2tex.cli import LatexOCR
-        
-        model = LatexOCR()
-        img = Image.open(image_path)
-        latex_code = model(img)
+    def _cache_key(self, digest):
+        return (digest, self.preprocess)
+    
+    def _remember(self, digest, result):
+        ocr_result_cache.put(self._cache_key(digest), dict(result))
+        return result
+    
+    def load_image(self, image_path, digest=None):
+        """Abrir la imagen, preprocesada (y guardada en caché) si está activado"""
+        if self.preprocess:
+            return load_preprocessed(image_path, digest)
+        with Image.open(image_path) as image:
+            return image.copy()
+    
+    def _process_with_pix2tex(self, image_path, digest=None):
+        """Procesamiento usando el modelo pix2tex compartido"""
+        img = self.load_image(image_path, digest)
+        latex_code = model_holder.predict(img)
         return latex_code
     
-    def _process_with_tesseract(self, image_path):
+    def _process_with_tesseract(self, image_path, digest=None):
         """Procesamiento usando Tesseract OCR"""
         import pytesseract
         
@@ -100,7 +209,7 @@ class OCRProcessor:
         self._configure_tesseract()
         
         # Procesar imagen
-        image = Image.open(image_path)
+        image = self.load_image(image_path, digest)
         image = image.convert('L')  # Escala de grises
         
         # OCR con configuración optimizada para matemáticas
@@ -0,0 +1,199 @@
+# logic/plot_cache.py
+"""
+Caché de datos de gráficas para Graphic.
+Guarda las muestras (x, y) y las raíces de cada curva, indexadas por la
+expresión normalizada y el rango, para que volver a graficar la misma
+ecuación (desde el historial o al resolver de nuevo) sea inmediato.
+"""
+
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+
+
+def temporary_spill_dir() -> str:
+    """
+    Crea un directorio propio de este proceso para las curvas que pasan a
+    disco y lo registra para borrarlo al salir. Así dos instancias (o dos
+    usuarios) no comparten archivos.
+    """
+    path = tempfile.mkdtemp(prefix="mathroots_plot_cache_")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+class PlotDataCache:
+    """
+    Caché LRU de arreglos (x, y, raíces) con límite de memoria en bytes.
+    Si se indica spill_dir, las entradas descartadas de memoria se guardan
+    como archivos .npy y se recuperan de ahí antes de recalcularse. Los
+    archivos también tienen un límite (max_disk_bytes); al superarlo se
+    borran los menos usados.
+
+    spill_dir puede ser una ruta o una función que la crea (como
+    temporary_spill_dir); en ambos casos el directorio se crea la primera
+    vez que una curva pasa a disco, no al construir la caché.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        spill_dir: Optional[Union[str, Callable[[], str]]] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._disk_entries = OrderedDict()
+        self._disk_bytes = 0
+        self._spill_dir_ready = False
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(expression_key: str, x_min: float, x_max: float) -> Tuple:
+        """Clave de una curva: expresión normalizada y rango muestreado"""
+        return (expression_key, float(x_min), float(x_max))
+
+    def get(self, key: Tuple):
+        """
+        Retorna (x, y, raices) o None si la curva no está en memoria ni en disco.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._load(key)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self.put(key, *entry)
+        return entry
+
+    def put(self, key: Tuple, x: np.ndarray, y: np.ndarray, roots):
+        """Guarda una curva, descartando (o pasando a disco) las menos usadas"""
+        entry = (np.asarray(x), np.asarray(y), np.asarray(roots, dtype=float))
+        size = sum(array.nbytes for array in entry)
+        if size > self.max_bytes:
+            return
+
+        evicted = []
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= sum(array.nbytes for array in previous)
+
+            self._entries[key] = entry
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                old_key, old_entry = self._entries.popitem(last=False)
+                self._bytes -= sum(array.nbytes for array in old_entry)
+                evicted.append((old_key, old_entry))
+
+        for old_key, old_entry in evicted:
+            self._spill(old_key, old_entry)
+
+    def clear(self, disk: bool = False):
+        """Vacía la caché en memoria y, si se pide, también los archivos en disco"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+        if disk:
+            with self._lock:
+                spilled = list(self._disk_entries)
+                self._disk_entries.clear()
+                self._disk_bytes = 0
+            for key in spilled:
+                self._remove_files(key)
+
+    def stats(self) -> dict:
+        """Retorna los contadores de uso de la caché"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "disk_size": len(self._disk_entries),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _paths(self, key: Tuple):
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        base = os.path.join(self.spill_dir, digest)
+        return f"{base}_x.npy", f"{base}_y.npy", f"{base}_r.npy"
+
+    def _spill(self, key: Tuple, entry):
+        size = sum(array.nbytes for array in entry)
+        if not self.spill_dir or size > self.max_disk_bytes:
+            return
+        try:
+            self._ensure_spill_dir()
+            for path, array in zip(self._paths(key), entry):
+                np.save(path, array)
+        except OSError as e:
+            print(f"No se pudo guardar la gráfica en disco: {e}")
+            return
+
+        evicted = []
+        with self._lock:
+            self._disk_bytes -= self._disk_entries.pop(key, 0)
+            self._disk_entries[key] = size
+            self._disk_bytes += size
+            while self._disk_bytes > self.max_disk_bytes:
+                old_key, old_size = self._disk_entries.popitem(last=False)
+                self._disk_bytes -= old_size
+                evicted.append(old_key)
+
+        for old_key in evicted:
+            self._remove_files(old_key)
+
+    def _ensure_spill_dir(self):
+        with self._lock:
+            if self._spill_dir_ready:
+                return
+            if callable(self.spill_dir):
+                self.spill_dir = self.spill_dir()
+            os.makedirs(self.spill_dir, exist_ok=True)
+            self._spill_dir_ready = True
+
+    def _load(self, key: Tuple):
+        with self._lock:
+            if key not in self._disk_entries:
+                return None
+            self._disk_entries.move_to_end(key)
+        try:
+            return tuple(np.load(path) for path in self._paths(key))
+        except (OSError, ValueError) as e:
+            print(f"No se pudo leer la gráfica desde disco: {e}")
+            return None
+
+    def _remove_files(self, key: Tuple):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -0,0 +1,42 @@
+# logic/plot_worker.py
+"""
+Worker del pool de hilos para muestrear tramos de la gráfica sin bloquear la UI
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from .adaptive_sampling import adaptive_sample
+
+
+class PlotTileSignals(QObject):
+    """Señales del PlotTileWorker (QRunnable no puede declarar señales)"""
+
+    finished = Signal(object, object)   # x, y del tramo
+    error = Signal(str)                 # error_message
+
+
+class PlotTileWorker(QRunnable):
+    """Muestrea la función en un tramo [x_min, x_max] de la vista"""
+
+    def __init__(self, func, x_min, x_max, max_points):
+        super().__init__()
+        self.signals = PlotTileSignals()
+        self.func = func
+        self.x_min = x_min
+        self.x_max = x_max
+        self.max_points = max_points
+
+    def run(self):
+        """Ejecutar el muestreo del tramo"""
+        try:
+            x, y = adaptive_sample(
+                self.func,
+                self.x_min,
+                self.x_max,
+                initial_points=max(17, self.max_points // 4),
+                max_points=self.max_points,
+            )
+            self.signals.finished.emit(x, y)
+
+        except Exception as e:
+            self.signals.error.emit(f"Error al muestrear la gráfica: {str(e)}")
@@ -0,0 +1,61 @@
+# logic/solver_worker.py
+"""
+Worker del pool de hilos para resolver ecuaciones sin bloquear la UI
+"""
+
+from threading import Event
+from PySide6.QtCore import QObject, QRunnable, Signal
+from .math_methods import MathMethods
+
+
+class SolverSignals(QObject):
+    """Señales del SolverWorker (QRunnable no puede declarar señales)"""
+
+    method = Signal(str)      # clave del método que realmente se usa
+    result = Signal(dict)     # resultado de cada raíz, en cuanto está listo
+    finished = Signal(dict)   # resumen de la búsqueda
+    error = Signal(str)       # error_message
+    progress = Signal(str)    # status_message
+
+
+class SolverWorker(QRunnable):
+    """Busca intervalos y raíces en un hilo del QThreadPool"""
+
+    def __init__(self, equation, settings):
+        super().__init__()
+        self.signals = SolverSignals()
+        self.math_methods = MathMethods()
+        self.math_methods.equation = equation
+        self.settings = settings.copy()
+        self._cancelled = Event()
+
+    def cancel(self):
+        """
+        Pide detener la búsqueda. Se revisa entre bloques de la malla y de
+        intervalos y en cada iteración de los métodos abiertos; el cálculo de
+        los valores propios de un polinomio no se interrumpe.
+        """
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    def run(self):
+        """Ejecutar la búsqueda de raíces"""
+        try:
+            summary = self.math_methods.auto_solve(
+                self.settings,
+                on_method=self.signals.method.emit,
+                on_result=self._emit_result,
+                on_progress=self.signals.progress.emit,
+                is_cancelled=self.is_cancelled,
+            )
+            if not self.is_cancelled():
+                self.signals.finished.emit(summary)
+
+        except Exception as e:
+            self.signals.error.emit(f"Error en búsqueda automática: {str(e)}")
+
+    def _emit_result(self, result):
+        if not self.is_cancelled():
+            self.signals.result.emit(result)
@@ -0,0 +1,266 @@
+# logic/speech_backends.py
+"""
+Motores de reconocimiento de voz para VoiceWorker.
+Google necesita conexión; Vosk funciona sin conexión con un modelo local
+que se carga una sola vez y comparten todos los workers. StaticSpeechBackend
+devuelve textos fijos y sirve para pruebas sin micrófono ni red.
+
+Cada motor ofrece además un flujo (create_stream) que recibe el audio por
+trozos mientras el usuario habla: Vosk reconoce de forma incremental y da
+resultados parciales; los demás acumulan el audio y lo transcriben al final.
+
+El motor se elige con la variable de entorno MATHROOTS_SPEECH_BACKEND
+("vosk", "google" o "local"); si no está definida se usa Vosk cuando está
+instalado y hay un modelo en MATHROOTS_VOSK_MODEL (o en models/vosk-es).
+"""
+
+import importlib.util
+import json
+import os
+import threading
+
+from .lazy_imports import lazy_module
+
+# speech_recognition se importa al primer uso o en la precarga de fondo
+sr = lazy_module("speech_recognition")
+
+
+VOSK_MODEL_PATH = os.environ.get(
+    "MATHROOTS_VOSK_MODEL",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models", "vosk-es"),
+)
+VOSK_SAMPLE_RATE = 16000
+
+# Segundos máximos de espera al servicio de Google
+GOOGLE_TIMEOUT = 6
+
+# Segundos de audio que se usan para calibrar el ruido ambiental
+CALIBRATION_SECONDS = 0.5
+
+
+class SpeechBackend:
+    """Interfaz de los motores: transcribe un sr.AudioData a texto"""
+
+    name = ""
+
+    def is_available(self):
+        return True
+
+    def load(self):
+        """Carga lo que el motor necesite antes de la primera transcripción"""
+
+    def transcribe(self, audio):
+        """
+        Retorna el texto reconocido.
+
+        Raises:
+            sr.UnknownValueError: Si no se reconoció nada
+            sr.RequestError: Si el motor no está disponible
+        """
+        raise NotImplementedError
+
+    def create_stream(self, sample_rate, sample_width):
+        """Flujo para transcribir el audio por trozos a medida que llega"""
+        return BufferedSpeechStream(self, sample_rate, sample_width)
+
+
+class BufferedSpeechStream:
+    """
+    Flujo para motores sin reconocimiento incremental: junta los trozos y
+    transcribe todo el audio al terminar.
+    """
+
+    def __init__(self, backend, sample_rate, sample_width):
+        self.backend = backend
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self._chunks = []
+
+    def accept(self, chunk):
+        """Agrega un trozo (sr.AudioData) y retorna el texto parcial, si hay"""
+        self._chunks.append(chunk.get_raw_data())
+        return ""
+
+    def finish(self):
+        """Retorna el texto final del audio recibido"""
+        audio = sr.AudioData(b"".join(self._chunks), self.sample_rate, self.sample_width)
+        return self.backend.transcribe(audio)
+
+
+class GoogleSpeechBackend(SpeechBackend):
+    """Reconocimiento en línea con la API de Google"""
+
+    name = "Google Speech Recognition"
+
+    def __init__(self, recognizer, language="es-ES"):
+        self.recognizer = recognizer
+        self.language = language
+
+    def transcribe(self, audio):
+        return self.recognizer.recognize_google(audio, language=self.language)
+
+
+class VoskSpeechBackend(SpeechBackend):
+    """Reconocimiento sin conexión con un modelo Vosk local"""
+
+    name = "Vosk (sin conexión)"
+
+    def __init__(self, model_path=VOSK_MODEL_PATH):
+        self.model_path = model_path
+        self._model = None
+        self._load_lock = threading.Lock()
+
+    def is_available(self):
+        return importlib.util.find_spec("vosk") is not None and os.path.isdir(self.model_path)
+
+    def load(self):
+        """
+        Carga el modelo una sola vez, aunque varios hilos lo pidan a la vez.
+        Si la carga falla se vuelve a intentar en la siguiente petición, por
+        ejemplo después de instalar o cambiar el modelo.
+        """
+        if self._model is not None:
+            return self._model
+
+        with self._load_lock:
+            if self._model is None:
+                try:
+                    import vosk
+                    vosk.SetLogLevel(-1)
+                    self._model = vosk.Model(self.model_path)
+                    print(f"Modelo Vosk cargado desde {self.model_path}")
+                except Exception as e:
+                    raise sr.RequestError(f"No se pudo cargar el modelo Vosk: {e}")
+        return self._model
+
+    def create_recognizer(self, sample_rate=VOSK_SAMPLE_RATE):
+        """Nuevo reconocedor de Kaldi sobre el modelo compartido"""
+        import vosk
+        return vosk.KaldiRecognizer(self.load(), sample_rate)
+
+    def create_stream(self, sample_rate, sample_width):
+        return VoskSpeechStream(self.create_recognizer(sample_rate))
+
+    def transcribe(self, audio):
+        recognizer = self.create_recognizer()
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=VOSK_SAMPLE_RATE, convert_width=2))
+        text = json.loads(recognizer.FinalResult()).get("text", "")
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+class VoskSpeechStream:
+    """Reconocimiento incremental con Vosk: da texto parcial en cada trozo"""
+
+    def __init__(self, recognizer):
+        self.recognizer = recognizer
+        self._phrases = []
+
+    def accept(self, chunk):
+        if self.recognizer.AcceptWaveform(chunk.get_raw_data(convert_width=2)):
+            # Vosk cerró un segmento: su texto ya es definitivo
+            self._phrases.append(json.loads(self.recognizer.Result()).get("text", ""))
+            partial = ""
+        else:
+            partial = json.loads(self.recognizer.PartialResult()).get("partial", "")
+        return " ".join(text for text in self._phrases + [partial] if text)
+
+    def finish(self):
+        self._phrases.append(json.loads(self.recognizer.FinalResult()).get("text", ""))
+        text = " ".join(text for text in self._phrases if text)
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+class StaticSpeechBackend(SpeechBackend):
+    """Motor local para pruebas: devuelve los textos indicados, uno por llamada"""
+
+    name = "Local"
+
+    def __init__(self, texts):
+        self.texts = [texts] if isinstance(texts, str) else list(texts)
+        self._position = 0
+
+    def transcribe(self, audio):
+        if not self.texts:
+            raise sr.UnknownValueError()
+        text = self.texts[min(self._position, len(self.texts) - 1)]
+        self._position += 1
+        return text
+
+
+class SpeechEngine:
+    """
+    Motor de voz compartido por todos los VoiceWorker: un solo Recognizer,
+    calibrado contra el ruido ambiental una sola vez, y un solo backend.
+    """
+
+    def __init__(self):
+        self._recognizer = None
+        self._backend = None
+        self._calibrated = False
+        self._lock = threading.RLock()
+        self._preload_thread = None
+
+    @property
+    def recognizer(self):
+        """Recognizer compartido, creado la primera vez que se pide"""
+        with self._lock:
+            if self._recognizer is None:
+                self._recognizer = sr.Recognizer()
+                self._recognizer.operation_timeout = GOOGLE_TIMEOUT
+            return self._recognizer
+
+    def get_backend(self):
+        """Backend configurado (se elige la primera vez que se pide)"""
+        with self._lock:
+            if self._backend is None:
+                self._backend = self._choose_backend(os.environ.get("MATHROOTS_SPEECH_BACKEND", ""))
+            return self._backend
+
+    def set_backend(self, backend):
+        with self._lock:
+            self._backend = backend
+
+    def calibrate(self, source):
+        """Ajusta el umbral de energía al ruido ambiental solo la primera vez"""
+        if self._calibrated:
+            return
+        self.recognizer.adjust_for_ambient_noise(source, duration=CALIBRATION_SECONDS)
+        self._calibrated = True
+
+    def reset_calibration(self):
+        self._calibrated = False
+
+    def preload(self):
+        """Carga el modelo del backend en un hilo de fondo"""
+        if self._preload_thread is not None:
+            return
+        self._preload_thread = threading.Thread(
+            target=self._preload, name="speech-preload", daemon=True
+        )
+        self._preload_thread.start()
+
+    def _preload(self):
+        try:
+            self.get_backend().load()
+        except Exception as e:
+            print(f"No se pudo precargar el reconocimiento de voz: {e}")
+
+    def _choose_backend(self, name):
+        name = name.strip().lower()
+        vosk_backend = VoskSpeechBackend()
+
+        if name == "local":
+            return StaticSpeechBackend(os.environ.get("MATHROOTS_SPEECH_TEXT", ""))
+        if name == "google":
+            return GoogleSpeechBackend(self.recognizer)
+        if name == "vosk" or vosk_backend.is_available():
+            return vosk_backend
+        return GoogleSpeechBackend(self.recognizer)
+
+
+# Motor compartido por todos los VoiceWorker
+speech_engine = SpeechEngine()
@@ -0,0 +1,482 @@
+# logic/spoken_math.py
+"""
+Traducción de matemáticas habladas en español a ecuaciones de texto.
+Un solo recorrido: el tokenizador lee el texto una vez, agrupando frases
+de varias palabras ("al cuadrado", "raíz cuadrada", "igual a") por la
+coincidencia más larga, y un analizador descendente consume cada token una
+sola vez. Como se trabaja con palabras completas, "por" nunca se reemplaza
+dentro de otra palabra.
+
+Ejemplos:
+    "equis al cuadrado menos cuatro equis más tres igual a cero"
+        -> "x^2 - 4*x + 3 = 0"
+    "raíz cuadrada de x más un medio" -> "sqrt(x) + (1/2)"
+    "seno de dos x" -> "sin(2*x)"
+
+El argumento de una función o raíz es el producto implícito que sigue
+("seno de dos x al cuadrado" -> "sin(2*x^2)"); para algo más largo se dice
+"abre paréntesis ... cierra paréntesis". Una potencia dicha entre la función
+y su argumento se aplica a la función ("seno cuadrado de x" -> "sin(x)^2").
+Las palabras que no se reconocen generan SpokenMathError en vez de
+descartarse.
+"""
+
+import re
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class SpokenMathError(ValueError):
+    """La frase dictada no se pudo convertir en una ecuación"""
+
+
+class Token(NamedTuple):
+    kind: str
+    value: object
+
+
+# Tipos de token
+NUM = "num"             # número escrito con dígitos
+NUMWORD = "numword"     # número en palabras: (valor, categoría)
+DECIMAL = "decimal"     # "punto", "coma"
+VAR = "var"             # variable o constante
+OP = "op"               # + - * / =
+POW = "pow"             # exponente fijo: "al cuadrado" -> "2"
+POW_OPEN = "pow_open"   # "elevado a la": el exponente viene después
+ORDINAL = "ordinal"     # "quinta" en "a la quinta"
+DENOM = "denom"         # "medios", "tercios" en una fracción
+FUNC = "func"           # seno, raíz cuadrada, logaritmo...
+OF = "of"               # "de", que sigue a una función
+LPAREN = "lparen"
+RPAREN = "rparen"
+WORD = "word"           # palabra desconocida
+
+
+_SIN_ACENTOS = str.maketrans("áéíóúü", "aeiouu")
+
+_TOKEN_RE = re.compile(r"(\d+(?:[.,]\d+)?)|([a-zñ]+)|([²³])|([-+*/^=()×÷])")
+
+
+def _numeros() -> Dict[str, Tuple[int, str]]:
+    """Palabras numéricas con su valor y categoría para combinarlas"""
+    words = {"cero": (0, "zero")}
+    units = ["uno", "dos", "tres", "cuatro", "cinco", "seis", "siete", "ocho", "nueve"]
+    for value, word in enumerate(units, start=1):
+        words[word] = (value, "unit")
+    words["un"] = words["una"] = (1, "unit")
+
+    teens = ["diez", "once", "doce", "trece", "catorce", "quince",
+             "dieciseis", "diecisiete", "dieciocho", "diecinueve", "veinte"]
+    for value, word in enumerate(teens, start=10):
+        words[word] = (value, "unit")
+    for value, word in enumerate(units, start=21):
+        words["veinti" + word] = (value, "unit")
+    words["veintiun"] = words["veintiuna"] = (21, "unit")
+
+    tens = ["treinta", "cuarenta", "cincuenta", "sesenta", "setenta", "ochenta", "noventa"]
+    for value, word in enumerate(tens, start=3):
+        words[word] = (value * 10, "ten")
+
+    words["cien"] = words["ciento"] = (100, "hundred")
+    hundreds = {"doscientos": 200, "trescientos": 300, "cuatrocientos": 400,
+                "quinientos": 500, "seiscientos": 600, "setecientos": 700,
+                "ochocientos": 800, "novecientos": 900}
+    for word, value in hundreds.items():
+        words[word] = words[word[:-2] + "as"] = (value, "hundred")
+
+    words["mil"] = (1000, "thousand")
+    words["millon"] = words["millones"] = (10 ** 6, "million")
+    return words
+
+
+NUMBER_WORDS = _numeros()
+
+# Qué categoría puede seguir a cuál dentro del mismo número
+_NUMBER_FOLLOWS = {
+    None: {"zero", "unit", "ten", "hundred", "thousand", "million"},
+    "hundred": {"unit", "ten", "thousand", "million"},
+    "ten": {"thousand", "million"},
+    "unit": {"thousand", "million"},
+    "thousand": {"unit", "ten", "hundred"},
+    "million": {"unit", "ten", "hundred", "thousand"},
+    "zero": set(),
+}
+
+_DENOMINATORS = {
+    "medio": 2, "tercio": 3, "cuarto": 4, "quinto": 5, "sexto": 6,
+    "septimo": 7, "octavo": 8, "noveno": 9, "decimo": 10,
+}
+_ORDINALS = {
+    "segunda": 2, "tercera": 3, "cuarta": 4, "quinta": 5, "sexta": 6,
+    "septima": 7, "octava": 8, "novena": 9, "decima": 10,
+}
+
+# Frases de una o más palabras (ya en minúsculas y sin acentos)
+PHRASES: Dict[Tuple[str, ...], Token] = {
+    ("mas",): Token(OP, "+"),
+    ("menos",): Token(OP, "-"),
+    ("por",): Token(OP, "*"),
+    ("veces",): Token(OP, "*"),
+    ("multiplicado", "por"): Token(OP, "*"),
+    ("entre",): Token(OP, "/"),
+    ("sobre",): Token(OP, "/"),
+    ("dividido", "entre"): Token(OP, "/"),
+    ("dividido", "por"): Token(OP, "/"),
+    ("igual",): Token(OP, "="),
+    ("igual", "a"): Token(OP, "="),
+    ("es", "igual", "a"): Token(OP, "="),
+
+    ("al", "cuadrado"): Token(POW, "2"),
+    ("al", "cubo"): Token(POW, "3"),
+    ("elevado", "al", "cuadrado"): Token(POW, "2"),
+    ("elevado", "al", "cubo"): Token(POW, "3"),
+    ("cuadrado",): Token(POW, "2"),
+    ("cuadrada",): Token(POW, "2"),
+    ("cubica",): Token(POW, "3"),
+    ("elevado", "a", "la"): Token(POW_OPEN, None),
+    ("elevado", "a"): Token(POW_OPEN, None),
+    ("elevado", "al"): Token(POW_OPEN, None),
+    ("a", "la"): Token(POW_OPEN, None),
+
+    ("seno",): Token(FUNC, "sin"),
+    ("sen",): Token(FUNC, "sin"),
+    ("coseno",): Token(FUNC, "cos"),
+    ("cos",): Token(FUNC, "cos"),
+    ("tangente",): Token(FUNC, "tan"),
+    ("tan",): Token(FUNC, "tan"),
+    ("logaritmo",): Token(FUNC, "log"),
+    ("logaritmo", "natural"): Token(FUNC, "log"),
+    ("log",): Token(FUNC, "log"),
+    ("ln",): Token(FUNC, "log"),
+    ("exponencial",): Token(FUNC, "exp"),
+    ("exp",): Token(FUNC, "exp"),
+    ("raiz",): Token(FUNC, "sqrt"),
+    ("raiz", "cuadrada"): Token(FUNC, "sqrt"),
+    ("raiz", "cubica"): Token(FUNC, "cbrt"),
+    ("valor", "absoluto"): Token(FUNC, "abs"),
+    ("de",): Token(OF, None),
+    ("del",): Token(OF, None),
+
+    ("abre", "parentesis"): Token(LPAREN, None),
+    ("abrir", "parentesis"): Token(LPAREN, None),
+    ("cierra", "parentesis"): Token(RPAREN, None),
+    ("cerrar", "parentesis"): Token(RPAREN, None),
+
+    ("x",): Token(VAR, "x"),
+    ("equis",): Token(VAR, "x"),
+    ("pi",): Token(VAR, "pi"),
+    ("e",): Token(VAR, "e"),
+
+    ("punto",): Token(DECIMAL, None),
+    ("coma",): Token(DECIMAL, None),
+}
+for _word, _value in NUMBER_WORDS.items():
+    PHRASES[(_word,)] = Token(NUMWORD, _value)
+for _word, _value in _DENOMINATORS.items():
+    PHRASES[(_word,)] = PHRASES[(_word + "s",)] = Token(DENOM, _value)
+for _word, _value in _ORDINALS.items():
+    PHRASES[(_word,)] = Token(ORDINAL, _value)
+
+_MAX_PHRASE = max(len(key) for key in PHRASES)
+
+# Palabras que no aportan nada a la ecuación
+FILLER_WORDS = {"la", "el", "los", "las", "lo", "que", "es", "a", "al", "entonces", "ecuacion"}
+
+_SYMBOLS = {
+    "+": Token(OP, "+"), "-": Token(OP, "-"), "*": Token(OP, "*"), "×": Token(OP, "*"),
+    "/": Token(OP, "/"), "÷": Token(OP, "/"), "=": Token(OP, "="),
+    "^": Token(POW_OPEN, None), "(": Token(LPAREN, None), ")": Token(RPAREN, None),
+    "²": Token(POW, "2"), "³": Token(POW, "3"),
+}
+
+
+def tokenize(text: str) -> List[Token]:
+    """Convierte el texto en tokens en un solo recorrido"""
+    raw = _TOKEN_RE.findall(text.lower().translate(_SIN_ACENTOS))
+    tokens = []
+    i = 0
+    while i < len(raw):
+        number, word, superscript, symbol = raw[i]
+        if number:
+            tokens.append(Token(NUM, number.replace(",", ".")))
+        elif superscript or symbol:
+            tokens.append(_SYMBOLS[superscript or symbol])
+        else:
+            # Coincidencia más larga entre las frases conocidas
+            for length in range(min(_MAX_PHRASE, len(raw) - i), 0, -1):
+                key = tuple(item[1] for item in raw[i:i + length])
+                if all(key) and key in PHRASES:
+                    tokens.append(PHRASES[key])
+                    i += length
+                    break
+            else:
+                # "y" une decenas y unidades ("treinta y dos")
+                if word == "y" and tokens and tokens[-1].kind == NUMWORD:
+                    tokens.append(Token(WORD, "y"))
+                elif word not in FILLER_WORDS:
+                    tokens.append(Token(WORD, word))
+                i += 1
+            continue
+        i += 1
+    return tokens
+
+
+class _Parser:
+    """Analizador descendente sobre la lista de tokens"""
+
+    def __init__(self, tokens: Sequence[Token]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def kind(self, offset: int = 0) -> Optional[str]:
+        token = self.peek(offset)
+        return token.kind if token else None
+
+    def at_letter(self) -> bool:
+        """Palabra desconocida de una letra, que se toma como variable"""
+        token = self.peek()
+        return token is not None and token.kind == WORD and len(token.value) == 1 and token.value != "y"
+
+    def advance(self) -> Token:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def expression(self, inside_parens: bool = False) -> str:
+        """Secuencia de operandos y operadores hasta el final o ')'"""
+        pieces = []
+        expecting_operand = True
+        while self.pos < len(self.tokens):
+            token = self.peek()
+            if token.kind == RPAREN:
+                if inside_parens:
+                    break
+                self.advance()
+                continue
+
+            if token.kind == OP:
+                self.advance()
+                if expecting_operand and token.value in "+-":
+                    if token.value == "-":
+                        pieces.append("-")
+                    continue
+                if not expecting_operand:
+                    pieces.append(f" {token.value} " if token.value in "+-=" else token.value)
+                    expecting_operand = True
+                continue
+
+            operand = self.operand()
+            if operand is None:
+                if token.kind == WORD:
+                    raise SpokenMathError(f"No se reconoce la palabra '{token.value}'")
+                self.advance()
+                continue
+            if not expecting_operand:
+                pieces.append("*")  # multiplicación implícita: "dos x"
+            pieces.append(operand)
+            expecting_operand = False
+
+        # Un operador al final sin operando ("... menos") se descarta
+        if expecting_operand and pieces and pieces[-1].strip() in ("+", "-", "*", "/", "="):
+            pieces.pop()
+        return "".join(pieces)
+
+    def operand(self) -> Optional[str]:
+        """Un operando con sus potencias; None si el token no inicia ninguno"""
+        kind = self.kind()
+        if kind in (NUM, NUMWORD):
+            text = self.number()
+            if self.kind() == DENOM:
+                text = f"({text}/{self.advance().value})"
+        elif kind == VAR:
+            text = self.advance().value
+        elif self.at_letter():
+            text = self.advance().value  # otra variable de una letra
+        elif kind == LPAREN:
+            self.advance()
+            inner = self.expression(inside_parens=True)
+            if not inner:
+                raise SpokenMathError("Paréntesis vacío")
+            text = f"({inner})"
+            if self.kind() == RPAREN:
+                self.advance()
+        elif kind == FUNC:
+            name = self.advance().value
+            # "seno cuadrado de x": la potencia es de la función, no de x
+            exponent = self.powers("")
+            if self.kind() == OF:
+                self.advance()
+            text = f"{name}({self.argument(name)}){exponent}"
+        else:
+            return None
+        return self.powers(text)
+
+    def argument(self, name: str) -> str:
+        """Argumento de una función: el producto implícito que sigue"""
+        factors = []
+        sign = ""
+        if self.kind() == OP and self.peek().value == "-":
+            self.advance()
+            sign = "-"
+        while self.kind() in (NUM, NUMWORD, VAR, LPAREN, FUNC) or self.at_letter():
+            factors.append(self.operand())
+        if not factors:
+            raise SpokenMathError(f"Falta el argumento de {name}")
+        return sign + "*".join(factors)
+
+    def powers(self, base: str) -> str:
+        while self.kind() in (POW, POW_OPEN):
+            token = self.advance()
+            if token.kind == POW:
+                exponent = token.value
+            elif self.kind() in (ORDINAL, DENOM):
+                exponent = str(self.advance().value)
+            else:
+                sign = ""
+                if self.kind() == OP and self.peek().value == "-":
+                    self.advance()
+                    sign = "-"
+                exponent = self.operand()
+                if exponent is None:
+                    continue
+                exponent = sign + exponent
+            simple = re.fullmatch(r"[\w.]+|\([^()]*\)", exponent)
+            base += f"^{exponent}" if simple else f"^({exponent})"
+        return base
+
+    def number(self) -> str:
+        """Número en dígitos o palabras, con parte decimal opcional"""
+        if self.kind() == NUM:
+            text = self.advance().value
+        else:
+            text = str(self.integer())
+
+        if self.kind() == DECIMAL and self.kind(1) in (NUM, NUMWORD) and "." not in text:
+            self.advance()
+            # Los decimales se dictan por grupos: "tres punto cero cinco" -> 3.05
+            digits = ""
+            while self.kind() in (NUM, NUMWORD):
+                digits += self.advance().value if self.kind() == NUM else str(self.integer())
+            text += "." + digits.replace(".", "")
+        return text
+
+    def integer(self) -> int:
+        """Combina palabras numéricas mientras la categoría lo permita"""
+        total = 0
+        current = 0
+        previous = None
+        while self.kind() == NUMWORD:
+            value, category = self.peek().value
+            if category not in _NUMBER_FOLLOWS[previous]:
+                break
+            self.advance()
+
+            if category == "thousand":
+                total += max(current, 1) * 1000
+                current = 0
+            elif category == "million":
+                total = (total + max(current, 1)) * 10 ** 6
+                current = 0
+            else:
+                current += value
+            previous = category
+
+            # "treinta y dos"
+            if category == "ten" and self.kind() == WORD and self.peek().value == "y" \
+                    and self.kind(1) == NUMWORD and self.peek(1).value[0] < 10:
+                self.advance()
+                current += self.advance().value[0]
+                previous = "unit"
+        return total + current
+
+
+def spoken_to_equation(text: str) -> str:
+    """
+    Convierte una frase dictada en español a una ecuación de texto.
+
+    Returns:
+        str: Ecuación con operadores explícitos, p. ej. "x^2 - 4*x + 3 = 0"
+
+    Raises:
+        SpokenMathError: Si la frase tiene palabras que no se reconocen o una
+            función sin argumento
+    """
+    return _Parser(tokenize(text)).expression()
+
+
+# Frases de referencia con la ecuación esperada, para pruebas y benchmark
+CORPUS: List[Tuple[str, str]] = [
+    ("equis al cuadrado menos cuatro equis más tres igual a cero", "x^2 - 4*x + 3 = 0"),
+    ("x cuadrada menos dos", "x^2 - 2"),
+    ("dos x al cubo más tres x menos cinco", "2*x^3 + 3*x - 5"),
+    ("x elevado a la quinta menos x menos uno", "x^5 - x - 1"),
+    ("x elevado a la x menos diez", "x^x - 10"),
+    ("e elevado a menos x menos x", "e^(-x) - x"),
+    ("raíz cuadrada de x menos un medio", "sqrt(x) - (1/2)"),
+    ("raíz cúbica de x más dos", "cbrt(x) + 2"),
+    ("seno de x menos x entre dos", "sin(x) - x/2"),
+    ("coseno de dos x igual a x", "cos(2*x) = x"),
+    ("logaritmo natural de x más x", "log(x) + x"),
+    ("tres cuartos de x menos uno", "(3/4)*x - 1"),
+    ("x por x menos veinticinco", "x*x - 25"),
+    ("x al cuadrado menos ciento cuarenta y cuatro", "x^2 - 144"),
+    ("x al cubo menos dos mil trescientos cuarenta y cinco", "x^3 - 2345"),
+    ("x menos tres punto catorce", "x - 3.14"),
+    ("x menos cero punto cero cinco", "x - 0.05"),
+    ("abre paréntesis x más uno cierra paréntesis al cuadrado menos cuatro", "(x + 1)^2 - 4"),
+    ("menos x al cuadrado más nueve", "-x^2 + 9"),
+    ("x dividido entre tres menos uno", "x/3 - 1"),
+    ("seno cuadrado de x menos un medio", "sin(x)^2 - (1/2)"),
+    ("la exponencial de x menos tres x", "exp(x) - 3*x"),
+    ("tangente de x menos uno", "tan(x) - 1"),
+    ("x² - 4x + 3 = 0", "x^2 - 4*x + 3 = 0"),
+    ("valor absoluto de x menos dos", "abs(x) - 2"),
+]
+
+
+def benchmark(corpus: Optional[Sequence[Tuple[str, str]]] = None, repeat: int = 200) -> Dict:
+    """
+    Mide la conversión sobre un corpus de frases y verifica los resultados.
+
+    Returns:
+        Dict: {"phrases", "repeat", "total_seconds", "microseconds_per_phrase",
+        "mismatches": [(frase, esperado, obtenido)]}
+    """
+    corpus = list(corpus if corpus is not None else CORPUS)
+    mismatches = []
+    timed = []
+    for phrase, expected in corpus:
+        try:
+            obtained = spoken_to_equation(phrase)
+            timed.append(phrase)
+        except SpokenMathError as e:
+            obtained = f"error: {e}"
+        if obtained != expected:
+            mismatches.append((phrase, expected, obtained))
+
+    # Solo se miden las frases que se pudieron convertir
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for phrase in timed:
+            spoken_to_equation(phrase)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "phrases": len(corpus),
+        "repeat": repeat,
+        "total_seconds": elapsed,
+        "microseconds_per_phrase": elapsed / max(1, repeat * len(timed)) * 1e6,
+        "mismatches": mismatches,
+    }
+
+
+if __name__ == "__main__":
+    result = benchmark()
+    print(f"{result['phrases']} frases x {result['repeat']}: "
+          f"{result['microseconds_per_phrase']:.1f} µs por frase")
+    for phrase, expected, obtained in result["mismatches"]:
+        print(f"  '{phrase}': se esperaba '{expected}', se obtuvo '{obtained}'")
@@ -1,17 +1,31 @@
 from PySide6.QtCore import QThread, Signal
-import speech_recognition as sr
+
+from .speech_backends import sr, speech_engine
 
 class VoiceWorker(QThread):
     """
     Worker para realizar el reconocimiento de voz en un hilo secundario.
+    Usa el motor compartido speech_engine (Recognizer calibrado una sola vez
+    y backend de reconocimiento, en línea o sin conexión).
     """
     finished = Signal(str, str)
     error = Signal(str)
     progress = Signal(str)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, backend=None, audio_source=None, streaming=True):
+        """
+        Args:
+            backend: SpeechBackend a usar; None usa el del motor compartido
+            audio_source: Fuente de audio de speech_recognition (por ejemplo
+                sr.AudioFile); None usa el micrófono
+            streaming: Si es True, transcribe mientras el usuario habla y
+                emite el texto parcial por la señal progress
+        """
         super().__init__(parent)
-        self.recognizer = sr.Recognizer()
+        self.recognizer = speech_engine.recognizer
+        self.backend = backend
+        self.audio_source = audio_source
+        self.streaming = streaming
 
     def run(self):
         """
@@ -19,24 +33,28 @@ class VoiceWorker(QThread):
         Captura y emite errores a través de señales para evitar el cierre de la app.
         """
         try:
+            backend = self.backend or speech_engine.get_backend()
             self.progress.emit("⏳ Escuchando...")
-            
-            with sr.Microphone() as source:
-                # Ajusta el reconocedor a las condiciones del ruido ambiental.
-                # Es crucial que PyAudio esté instalado correctamente para esta línea.
-                self.recognizer.adjust_for_ambient_noise(source)
-                audio = self.recognizer.listen(source, timeout=10, phrase_time_limit=8)
-            
-            self.progress.emit("⏳ Procesando audio...")
-            
-            # Reconocimiento usando la API de Google
-            recognized_text = self.recognizer.recognize_google(
-                audio, 
-                language="es-ES"
-            )
-            
+
+            source = self.audio_source or sr.Microphone()
+            with source:
+                if isinstance(source, sr.Microphone):
+                    # Ajusta el reconocedor al ruido ambiental (solo la primera vez).
+                    # Es crucial que PyAudio esté instalado correctamente para esta línea.
+                    speech_engine.calibrate(source)
+
+                if self.streaming:
+                    recognized_text = self._transcribe_streaming(backend, source)
+                else:
+                    if isinstance(source, sr.Microphone):
+                        audio = self.recognizer.listen(source, timeout=10, phrase_time_limit=8)
+                    else:
+                        audio = self.recognizer.record(source)
+                    self.progress.emit("⏳ Procesando audio...")
+                    recognized_text = backend.transcribe(audio)
+
             self.progress.emit("✅ Transcripción exitosa.")
-            self.finished.emit(recognized_text, "Google Speech Recognition")
+            self.finished.emit(recognized_text, backend.name)
 
         # Excepciones específicas del reconocimiento de voz
         except sr.UnknownValueError:
@@ -45,8 +63,26 @@ class VoiceWorker(QThread):
             self.error.emit("Tiempo de espera agotado. No se detectó voz.")
         except sr.RequestError as e:
             self.error.emit(f"Error de conexión con el servicio: {e}")
-        
+
         # Excepción general para capturar cualquier otro problema
         # (ej. problemas con PyAudio, falta de permisos, etc.)
         except Exception as e:
-            self.error.emit(f"Ha ocurrido un error inesperado: {e}")
\ No newline at end of file
+            self.error.emit(f"Ha ocurrido un error inesperado: {e}")
+
+    def _transcribe_streaming(self, backend, source):
+        """
+        Pasa el audio al backend por trozos mientras el usuario habla, de
+        modo que la transcripción termina casi al mismo tiempo que la frase.
+        El fin de la frase lo detecta listen() con el umbral de pausa.
+        """
+        stream = backend.create_stream(source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+        last_partial = ""
+        chunks = self.recognizer.listen(source, timeout=10, phrase_time_limit=8, stream=True)
+        for chunk in chunks:
+            partial = stream.accept(chunk)
+            if partial and partial != last_partial:
+                last_partial = partial
+                self.progress.emit(f"🗣️ {partial}")
+
+        self.progress.emit("⏳ Procesando audio...")
+        return stream.finish()
\ No newline at end of file
@@ -1,10 +1,30 @@
+from logic.lazy_imports import startup_profile, warm_up
 from PySide6.QtWidgets import QApplication, QMainWindow
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QObject, QTimer, Signal
+import os
 import sys
 from form_ui import Ui_MathRoots
 from logic.mathroots_controller import MathRootsController
 from logic.graphic import Graphic
 from logic.table_styles import TableStyleManager
+from logic.ocr_processor import model_holder
+from logic.speech_backends import speech_engine
+
+
+# Cargar el modelo de pix2tex en segundo plano al iniciar, para que el
+# primer OCR no tenga que esperar. Ocupa memoria y CPU aunque no se use el
+# OCR, así que solo se hace con MATHROOTS_PRECARGAR_OCR=1
+PRECARGAR_OCR = os.environ.get("MATHROOTS_PRECARGAR_OCR", "") not in ("", "0")
+
+# Cargar el modelo de voz sin conexión (si se usa Vosk) al iniciar
+PRECARGAR_VOZ = True
+
+startup_profile.mark("importaciones")
+
+
+class WarmUpSignals(QObject):
+    """Avisa al hilo de la interfaz que terminó la precarga de fondo"""
+    finished = Signal()
 
 
 class MathRoots(QMainWindow):
@@ -12,12 +32,14 @@ class MathRoots(QMainWindow):
         super().__init__()
         self.ui = Ui_MathRoots()
         self.ui.setupUi(self)
+        startup_profile.mark("setupUi")
 
         # self.controller = MathRootsController(self.ui, self) 
         # por esta puta linea de codigo se jodio todo el reconocimiento de voz y la mitad del puto progrmaa
 
         self.controller = MathRootsController(self.ui, self) 
         self.graphics = Graphic(self.ui)
+        startup_profile.mark("controlador y gráfica")
 
         self.ui.stackedWidget.setCurrentIndex(0)
         self.ui.HomeStackedWidgets.setCurrentIndex(0)
@@ -26,9 +48,30 @@ class MathRoots(QMainWindow):
         
         self.apply_table_styles()
         
+        # sympy, pyqtgraph, fpdf, speech_recognition y los modelos de OCR y
+        # voz se cargan en segundo plano en cuanto la ventana está visible
+        self.warm_up_signals = WarmUpSignals()
+        self.warm_up_signals.finished.connect(self._on_warm_up_finished)
+        QTimer.singleShot(0, self._start_warm_up)
+        
         print("MathRoots iniciado correctamente")
         print("Widget de configuraciones integrado en el stackedWidget 'resultados'")
 
+    def _start_warm_up(self):
+        startup_profile.mark("ventana visible")
+        warm_up(on_finished=self.warm_up_signals.finished.emit)
+        if PRECARGAR_OCR:
+            model_holder.preload()
+        if PRECARGAR_VOZ:
+            speech_engine.preload()
+
+    def _on_warm_up_finished(self):
+        """Crea la gráfica ya con pyqtgraph cargado e imprime el reporte si se pidió"""
+        self.graphics.asegurar_grafica()
+        startup_profile.mark("gráfica creada")
+        if startup_profile.enabled():
+            print(startup_profile.report())
+
     def apply_table_styles(self):
         """Aplica estilos personalizados a las tablas de la interfaz"""
         TableStyleManager.apply_to_ui(self.ui)
@@ -0,0 +1,95 @@
+"""Búsqueda automática de raíces sin interfaz"""
+
+import pytest
+
+from logic import math_methods as math_methods_module
+from logic.compiled_expression import CompiledExpression
+from logic.math_methods import DEFAULT_SETTINGS, MathMethods
+
+# Ecuación que no es polinomio, con raíces en -1.98197 y 1.98197
+RATIONAL = "x^2 - 4 + 1/(x^2 + 10)"
+
+
+def solve(equation, is_cancelled=None, **settings):
+    math_methods = MathMethods()
+    math_methods.set_equation(equation)
+    methods, progress, results = [], [], []
+    summary = math_methods.auto_solve(
+        {**DEFAULT_SETTINGS, **settings},
+        on_method=methods.append,
+        on_result=results.append,
+        on_progress=progress.append,
+        is_cancelled=is_cancelled,
+    )
+    return summary, methods, progress, results
+
+
+@pytest.mark.parametrize("method", ["biseccion", "brent", "newton", "steffensen"])
+def test_finds_roots_of_non_polynomial_equation(method):
+    summary, methods, _, results = solve(RATIONAL, method=method)
+
+    assert methods == [method]
+    assert summary["method"] == summary["requested_method"] == method
+    assert summary["roots"] == pytest.approx([-1.98197, 1.98197], abs=1e-5)
+    assert len(results) == 2
+
+
+def test_polynomial_fast_path_reports_its_method():
+    summary, methods, _, _ = solve("x^3 - 6x^2 + 11x - 6", method="brent")
+
+    assert methods == ["polinomio"]
+    assert summary["requested_method"] == "brent"
+    assert summary["roots"] == pytest.approx([1.0, 2.0, 3.0])
+
+
+def test_newton_fallback_is_reported(monkeypatch):
+    monkeypatch.setattr(CompiledExpression, "derivative_is_practical", property(lambda self: False))
+    summary, methods, progress, _ = solve(RATIONAL, method="newton")
+
+    assert methods == ["secante"]
+    assert summary["method"] == "secante"
+    assert summary["requested_method"] == "newton"
+    assert any("Secante" in message and "Newton-Raphson" in message for message in progress)
+    assert summary["roots"] == pytest.approx([-1.98197, 1.98197], abs=1e-5)
+
+
+@pytest.mark.parametrize(
+    "equation, method",
+    [(RATIONAL, "biseccion"), (RATIONAL, "newton"), ("x^3 - 6x^2 + 11x - 6", "brent")],
+)
+def test_cancelled_before_start_returns_no_results(equation, method):
+    summary, _, _, results = solve(equation, is_cancelled=lambda: True, method=method)
+
+    assert summary["cancelled"]
+    assert summary["results"] == results == []
+
+
+def test_grid_scan_checks_cancellation_between_chunks(monkeypatch):
+    monkeypatch.setattr(math_methods_module, "GRID_CHUNK", 100)
+    checks = []
+
+    def is_cancelled():
+        checks.append(True)
+        return len(checks) > 3
+
+    math_methods = MathMethods()
+    math_methods.set_equation(RATIONAL)
+
+    assert math_methods.find_all_suitable_intervals(-100, 100, 0.1, is_cancelled) == []
+    assert len(checks) == 4
+    assert len(math_methods.find_all_suitable_intervals(-100, 100, 0.1, lambda: False)) == 2
+
+
+def test_open_method_checks_cancellation_each_iteration():
+    checks = []
+
+    def is_cancelled():
+        checks.append(True)
+        return len(checks) > 2
+
+    math_methods = MathMethods()
+    math_methods.set_equation("x^3 - 2x - 5")
+    result = math_methods.newton_batch([100.0], 1e-12, is_cancelled=is_cancelled)[0]
+
+    assert not result["success"]
+    assert len(result["iterations_data"]) == 2
@@ -0,0 +1,39 @@
+"""Resolución por lotes en varios procesos"""
+
+import time
+
+import pytest
+
+from logic import batch_solver
+from logic.batch_solver import solve_batch
+
+EQUATIONS = ["x^2 - %d" % n for n in range(1, 13)] + ["x +* 2"]
+
+
+def test_single_process_keeps_input_order():
+    records = list(solve_batch(EQUATIONS, jobs=1, chunk_size=5))
+
+    assert [record["index"] for record in records] == list(range(len(EQUATIONS)))
+    assert records[3]["roots"] == pytest.approx([-2.0, 2.0])
+    assert not records[-1]["success"]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_process_pool_matches_single_process(ordered):
+    expected = {record["index"]: record for record in solve_batch(EQUATIONS, jobs=1)}
+    records = list(solve_batch(EQUATIONS, jobs=2, chunk_size=3, ordered=ordered))
+
+    if ordered:
+        assert [record["index"] for record in records] == list(range(len(EQUATIONS)))
+    assert {record["index"]: record for record in records} == expected
+
+
+def test_timeout_returns_an_error_record(monkeypatch):
+    def slow_solve(equation, *args):
+        time.sleep(5)
+
+    monkeypatch.setattr(batch_solver, "solve_equation", slow_solve)
+    record = next(solve_batch(["x - 1"], jobs=1, timeout=0.05))
+
+    assert not record["success"]
+    assert "tiempo límite" in record["error"]
@@ -0,0 +1,41 @@
+"""Bisección en lote sobre varios intervalos"""
+
+import pytest
+
+from logic.math_methods import MathMethods
+
+
+def solver_for(equation):
+    math_methods = MathMethods()
+    math_methods.set_equation(equation)
+    return math_methods
+
+
+def test_batch_matches_single_interval():
+    math_methods = solver_for("x^3 - 2x - 5")
+    single = math_methods.bisection_method(2, 3, 1e-10)
+    batch = math_methods.bisection_batch([(2, 3), (-5, 0)], 1e-10)
+
+    assert single["success"]
+    assert batch[0]["root"] == single["root"]
+    assert batch[0]["iterations"] == single["iterations"]
+    assert batch[0]["iterations_data"] == single["iterations_data"]
+    assert not batch[1]["success"]
+
+
+def test_every_bracket_converges():
+    math_methods = solver_for("x^3 - 2x")
+    intervals = math_methods.find_all_suitable_intervals(-10, 10, 0.1)
+    results = math_methods.bisection_batch(intervals, 1e-8)
+
+    roots = sorted(result["root"] for result in results if result["success"])
+    assert roots == pytest.approx([-2 ** 0.5, 0.0, 2 ** 0.5], abs=1e-7)
+
+
+@pytest.mark.parametrize("interval, expected", [((0.0, 0.1), 0.0), ((-0.1, 0.0), 0.0)])
+def test_exact_endpoint_zero_is_returned(interval, expected):
+    result = solver_for("x").bisection_batch([interval])[0]
+
+    assert result["success"]
+    assert result["root"] == expected
+    assert result["iterations"] == 0
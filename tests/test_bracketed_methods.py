@@ -0,0 +1,54 @@
+"""Métodos cerrados: Brent, Illinois y Ridders"""
+
+import pytest
+
+from logic.math_methods import MathMethods
+
+METHODS = ["biseccion", "brent", "illinois", "ridders"]
+
+
+def solver_for(equation):
+    math_methods = MathMethods()
+    math_methods.set_equation(equation)
+    return math_methods
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize(
+    "equation, interval, expected",
+    [
+        ("x^3 - 2x - 5", (2, 3), 2.0945514815423265),
+        ("x^5 - x - 1", (1, 2), 1.1673039782614187),
+        ("x^x - 10", (1, 5), 2.5061841455887692),
+    ],
+)
+def test_converges_to_known_root(method, equation, interval, expected):
+    result = solver_for(equation).solve_brackets(method, [interval], 1e-10)[0]
+
+    assert result["success"]
+    assert result["root"] == pytest.approx(expected, abs=1e-8)
+
+
+@pytest.mark.parametrize("method", ["brent", "illinois", "ridders"])
+def test_faster_than_bisection(method):
+    math_methods = solver_for("x^3 - 2x - 5")
+    bisection = math_methods.solve_brackets("biseccion", [(2, 3)], 1e-10)[0]
+    result = math_methods.solve_brackets(method, [(2, 3)], 1e-10)[0]
+
+    assert result["iterations"] < bisection["iterations"]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_same_sign_bracket_is_an_error(method):
+    result = solver_for("x^2 + 1").solve_brackets(method, [(-1, 1)])[0]
+
+    assert not result["success"]
+    assert "mismo signo" in result["error"]
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_exact_zero_at_endpoint(method):
+    result = solver_for("x - 1").solve_brackets(method, [(1, 2)])[0]
+
+    assert result["success"]
+    assert result["root"] == 1.0
@@ -0,0 +1,75 @@
+"""Salida JSON por línea de la línea de comandos"""
+
+import io
+import json
+
+import pytest
+
+from logic.cli import main, solve_equation, to_json_line
+from logic.compiled_expression import CompiledExpression
+
+
+@pytest.fixture
+def run(capsys, monkeypatch):
+    def run(argv, stdin=""):
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+        exit_code = main(argv)
+        out = capsys.readouterr().out
+        return exit_code, [json.loads(line) for line in out.splitlines()]
+    return run
+
+
+def test_one_json_line_per_equation(run):
+    exit_code, records = run(["x^2 - 9", "x^3 - 2x - 5", "--no-polynomial", "--method", "brent"])
+
+    assert exit_code == 0
+    assert [record["equation"] for record in records] == ["x^2 - 9", "x^3 - 2x - 5"]
+    assert records[0]["method"] == records[0]["requested_method"] == "brent"
+    assert records[0]["roots"] == pytest.approx([-3.0, 3.0])
+    assert records[1]["roots"] == pytest.approx([2.0945514815423265])
+    assert "iterations_data" not in records[0]["results"][0]
+
+
+def test_reads_stdin_and_skips_comments(run):
+    exit_code, records = run(["--start", "0", "--end", "5"], stdin="# comentario\n\nx - 1\n2x - 8\n")
+
+    assert exit_code == 0
+    assert [record["roots"] for record in records] == [pytest.approx([1.0]), pytest.approx([4.0])]
+
+
+def test_invalid_equation_sets_exit_code(run):
+    exit_code, records = run(["x^2 - 4", "x +* 2"])
+
+    assert exit_code == 1
+    assert records[0]["success"]
+    assert not records[1]["success"]
+    assert records[1]["error"]
+
+
+def test_settings_file_and_iterations(run, tmp_path):
+    settings = tmp_path / "settings.json"
+    settings.write_text(
+        json.dumps({"method": "newton", "tolerance": 1e-10, "polynomial_fast_path": False}),
+        encoding="utf-8",
+    )
+
+    exit_code, records = run(["x^3 - 2x - 5", "--settings", str(settings), "--iterations"])
+
+    assert exit_code == 0
+    assert records[0]["method"] == "newton"
+    assert records[0]["roots"] == pytest.approx([2.0945514815423265])
+    assert records[0]["results"][0]["iterations_data"]
+
+
+def test_fallback_method_is_recorded(monkeypatch):
+    monkeypatch.setattr(CompiledExpression, "derivative_is_practical", property(lambda self: False))
+    record = solve_equation("x^2 - 4 + 1/(x^2 + 10)", {"method": "newton"})
+
+    assert record["requested_method"] == "newton"
+    assert record["method"] == "secante"
+
+
+def test_non_finite_values_are_written_as_null():
+    line = to_json_line({"root": float("nan"), "final_error": float("inf"), "roots": [1.0]})
+
+    assert json.loads(line) == {"root": None, "final_error": None, "roots": [1.0]}
@@ -0,0 +1,39 @@
+"""Caché compartida de expresiones compiladas"""
+
+import pytest
+
+from logic.compiled_expression import CompiledExpressionCache, expression_cache
+from logic.math_methods import MathMethods
+
+
+def test_lru_eviction_and_counters():
+    cache = CompiledExpressionCache(max_size=2)
+    first = cache.get("x**2 - 4")
+    cache.get("sin(x)")
+
+    assert cache.get("x**2 - 4") is first
+    cache.get("cos(x)")
+
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 2, "max_size": 2}
+    # sin(x) era la menos usada y se descartó
+    cache.get("sin(x)")
+    assert cache.stats()["misses"] == 4
+
+
+def test_compiled_functions_evaluate_with_numpy():
+    compiled = CompiledExpressionCache().get("x**3 - 2*x")
+
+    assert compiled.f(2.0) == pytest.approx(4.0)
+    assert compiled.f_prime(2.0) == pytest.approx(10.0)
+
+
+def test_instances_share_the_cache():
+    expression_cache.clear()
+    for _ in range(3):
+        math_methods = MathMethods()
+        math_methods.set_equation("x^3 - 7x + 1")
+        math_methods.get_function_value_at(1.0)
+
+    stats = MathMethods().get_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] >= 2
@@ -0,0 +1,76 @@
+"""Analizador de ecuaciones de la interfaz"""
+
+import pytest
+import sympy as sp
+
+from logic.compiled_expression import X
+from logic.equation_parser import EquationSyntaxError, parse_equation, tokenize
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("x^2 - 4", X**2 - 4),
+        ("x**2 - 4", X**2 - 4),
+        ("x² - 4x + 3", X**2 - 4 * X + 3),
+        ("2x^3", 2 * X**3),
+        ("3(x+1)", 3 * (X + 1)),
+        ("(x+1)(x-1)", (X + 1) * (X - 1)),
+        ("-x^2", -(X**2)),
+        ("2^-x", 2 ** (-X)),
+        ("x sen(x)", X * sp.sin(X)),
+        ("sen x + cos x", sp.sin(X) + sp.cos(X)),
+        ("sen^2(x) + cos(x)^2", sp.sin(X) ** 2 + sp.cos(X) ** 2),
+        ("ln(x) - log10(x)", sp.log(X) - sp.log(X, 10)),
+        ("arcsen(x) + tg(x)", sp.asin(X) + sp.tan(X)),
+        ("raiz(x) - 2", sp.sqrt(X) - 2),
+        ("√x - 2", sp.sqrt(X) - 2),
+        ("1.5e-3x", sp.Float("1.5e-3") * X),
+        ("x·2 − 1", 2 * X - 1),
+        ("X^2", X**2),
+    ],
+)
+def test_parses_like_the_interface(text, expected):
+    assert sp.simplify(parse_equation(text) - expected) == 0
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("pix", sp.pi * X),
+        ("2pix^2", 2 * sp.pi * X**2),
+        ("xpi^2", X * sp.pi**2),
+        ("xe^x", X * sp.exp(X)),
+        ("epi", sp.E * sp.pi),
+        ("2πx", 2 * sp.pi * X),
+    ],
+)
+def test_glued_symbols_bind_the_exponent_to_the_last_one(text, expected):
+    assert sp.simplify(parse_equation(text) - expected) == 0
+
+
+def test_glued_names_are_split_into_tokens():
+    assert [(token.text, token.position) for token in tokenize("2pix")][:3] == [("2", 0), ("pi", 1), ("x", 3)]
+
+
+def test_equality_is_left_minus_right():
+    assert parse_equation("x^2 = 4") == X**2 - 4
+    assert parse_equation("cos(2x) = x") == sp.cos(2 * X) - X
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("", "vacía"),
+        ("x +", "Se esperaba"),
+        ("(x + 1", r"Se esperaba '\)'"),
+        ("x $ 2", "Carácter no válido"),
+        ("y + 1", "Nombre desconocido 'y'"),
+        ("xy", "Nombre desconocido 'xy'"),
+        ("x = 1 = 2", "Expresión incompleta"),
+        ("sin(x, 2)", "argumentos"),
+    ],
+)
+def test_syntax_errors(text, message):
+    with pytest.raises(EquationSyntaxError, match=message):
+        parse_equation(text)
@@ -0,0 +1,47 @@
+"""Búsqueda de intervalos con cambio de signo: raíces exactas y polos"""
+
+import pytest
+
+from logic.math_methods import MathMethods
+
+
+def solver_for(equation):
+    math_methods = MathMethods()
+    math_methods.set_equation(equation)
+    return math_methods
+
+
+@pytest.mark.parametrize(
+    "equation, start, end, step",
+    [
+        ("1/(x-0.3)", -100, 100, 0.1),
+        ("1/(x-0.3)", -100, 100, 0.01),
+        ("1/(x-0.3)", -100, 100, 0.001),
+        ("1/(x-0.5)", 0, 1, 2e-5),
+        ("1/(x+2)", -10, 10, 0.5),
+    ],
+)
+def test_pole_on_grid_is_not_a_bracket(equation, start, end, step):
+    assert solver_for(equation).find_all_suitable_intervals(start, end, step) == []
+
+
+def test_poles_are_rejected_and_roots_kept():
+    intervals = solver_for("(x^2 - 1)/(x^2 - 4)").find_all_suitable_intervals(-10, 10, 0.1)
+
+    # Los polos en x = -2 y x = 2 también cambian de signo
+    assert len(intervals) == 2
+    assert intervals[0][0] <= -1 <= intervals[0][1]
+    assert intervals[1][0] <= 1 <= intervals[1][1]
+
+
+def test_root_at_first_grid_point():
+    intervals = solver_for("x").find_all_suitable_intervals(0, 1, 0.1)
+
+    assert len(intervals) == 1
+    assert intervals[0][0] == 0.0
+
+
+def test_root_on_interior_grid_point_is_counted_once():
+    intervals = solver_for("x^2-4").find_all_suitable_intervals(-10, 10, 0.5)
+
+    assert intervals == [(-2.5, -2.0), (1.5, 2.0)]
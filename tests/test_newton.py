@@ -0,0 +1,56 @@
+"""Newton-Raphson en lote y descarte de raíces duplicadas"""
+
+import pytest
+
+from logic.math_methods import MathMethods
+
+
+def solver_for(equation):
+    math_methods = MathMethods()
+    math_methods.set_equation(equation)
+    return math_methods
+
+
+def test_batch_matches_single_seed():
+    math_methods = solver_for("x^3 - 2x - 5")
+    single = math_methods.newton_raphson_method(2.0, 1e-10)
+    batch = math_methods.newton_batch([2.0, 10.0], 1e-10)
+
+    assert single["success"]
+    assert batch[0]["root"] == single["root"]
+    assert batch[0]["iterations_data"] == single["iterations_data"]
+    assert batch[1]["root"] == pytest.approx(2.0945514815423265)
+
+
+def test_zero_derivative_fails_only_that_seed():
+    results = solver_for("x^2 - 4").newton_batch([0.0, 3.0])
+
+    assert not results[0]["success"]
+    assert results[1]["success"]
+    assert results[1]["root"] == pytest.approx(2.0)
+
+
+def test_cluster_keeps_first_seed_of_each_root():
+    math_methods = MathMethods()
+
+    assert math_methods.cluster_roots([]) == []
+    assert math_methods.cluster_roots([2.0, -2.0, 2.000001, -1.999999]) == [0, 1]
+
+
+def test_cluster_compares_against_every_accepted_root():
+    math_methods = MathMethods()
+
+    # 0.009 y -0.007 están a menos de 0.01 de la raíz aceptada 0.0
+    assert math_methods.cluster_roots([0.0, -0.009, 0.009, -0.007, 0.007], 0.01) == [0]
+    # Una cadena de raíces a 0.009 entre sí no se junta en una sola
+    assert math_methods.cluster_roots([0.0, 0.009, 0.018, 0.027], 0.01) == [0, 2]
+
+
+def test_triple_root_reports_a_single_root():
+    # Newton se detiene a unos 0.005 de la raíz, de uno u otro lado
+    math_methods = solver_for("x^3")
+    seeds = [0.0, -0.5, 0.5, -1.0, 1.0]
+    results = math_methods.newton_batch(seeds, 1e-6, record_iterations=False)
+    roots = [result["root"] for result in results if result["success"]]
+
+    assert len(math_methods.cluster_roots(roots, 0.01)) == 1
@@ -0,0 +1,58 @@
+"""Métodos abiertos sin derivada: secante y Steffensen"""
+
+import pytest
+
+from logic.compiled_expression import CompiledExpression
+from logic.math_methods import MathMethods
+
+
+def solver_for(equation):
+    math_methods = MathMethods()
+    math_methods.set_equation(equation)
+    return math_methods
+
+
+@pytest.mark.parametrize("method", ["newton", "secante", "steffensen"])
+@pytest.mark.parametrize(
+    "equation, seed, expected",
+    [
+        ("x^3 - 2x - 5", 2.0, 2.0945514815423265),
+        ("x^x - 10", 2.5, 2.5061841455887692),
+        ("x^2 - 4", 5.0, 2.0),
+    ],
+)
+def test_converges_to_known_root(method, equation, seed, expected):
+    result = solver_for(equation).solve_open(method, [seed], 1e-10)[0]
+
+    assert result["success"]
+    assert result["root"] == pytest.approx(expected, abs=1e-8)
+
+
+def test_single_seed_methods_match_batch():
+    math_methods = solver_for("x^3 - 2x - 5")
+
+    assert math_methods.secant_method(2.0)["root"] == math_methods.secant_batch([2.0, 3.0])[0]["root"]
+    assert math_methods.steffensen_method(2.0)["root"] == math_methods.steffensen_batch([2.0, 3.0])[0]["root"]
+
+
+def test_steffensen_converges_from_far_seed():
+    # Lejos de la raíz f(x) es grande y el paso de Steffensen se limita
+    result = solver_for("x^3 - 2x - 5").steffensen_method(10.0, 1e-10)
+
+    assert result["success"]
+    assert result["root"] == pytest.approx(2.0945514815423265)
+
+
+def test_newton_falls_back_to_secant_without_practical_derivative(monkeypatch):
+    math_methods = solver_for("x^2 - 4")
+    assert math_methods.resolve_open_method("newton") == "newton"
+
+    monkeypatch.setattr(CompiledExpression, "derivative_is_practical", property(lambda self: False))
+    assert math_methods.resolve_open_method("newton") == "secante"
+    assert math_methods.resolve_open_method("steffensen") == "steffensen"
+
+
+def test_huge_expression_is_not_differentiated():
+    equation = "x" + "".join(f" + 1/(x + {k})" for k in range(1, 200))
+
+    assert not solver_for(equation)._compile().derivative_is_practical
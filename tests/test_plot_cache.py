@@ -0,0 +1,48 @@
+"""Caché de curvas graficadas en memoria y en disco"""
+
+import numpy as np
+
+from logic.plot_cache import PlotDataCache
+
+
+def curve(n):
+    x = np.linspace(0, 1, n)
+    return x, x ** 2, [0.0]
+
+
+def test_memory_limit_evicts_least_recently_used():
+    cache = PlotDataCache(max_bytes=10000)
+    cache.put("a", *curve(500))
+    cache.put("b", *curve(500))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+
+def test_spill_dir_is_created_on_first_spill(tmp_path):
+    created = []
+
+    def make_dir():
+        created.append(tmp_path / "spill")
+        return str(created[-1])
+
+    cache = PlotDataCache(max_bytes=10000, spill_dir=make_dir)
+    cache.put("a", *curve(500))
+    assert created == []
+
+    cache.put("b", *curve(500))
+    assert len(created) == 1 and created[0].is_dir()
+
+    x, y, roots = cache.get("a")
+    assert np.array_equal(y, curve(500)[1])
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_disk_limit_removes_oldest_files(tmp_path):
+    cache = PlotDataCache(max_bytes=10000, spill_dir=str(tmp_path), max_disk_bytes=10000)
+    for key in "abc":
+        cache.put(key, *curve(500))
+
+    assert cache.stats()["disk_size"] == 1
+    assert len(list(tmp_path.iterdir())) == 3
+    assert cache.get("a") is None
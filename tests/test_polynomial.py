@@ -0,0 +1,65 @@
+"""Ruta rápida de polinomios por valores propios de la matriz compañera"""
+
+import pytest
+
+from logic.math_methods import MathMethods
+
+
+def roots_of(equation, **kwargs):
+    math_methods = MathMethods()
+    math_methods.set_equation(equation)
+    return math_methods.solve_polynomial(**kwargs)
+
+
+def test_non_polynomial_returns_none():
+    assert roots_of("x + 1/x - 3") is None
+
+
+def test_constant_has_no_roots():
+    assert roots_of("5") == []
+
+
+def test_simple_roots_sorted_and_in_range():
+    results = roots_of("x^3 - 6x^2 + 11x - 6")
+
+    assert [result["root"] for result in results] == pytest.approx([1.0, 2.0, 3.0])
+    assert all(result["success"] for result in results)
+    assert [result["root"] for result in roots_of("x^3 - 6x^2 + 11x - 6", start=1.5, end=10)] == pytest.approx([2.0, 3.0])
+
+
+def test_complex_roots_are_dropped():
+    results = roots_of("x^3 + x")
+
+    assert len(results) == 1
+    assert results[0]["root"] == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize(
+    "equation, root, multiplicity",
+    [
+        ("(x-1)^2", 1.0, 2),
+        ("(x-2)^3*(x+1)", 2.0, 3),
+        ("(x-1000)^2", 1000.0, 2),
+        ("(x-0.001)^2", 0.001, 2),
+    ],
+)
+def test_multiple_root_without_sign_change(equation, root, multiplicity):
+    results = [result for result in roots_of(equation, start=-2000, end=2000) if result.get("multiplicity")]
+
+    assert len(results) == 1
+    assert results[0]["root"] == pytest.approx(root, rel=1e-9)
+    assert results[0]["multiplicity"] == multiplicity
+
+
+def test_close_distinct_roots_are_not_merged():
+    results = roots_of("(x-1)*(x-1.005)*(x-1.01)")
+
+    assert [result["root"] for result in results] == pytest.approx([1.0, 1.005, 1.01], abs=1e-9)
+    assert not any(result.get("multiplicity") for result in results)
+
+
+def test_unpolished_estimates():
+    results = roots_of("x^2 - 4", polish=False)
+
+    assert [result["root"] for result in results] == pytest.approx([-2.0, 2.0])
+    assert all(result["iterations"] == 0 for result in results)
@@ -0,0 +1,52 @@
+"""Elección de motor de voz y motor local de pruebas"""
+
+import pytest
+import speech_recognition as sr
+
+from logic.speech_backends import (
+    GoogleSpeechBackend,
+    SpeechEngine,
+    StaticSpeechBackend,
+    VoskSpeechBackend,
+)
+
+
+def test_static_backend_returns_texts_in_order():
+    backend = StaticSpeechBackend(["x al cuadrado", "seno de x"])
+
+    assert backend.transcribe(None) == "x al cuadrado"
+    assert backend.transcribe(None) == "seno de x"
+    # Al terminar la lista se repite el último texto
+    assert backend.transcribe(None) == "seno de x"
+
+
+def test_static_backend_without_texts_recognizes_nothing():
+    with pytest.raises(sr.UnknownValueError):
+        StaticSpeechBackend([]).transcribe(None)
+
+
+def test_local_backend_is_chosen_from_environment(monkeypatch):
+    monkeypatch.setenv("MATHROOTS_SPEECH_BACKEND", "local")
+    monkeypatch.setenv("MATHROOTS_SPEECH_TEXT", "x menos dos")
+    engine = SpeechEngine()
+
+    backend = engine.get_backend()
+    assert isinstance(backend, StaticSpeechBackend)
+    assert backend.transcribe(None) == "x menos dos"
+    assert engine.get_backend() is backend
+
+
+def test_falls_back_to_google_without_vosk_model(monkeypatch):
+    monkeypatch.delenv("MATHROOTS_SPEECH_BACKEND", raising=False)
+    monkeypatch.setattr(VoskSpeechBackend, "is_available", lambda self: False)
+
+    assert isinstance(SpeechEngine().get_backend(), GoogleSpeechBackend)
+
+
+def test_vosk_load_failure_is_retried(tmp_path):
+    backend = VoskSpeechBackend(str(tmp_path / "sin-modelo"))
+
+    assert not backend.is_available()
+    for _ in range(2):
+        with pytest.raises(sr.RequestError):
+            backend.load()
@@ -0,0 +1,44 @@
+"""Conversión de frases dictadas en español a ecuaciones"""
+
+import pytest
+
+from logic.spoken_math import CORPUS, SpokenMathError, benchmark, spoken_to_equation
+
+
+@pytest.mark.parametrize("phrase, expected", CORPUS)
+def test_corpus(phrase, expected):
+    assert spoken_to_equation(phrase) == expected
+
+
+@pytest.mark.parametrize(
+    "phrase, expected",
+    [
+        ("X AL CUADRADO MENOS CUATRO", "x^2 - 4"),
+        ("x   al  cuadrado,  menos cuatro.", "x^2 - 4"),
+        ("dos pi x", "2*pi*x"),
+    ],
+)
+def test_case_spacing_and_constants(phrase, expected):
+    assert spoken_to_equation(phrase) == expected
+
+
+@pytest.mark.parametrize(
+    "phrase",
+    ["x al cuadrado menos perro", "seno de", "abre paréntesis cierra paréntesis más x"],
+)
+def test_unrecognized_phrases_raise(phrase):
+    with pytest.raises(SpokenMathError):
+        spoken_to_equation(phrase)
+
+
+def test_error_is_a_value_error():
+    assert issubclass(SpokenMathError, ValueError)
+
+
+def test_benchmark_reports_mismatches():
+    corpus = CORPUS[:2] + [("x más uno", "x - 1"), ("x más gato", "x + 1")]
+    report = benchmark(corpus, repeat=2)
+
+    assert report["phrases"] == 4
+    assert [mismatch[0] for mismatch in report["mismatches"]] == ["x más uno", "x más gato"]
+    assert report["mismatches"][1][2].startswith("error:")
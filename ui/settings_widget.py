@@ -25,6 +25,7 @@ class SettingsWidget(QWidget):
             'interval_start': -100,
             'interval_end': 100,
             'interval_step': 0.1,
+            'polynomial_fast_path': True,
         }
         
         # Usar configuraciones actuales o las por defecto
@@ -70,9 +71,18 @@ class SettingsWidget(QWidget):
         
         self.method_combo = QComboBox()
         self.method_combo.addItem("Bisección", "biseccion")
+        self.method_combo.addItem("Brent", "brent")
+        self.method_combo.addItem("Regula Falsi (Illinois)", "illinois")
+        self.method_combo.addItem("Ridders", "ridders")
         self.method_combo.addItem("Newton-Raphson", "newton")
+        self.method_combo.addItem("Secante", "secante")
+        self.method_combo.addItem("Steffensen", "steffensen")
         method_layout.addRow("Método:", self.method_combo)
         
+        self.polynomial_check = QCheckBox("Resolver polinomios con la matriz compañera")
+        self.polynomial_check.setChecked(True)
+        method_layout.addRow(self.polynomial_check)
+        
         method_group.setLayout(method_layout)
         content_layout.addWidget(method_group)
         
@@ -200,6 +210,8 @@ class SettingsWidget(QWidget):
         if index >= 0:
             self.method_combo.setCurrentIndex(index)
         
+        self.polynomial_check.setChecked(self.settings.get('polynomial_fast_path', True))
+        
         self.tolerance_input.setText(str(self.settings['tolerance']))
         self.max_iter_input.setText(str(self.settings['max_iterations']))
         
@@ -239,6 +251,7 @@ class SettingsWidget(QWidget):
                 'interval_start': interval_start_val,
                 'interval_end': interval_end_val,
                 'interval_step': interval_step_val,
+                'polynomial_fast_path': self.polynomial_check.isChecked(),
             }
             
             self.settings_saved.emit(self.settings)